@@ -0,0 +1,85 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+from API.client import StickersClient
+
+DEFAULT_CONCURRENCY = 20
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+
+class AsyncStickersClient:
+    # asyncio front end for StickersClient. Each lookup runs on a small thread
+    # pool over the client's pooled keep-alive session (and its retry and
+    # response-cache settings), so many lookups overlap instead of running one
+    # after another. At most `concurrency` requests are in flight; each is
+    # given `request_timeout` seconds.
+    def __init__(self,
+                 base_url: str = None,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 client: StickersClient = None,
+                 **client_options):
+        self.concurrency = max(1, concurrency)
+        self.request_timeout = request_timeout
+        self._owns_client = client is None
+        self.client = client or StickersClient(base_url, pool_size=self.concurrency, **client_options)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="stickers")
+        self._slots = None
+        self._slots_loop = None
+
+    async def _call(self, func, *args):
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._slots_loop = loop
+        slots = self._slots
+        await slots.acquire()
+        try:
+            future = loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        # A timed-out request keeps its slot until its thread returns, so the
+        # limit also holds for requests the caller has given up on.
+        future.add_done_callback(lambda _: slots.release())
+        return await asyncio.wait_for(asyncio.shield(future), self.request_timeout)
+
+    async def get_all_stickers(self) -> List[Dict]:
+        return await self._call(self.client.get_all_stickers)
+
+    async def get_stickers_by_name(self, item_name: str) -> List[Dict]:
+        return await self._call(self.client.get_stickers_by_name, item_name)
+
+    async def get_names_stickers_by_model(self, model: str) -> List[Dict]:
+        return await self._call(self.client.get_names_stickers_by_model, model)
+
+    async def _gather(self, func, keys: Iterable[str], return_exceptions: bool) -> List:
+        # Results are in input order; a key repeated in the batch is fetched once.
+        keys = list(keys)
+        tasks = {key: asyncio.ensure_future(func(key)) for key in dict.fromkeys(keys)}
+        try:
+            await asyncio.gather(*tasks.values(), return_exceptions=return_exceptions)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return [tasks[key].exception() or tasks[key].result() for key in keys]
+
+    async def get_stickers_by_names(self, item_names: Iterable[str],
+                                    return_exceptions: bool = False) -> List:
+        return await self._gather(self.get_stickers_by_name, item_names, return_exceptions)
+
+    async def get_names_stickers_by_models(self, models: Iterable[str],
+                                           return_exceptions: bool = False) -> List:
+        return await self._gather(self.get_names_stickers_by_model, models, return_exceptions)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
@@ -1,22 +1,194 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from API.json_stream import iter_json_array
+from API.response_cache import ResponseCache, decode_body
 
 # factive_url:
 api_url = "https://api.example.com"
 
+DEFAULT_TIMEOUT = (3.05, 30)
+RETRY_STATUSES = (500, 502, 503, 504)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class StickersClient:
+    # One pooled, keep-alive session per client. GET requests are retried with
+    # exponential backoff on connection errors and 5xx responses.
+    def __init__(self,
+                 base_url: str = None,
+                 timeout=DEFAULT_TIMEOUT,
+                 retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 pool_size: int = 10,
+                 cache: ResponseCache = None,
+                 offline: bool = False,
+                 serve_stale: bool = True):
+        self.base_url = (base_url or api_url).rstrip("/")
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self.serve_stale = serve_stale
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+
+    def _get(self, path: str, **kwargs) -> requests.Response:
+        response = self.session.get(f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def _request(self, path: str, stream: bool = False):
+        # Returns (response, None) when the body has to be read from the
+        # network, or (None, entry) when the cached entry should be served.
+        if self.cache is None:
+            return self._get(path, stream=stream), None
+
+        url = f"{self.base_url}{path}"
+        entry = self.cache.get(ResponseCache.make_key(url))
+
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.count("hits")
+            return None, entry
+
+        if self.offline:
+            if entry is None:
+                raise requests.ConnectionError(f"Offline and no cached response for {url}")
+            self.cache.count("stale_served")
+            return None, entry
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=stream)
+        except requests.RequestException:
+            if entry is not None and self.serve_stale:
+                self.cache.count("stale_served")
+                return None, entry
+            raise
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.cache.refresh(entry.key)
+            self.cache.count("revalidated")
+            return None, entry
+
+        if response.status_code >= 500 and entry is not None and self.serve_stale:
+            response.close()
+            self.cache.count("stale_served")
+            return None, entry
+
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        return response, None
+
+    def _store(self, path: str, response: requests.Response, body: bytes) -> None:
+        self.cache.put(ResponseCache.make_key(f"{self.base_url}{path}"), body,
+                       etag=response.headers.get("ETag"),
+                       last_modified=response.headers.get("Last-Modified"))
+        self.cache.count("misses")
+
+    def _get_json(self, path: str):
+        response, entry = self._request(path)
+        if entry is not None:
+            return decode_body(entry)
+
+        data = response.json()
+        if self.cache is not None:
+            self._store(path, response, response.content)
+        return data
+
+    def _iter_json_array(self, path: str, chunk_size: int = STREAM_CHUNK_SIZE):
+        response, entry = self._request(path, stream=True)
+        if entry is not None:
+            yield from decode_body(entry)
+            return
+
+        body = [] if self.cache is not None else None
+
+        def chunks():
+            for chunk in response.iter_content(chunk_size):
+                if body is not None:
+                    body.append(chunk)
+                yield chunk
+
+        with response:
+            yield from iter_json_array(chunks(), response.encoding or "utf-8")
+        if body is not None:
+            self._store(path, response, b"".join(body))
+
+    def cache_stats(self):
+        return self.cache.stats() if self.cache is not None else None
+
+    def get_all_stickers(self):
+        return self._get_json("/stickers")
+
+    def iter_all_stickers(self, chunk_size: int = STREAM_CHUNK_SIZE):
+        # Same records as get_all_stickers, yielded while the body is still
+        # downloading, e.g. save_orders_to_excel(client.iter_all_stickers()).
+        return self._iter_json_array("/stickers", chunk_size)
+
+    def get_stickers_by_name(self, item_name):
+        return self._get_json(f"/stickers/{item_name}")
+
+    def get_names_stickers_by_model(self, model):
+        return self._get_json(f"/stickers/names/{model}")
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_client = None
+
+
+def get_client() -> StickersClient:
+    global _default_client
+    if _default_client is None or _default_client.base_url != api_url.rstrip("/"):
+        _default_client = StickersClient()
+    return _default_client
+
 
 def get_all_stickers():
-    response = requests.get(f"{api_url}/stickers")
-    response.raise_for_status()
-    return response.json()
+    return get_client().get_all_stickers()
+
+
+def iter_all_stickers():
+    return get_client().iter_all_stickers()
 
 
 def get_stickers_by_name(item_name):
-    response = requests.get(f"{api_url}/stickers/{item_name}")
-    response.raise_for_status()
-    return response.json()
+    return get_client().get_stickers_by_name(item_name)
 
 
 def get_names_stickers_by_model(model):
-    response = requests.get(f"{api_url}/stickers/names/{model}")
-    response.raise_for_status()
-    return response.json()
+    return get_client().get_names_stickers_by_model(model)
@@ -0,0 +1,78 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_END = re.compile(r"[ \t\n\r,\]]")
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    # Yields the elements of a top-level JSON array as soon as each one has
+    # been received. Only the element being parsed (plus one network chunk)
+    # is held in memory, never the whole body.
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    done = False
+
+    def more() -> bool:
+        nonlocal buffer, pos, done
+        if done:
+            return False
+        for chunk in chunks:
+            piece = text.decode(chunk)
+            if piece:
+                buffer = buffer[pos:] + piece
+                pos = 0
+                return True
+        done = True
+        piece = text.decode(b"", final=True)
+        if piece:
+            buffer = buffer[pos:] + piece
+            pos = 0
+        return bool(piece)
+
+    def peek():
+        nonlocal pos
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                return buffer[pos]
+            if not more():
+                return None
+
+    if peek() != "[":
+        raise ValueError("Invalid JSON format – expected an array.")
+    pos += 1
+    if peek() == "]":
+        return
+
+    while True:
+        if peek() is None:
+            raise ValueError("Invalid JSON format – unexpected end of array.")
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if more():
+                    continue
+                raise
+            # A number is complete only once a delimiter follows it: "-0.5e"
+            # decodes as -0.5 while its exponent is still in the next chunk.
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and not NUMBER_END.match(buffer, end) and more()):
+                continue
+            break
+        pos = end
+        yield value
+
+        separator = peek()
+        if separator == ",":
+            pos += 1
+        elif separator == "]":
+            return
+        else:
+            raise ValueError("Invalid JSON format – expected ',' or ']' after an array element.")
@@ -1,14 +1,14 @@
-import json
+from API.sticker_repository import StickerRepository
+
+repository = StickerRepository("stickers_data.json")
 
 
 def load_data():
-    with open("stickers_data.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return repository.records()
 
 
 def get_all_stickers():
-    data = load_data()
-    return [item for item in data if item.get("productType") == "sticker"]
+    return repository.get_all_stickers()
 
 
 print("get_all_stickers")
@@ -16,8 +16,7 @@ print(get_all_stickers())
 
 
 def get_stickers_by_name(item_name):
-    data = load_data()
-    return [item for item in data if item.get("productType") == "sticker" and item_name in item.get("itemName", "")]
+    return repository.get_stickers_by_name(item_name)
 
 
 print("get_stickers_by_name: מדבקות שם")
@@ -25,18 +24,16 @@ print(get_stickers_by_name("מדבקות שם"))
 
 
 def get_names_stickers_by_model(model):
-    data = load_data()
-    return [
-        {
-            "dbId": item["dbId"],
-            "itemName": item["itemName"],
-            "graphicStatus": item["graphicStatus"],
-            "orderStatus": item["orderStatus"]
-        }
-        for item in data
-        if item.get("productType") == "sticker" and item.get("model") == model
-    ]
+    return repository.get_names_stickers_by_model(model)
 
 
 print("get_names_stickers_by_model:90x52")
 print(get_names_stickers_by_model("90x52"))
+
+
+def query_stickers(**filters):
+    return repository.query(**filters)
+
+
+print("query_stickers: sticker, Ready, Approved")
+print(query_stickers(product_type="sticker", order_status="Ready", graphic_status="Approved"))
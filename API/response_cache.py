@@ -0,0 +1,118 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+CachedResponse = namedtuple("CachedResponse", ["key", "body", "etag", "last_modified", "stored_at"])
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class ResponseCache:
+    # SQLite-backed store of raw response bodies keyed by URL and params.
+    # Entries younger than `ttl` are served without a request; older ones are
+    # revalidated with their ETag/Last-Modified. Least recently used entries
+    # are evicted once the stored bodies exceed `max_bytes`.
+    def __init__(self, path: str = "api_cache.sqlite3", ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " body BLOB NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+        self.counters = {"hits": 0, "misses": 0, "revalidated": 0, "stale_served": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return CachedResponse(*row)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def put(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, stored_at, accessed_at, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(body), etag, last_modified, now, now, len(body))
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, key: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.counters["evictions"] += 1
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            stats = dict(self.counters)
+        served = stats["hits"] + stats["revalidated"] + stats["stale_served"]
+        lookups = served + stats["misses"]
+        stats.update({
+            "entries": entries,
+            "bytes": size,
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+        })
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def decode_body(entry: CachedResponse):
+    return json.loads(entry.body)
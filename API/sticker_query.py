@@ -0,0 +1,113 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+DATE_FIELD = "orderDate"
+
+# Query keyword -> record field with a hash index.
+INDEXED_FIELDS = {
+    "order_status": "orderStatus",
+    "graphic_status": "graphicStatus",
+    "model": "model",
+    "product_type": "productType",
+}
+
+
+def parse_date(value) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _values(value) -> Iterable:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value
+    return (value,)
+
+
+class StickerQuery:
+    # Hash indexes on the CreateExcelPage filter fields plus a sorted index on
+    # the order date. A query starts from its most selective filter and checks
+    # the remaining ones per candidate, so its cost follows the size of the
+    # smallest matching posting list rather than the number of records.
+    def __init__(self, records: List[Dict], date_field: str = DATE_FIELD):
+        self.records = records
+        self.date_field = date_field
+        self._postings: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in INDEXED_FIELDS.values()}
+        self._date_of: List[Optional[date]] = []
+
+        dated = []
+        for position, item in enumerate(records):
+            for field, postings in self._postings.items():
+                postings.setdefault(item.get(field), set()).add(position)
+            item_date = parse_date(item.get(date_field))
+            self._date_of.append(item_date)
+            if item_date is not None:
+                dated.append((item_date, position))
+
+        dated.sort()
+        self._dates = [item_date for item_date, _ in dated]
+        self._date_positions = [position for _, position in dated]
+
+    def _posting(self, field: str, value) -> Set[int]:
+        postings = self._postings[field]
+        values = _values(value)
+        if len(values) == 1:
+            return postings.get(next(iter(values)), set())
+        return set().union(*(postings.get(v, set()) for v in values))
+
+    def positions(self, date_from=None, date_to=None, **filters) -> List[int]:
+        # Keyword filters are the keys of INDEXED_FIELDS and take one value or
+        # a list of accepted values; date_from/date_to are inclusive.
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown filter(s): {', '.join(sorted(unknown))}")
+
+        sets = [self._posting(INDEXED_FIELDS[name], value)
+                for name, value in filters.items() if value is not None]
+
+        low = parse_date(date_from) if date_from is not None else None
+        high = parse_date(date_to) if date_to is not None else None
+        if (date_from is not None and low is None) or (date_to is not None and high is None):
+            raise ValueError("Invalid date filter – expected YYYY-MM-DD.")
+        by_date = low is not None or high is not None
+        start = bisect_left(self._dates, low) if low is not None else 0
+        stop = bisect_right(self._dates, high) if high is not None else len(self._dates)
+
+        sets.sort(key=len)
+        if by_date and (not sets or stop - start < len(sets[0])):
+            candidates = self._date_positions[start:max(start, stop)]
+            by_date = False
+        elif sets:
+            candidates = sets.pop(0)
+        else:
+            return list(range(len(self.records)))
+
+        matches = []
+        for position in candidates:
+            if by_date:
+                item_date = self._date_of[position]
+                if item_date is None or (low is not None and item_date < low) \
+                        or (high is not None and item_date > high):
+                    continue
+            if all(position in other for other in sets):
+                matches.append(position)
+        matches.sort()
+        return matches
+
+    def query(self, date_from=None, date_to=None, **filters) -> List[Dict]:
+        return [self.records[p] for p in self.positions(date_from, date_to, **filters)]
+
+    def count(self, date_from=None, date_to=None, **filters) -> int:
+        return len(self.positions(date_from, date_to, **filters))
+
+    def values(self, name: str) -> List:
+        # Distinct values of an indexed field, e.g. to fill a filter combo box.
+        return sorted((v for v in self._postings[INDEXED_FIELDS[name]] if v is not None), key=str)
@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+from typing import Dict, Iterator, List, Set
+
+from API.sticker_query import StickerQuery
+
+NGRAM = 3
+
+
+def name_ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def sticker_summary(item: Dict) -> Dict:
+    return {
+        "dbId": item["dbId"],
+        "itemName": item["itemName"],
+        "graphicStatus": item["graphicStatus"],
+        "orderStatus": item["orderStatus"]
+    }
+
+
+class StickerRepository:
+    # Loads the sticker file once and keeps a StickerQuery (hash indexes on
+    # the filter fields, sorted date index) plus a trigram index on itemName.
+    # The file is re-read only when its mtime changes.
+    def __init__(self, path: str = "stickers_data.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._records: List[Dict] = []
+        self._query = StickerQuery([])
+        self._name_index: Dict[str, Set[int]] = {}
+
+    def _ensure_loaded(self) -> None:
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        if mtime_ns == self._mtime_ns:
+            return
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                self._load()
+                self._mtime_ns = mtime_ns
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+
+        name_index = {}
+        for position, item in enumerate(records):
+            item_name = item.get("itemName")
+            if isinstance(item_name, str):
+                for gram in name_ngrams(item_name):
+                    name_index.setdefault(gram, set()).add(position)
+
+        self._records = records
+        self._query = StickerQuery(records)
+        self._name_index = name_index
+
+    def records(self) -> List[Dict]:
+        self._ensure_loaded()
+        return self._records
+
+    def _positions_by_name(self, item_name: str) -> List[int]:
+        grams = name_ngrams(item_name)
+        if not grams:
+            candidates = range(len(self._records))
+        else:
+            postings = sorted((self._name_index.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*postings) if postings[0] else set()
+        return sorted(
+            position for position in candidates
+            if item_name in (self._records[position].get("itemName") or "")
+        )
+
+    def get_all_stickers(self) -> List[Dict]:
+        self._ensure_loaded()
+        return self._query.query(product_type="sticker")
+
+    def iter_all_stickers(self) -> Iterator[Dict]:
+        return iter(self.get_all_stickers())
+
+    def get_stickers_by_name(self, item_name: str) -> List[Dict]:
+        self._ensure_loaded()
+        return [
+            self._records[p] for p in self._positions_by_name(item_name)
+            if self._records[p].get("productType") == "sticker"
+        ]
+
+    def get_names_stickers_by_model(self, model: str) -> List[Dict]:
+        self._ensure_loaded()
+        return [
+            sticker_summary(item) for item in self._query.query(product_type="sticker", model=model)
+        ]
+
+    def query(self, date_from=None, date_to=None, **filters) -> List[Dict]:
+        # e.g. query(product_type="sticker", order_status="Ready",
+        #            graphic_status=["Approved", "In Process"], date_from="2025-01-01")
+        self._ensure_loaded()
+        return self._query.query(date_from, date_to, **filters)
+
+    def filter_values(self, name: str) -> List:
+        self._ensure_loaded()
+        return self._query.values(name)
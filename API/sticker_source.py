@@ -0,0 +1,24 @@
+from typing import Iterator, List, Dict, Optional, Protocol
+
+
+class StickerSource(Protocol):
+    def get_all_stickers(self) -> List[Dict]:
+        ...
+
+    def iter_all_stickers(self) -> Iterator[Dict]:
+        ...
+
+    def get_stickers_by_name(self, item_name: str) -> List[Dict]:
+        ...
+
+    def get_names_stickers_by_model(self, model: str) -> List[Dict]:
+        ...
+
+
+def create_sticker_source(local_path: Optional[str] = None) -> StickerSource:
+    if local_path:
+        from API.sticker_repository import StickerRepository
+        return StickerRepository(local_path)
+
+    from API.client import get_client
+    return get_client()
@@ -0,0 +1,152 @@
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QEvent, QObject, QSize, Qt, QTimer
+from PyQt6.QtGui import QImageReader, QPixmap
+from PyQt6.QtWidgets import QLabel, QWidget
+
+DEFAULT_FRAME_DELAY = 100
+
+
+class FrameSequence:
+    # Frames of one GIF at one size, decoded on first use and then kept, so
+    # every label showing the same asset shares a single decode.
+    def __init__(self, path: str, size: Optional[QSize] = None):
+        self.path = path
+        self.size = size
+        self._reader = QImageReader(path)
+        self._frames: List[Tuple[QPixmap, int]] = []
+        self.complete = False
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _decode_next(self) -> bool:
+        image = self._reader.read()
+        if image.isNull():
+            self.complete = True
+            self._reader = None
+            return False
+        if self.size is not None and self.size.isValid() and image.size() != self.size:
+            image = image.scaled(self.size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        delay = self._reader.nextImageDelay()
+        self._frames.append((QPixmap.fromImage(image), delay if delay > 0 else DEFAULT_FRAME_DELAY))
+        if 0 < self._reader.imageCount() <= len(self._frames):
+            self.complete = True
+            self._reader = None
+        return True
+
+    def frame(self, index: int) -> Optional[Tuple[QPixmap, int, int]]:
+        # Returns (pixmap, delay in ms, index of the following frame).
+        while index >= len(self._frames) and not self.complete:
+            self._decode_next()
+        if not self._frames:
+            return None
+        index %= len(self._frames)
+        pixmap, delay = self._frames[index]
+        following = index + 1
+        if self.complete and following >= len(self._frames):
+            following = 0
+        return pixmap, delay, following
+
+
+_sequences: Dict[Tuple[str, int, int], FrameSequence] = {}
+
+
+def frame_sequence(path: str, size: Optional[QSize] = None) -> FrameSequence:
+    key = (path, size.width(), size.height()) if size is not None else (path, -1, -1)
+    sequence = _sequences.get(key)
+    if sequence is None:
+        sequence = _sequences[key] = FrameSequence(path, size)
+    return sequence
+
+
+def clear_frame_cache() -> None:
+    _sequences.clear()
+
+
+class AnimationPlayer(QObject):
+    # Drop-in for a started QMovie on a QLabel: advances through a shared
+    # FrameSequence with a single-shot timer that only runs while playing.
+    def __init__(self, label: QLabel, frames: FrameSequence):
+        super().__init__(label)
+        self.label = label
+        self.frames = frames
+        self.index = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._advance)
+        self._show_frame(0)
+
+    @property
+    def running(self) -> bool:
+        return self._timer.isActive()
+
+    def _show_frame(self, index: int) -> Optional[int]:
+        frame = self.frames.frame(index)
+        if frame is None:
+            return None
+        pixmap, delay, following = frame
+        self.label.setPixmap(pixmap)
+        self.index = following
+        return delay
+
+    def _advance(self) -> None:
+        delay = self._show_frame(self.index)
+        if delay is not None and (len(self.frames) > 1 or not self.frames.complete):
+            self._timer.start(delay)
+
+    def start(self) -> None:
+        if not self.running:
+            self._advance()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+
+class PageAnimations(QObject):
+    # Lives as a child of its page and filters the page's Show/Hide events. A
+    # QStackedWidget hides every page but the current one, so this is enough
+    # to pause animations on hidden pages and resume them when shown again.
+    def __init__(self, page: QWidget):
+        super().__init__(page)
+        self.players: List[AnimationPlayer] = []
+        page.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Type.Show:
+            for player in self.players:
+                player.start()
+        elif event.type() == QEvent.Type.Hide:
+            for player in self.players:
+                player.stop()
+        return False
+
+
+class AnimationManager(QObject):
+    def play(self, label: QLabel, path: str, size: Optional[QSize] = None,
+             page: Optional[QWidget] = None) -> AnimationPlayer:
+        page = page or label.window()
+        animations = page.findChild(PageAnimations, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        if animations is None:
+            animations = PageAnimations(page)
+
+        player = AnimationPlayer(label, frame_sequence(path, size))
+        animations.players.append(player)
+        if page.isVisible():
+            player.start()
+        return player
+
+    def players(self, page: QWidget) -> List[AnimationPlayer]:
+        animations = page.findChild(PageAnimations, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        return list(animations.players) if animations is not None else []
+
+
+_manager: Optional[AnimationManager] = None
+
+
+def animation_manager() -> AnimationManager:
+    global _manager
+    if _manager is None:
+        _manager = AnimationManager()
+    return _manager
@@ -1,18 +1,23 @@
-from csv import excel
 
-from PyQt6.QtGui import QIcon, QMovie
+from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QMessageBox, QFileDialog, QCheckBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QHBoxLayout, QLabel
+    QWidget, QVBoxLayout, QPushButton, QMessageBox, QFileDialog, QCheckBox, QTableView,
+    QHeaderView, QHBoxLayout, QLabel, QProgressBar
 )
 from PyQt6.QtCore import Qt, QSize, pyqtSignal
-from excel.excel_data import excel_to_dict
-from excel.excel_to_json import excel_to_filtered_json, convert_excel_to_json
+from excel.metrics import format_summary
 from helper.paths import resource_path
+from Desktop.animations import animation_manager
+from Desktop.excel_table_model import ExcelTableModel
+from Desktop.workers import ExcelJob, JobRunner
 class ConvertExcelPage(QWidget):
     def __init__(self):
         super().__init__()
         self.excel_path = None
+        self.last_metrics = None
+        self.jobs = JobRunner(self)
+        self.jobs.started.connect(lambda: self.set_busy(True))
+        self.jobs.stopped.connect(lambda: self.set_busy(False))
         self.init_ui()
 
     def init_ui(self):
@@ -24,22 +29,18 @@ class ConvertExcelPage(QWidget):
         self.title_label.setStyleSheet("font-size: 25px; font-weight: bold; color: #008080;")
 
         self.gif_label = QLabel()
-        self.movie = QMovie(resource_path("assets/gif/left-arrow.gif"))
-        self.gif_label.setMovie(self.movie)
         self.gif_label.setFixedSize(50, 50)
-        self.movie.setScaledSize(QSize(50, 50))
         self.gif_label.setToolTip("חזרה לעמוד הקודם")
         self.gif_label.mousePressEvent = self.go_back
-        self.movie.start()
+        self.movie = animation_manager().play(
+            self.gif_label, resource_path("assets/gif/left-arrow.gif"), QSize(50, 50), page=self)
 
         self.gif_folder=QLabel()
-        self.movie_folder = QMovie(resource_path("assets/gif/folder.gif"))
-        self.gif_folder.setMovie(self.movie_folder)
         self.gif_folder.setFixedSize(50, 50)
-        self.movie_folder.setScaledSize(QSize(50, 50))
         self.gif_folder.setToolTip("בחר קובץ אקסל")
         self.gif_folder.mousePressEvent = self.load_excel
-        self.movie_folder.start()
+        self.movie_folder = animation_manager().play(
+            self.gif_folder, resource_path("assets/gif/folder.gif"), QSize(50, 50), page=self)
 
         top_buttons_layout.addWidget(self.gif_label)
         top_buttons_layout.addStretch()
@@ -51,7 +52,7 @@ class ConvertExcelPage(QWidget):
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.empty_label.setStyleSheet("color: gray; font-size: 20px;")
 
-        self.table = QTableWidget()
+        self.table = QTableView()
 
         self.convert_to_filter_btn = QPushButton(" Convert Excel file to Filter Json")
         self.convert_to_filter_btn.setIcon(QIcon("../assets/icons/document.png"))
@@ -64,24 +65,72 @@ class ConvertExcelPage(QWidget):
         layout.addLayout(top_buttons_layout)
         layout.addWidget(self.empty_label)
         layout.addWidget(self.table)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("%v / %m")
+        self.progress_bar.hide()
+
+        self.cancel_btn = QPushButton("ביטול")
+        self.cancel_btn.clicked.connect(self.jobs.cancel)
+        self.cancel_btn.hide()
+
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_btn)
+
         layout.addWidget(self.convert_to_filter_btn)
         layout.addWidget(self.convert_to_josn_btn)
+        layout.addLayout(progress_layout)
         self.table.hide()  # טבלה מוסתרת עד שיהיה מידע
 
         self.setLayout(layout)
 
     go_back_requested = pyqtSignal()
+
+    def set_busy(self, busy: bool):
+        self.convert_to_filter_btn.setEnabled(not busy)
+        self.convert_to_josn_btn.setEnabled(not busy)
+        self.gif_folder.setEnabled(not busy)
+        self.cancel_btn.setVisible(busy)
+        self.progress_bar.setVisible(busy)
+        if busy:
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.setValue(0)
+
+    def update_progress(self, done: int, total: int):
+        if total:
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(min(done, total))
+
+    def run_job(self, func, on_finished):
+        job = ExcelJob(func, self.excel_path)
+        self.last_metrics = None
+        self.jobs.start(
+            job,
+            on_finished=on_finished,
+            on_failed=lambda error: QMessageBox.critical(self, "שגיאה", f"שגיאה בהמרה:\n{error}"),
+            on_cancelled=lambda: QMessageBox.information(self, "בוטל", "הפעולה בוטלה"),
+            on_progress=self.update_progress,
+            on_metrics=self.on_metrics,
+        )
+
+    def on_metrics(self, record):
+        self.last_metrics = record
+
     def load_excel(self, event):
+        if self.jobs.busy:
+            return
         self.excel_path, _ = QFileDialog.getOpenFileName(self, "Select Excel File", filter="Excel Files (*.xlsx *.xls)")
         if self.excel_path:
-            try:
-                data = excel_to_dict(self.excel_path)
-                self.populate_table(data)
-            except Exception as e:
-                QMessageBox.critical(self, "שגיאה", f"שגיאה בטעינת הקובץ:\n{e}")
-
-    def populate_table(self, data: list[dict]):
-        if not data:
+            from excel.excel_data import excel_to_rows
+            self.run_job(excel_to_rows, self.on_excel_loaded)
+
+    def on_excel_loaded(self, result):
+        headers, rows = result
+        self.populate_table(headers, rows)
+
+    def populate_table(self, headers: list, rows: list[tuple]):
+        if not rows:
+            self.table.setModel(None)
             self.table.hide()
             self.empty_label.show()
             return
@@ -89,55 +138,43 @@ class ConvertExcelPage(QWidget):
         self.empty_label.hide()
         self.table.show()
 
-        headers = list(data[0].keys())
-        self.table.clear()
-        self.table.setColumnCount(len(headers))
-        self.table.setRowCount(len(data))
-        self.table.setHorizontalHeaderLabels(headers)
-
-        for row_idx, row in enumerate(data):
-            for col_idx, key in enumerate(headers):
-                item = QTableWidgetItem(str(row[key]))
-                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(row_idx, col_idx, item)
+        model = ExcelTableModel(headers, rows, self.table)
+        self.table.setModel(model)
 
         header = self.table.horizontalHeader()
-        for col in range(len(headers)):
-            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for col, width in enumerate(model.sample_column_widths(self.table.fontMetrics())):
+            header.resizeSection(col, width)
 
     def convert_to_filtered_json(self):
         if not self.excel_path:
             QMessageBox.warning(self, "שגיאה", "לא נבחר קובץ אקסל")
             return
-        try:
-            data = excel_to_filtered_json(self.excel_path)
-            if data:
-                QMessageBox.information(self, "הצלחה", "✅ הקובץ הומר ונשמר בהצלחה")
-            else:
-                QMessageBox.warning(self, "שגיאה", "❌ ההמרה נכשלה – לא נוצרו נתונים")
-        except Exception as e:
-            QMessageBox.critical(self, "שגיאה", f"שגיאה בהמרה:\n{e}")
-
+        from excel.excel_to_json import excel_to_filtered_json
+        self.run_job(excel_to_filtered_json, self.on_conversion_finished)
 
     def convert_to_json(self):
         if not self.excel_path:
             QMessageBox.warning(self, "שגיאה", "לא נבחר קובץ אקסל")
             return
-        try:
-            data = convert_excel_to_json(self.excel_path)
-            if data:
-                QMessageBox.information(self, "הצלחה", "✅ הקובץ הומר ונשמר בהצלחה")
-            else:
-                QMessageBox.warning(self, "שגיאה", "❌ ההמרה נכשלה – לא נוצרו נתונים")
-        except Exception as e:
-            QMessageBox.critical(self, "שגיאה", f"שגיאה בהמרה:\n{e}")
+        from excel.excel_to_json import convert_excel_to_json
+        self.run_job(convert_excel_to_json, self.on_conversion_finished)
+
+    def on_conversion_finished(self, data):
+        if data:
+            message = "✅ הקובץ הומר ונשמר בהצלחה"
+            summary = format_summary(self.last_metrics)
+            if summary:
+                message += f"\n\n{summary}"
+            QMessageBox.information(self, "הצלחה", message)
+        else:
+            QMessageBox.warning(self, "שגיאה", "❌ ההמרה נכשלה – לא נוצרו נתונים")
 
 
     def go_back(self, event):
+        self.jobs.abandon()
         self.excel_path = None
-        self.table.clearContents()
-        self.table.setRowCount(0)
-        self.table.setColumnCount(0)
+        self.table.setModel(None)
         self.table.hide()
         self.empty_label.show()
         self.go_back_requested.emit()
@@ -1,9 +1,10 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QFileDialog, QDateEdit, QMessageBox
 )
-from PyQt6.QtGui import QIcon, QMovie
+from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt, QDate, QSize, pyqtSignal
 from helper.paths import resource_path
+from Desktop.animations import animation_manager
 
 
 class CreateExcelPage(QWidget):
@@ -15,13 +16,11 @@ class CreateExcelPage(QWidget):
         layout = QVBoxLayout()
 
         self.gif_label = QLabel()
-        self.movie = QMovie(resource_path("assets/gif/left-arrow.gif"))
-        self.gif_label.setMovie(self.movie)
         self.gif_label.setFixedSize(50, 50)
-        self.movie.setScaledSize(QSize(50, 50))
         self.gif_label.setToolTip("חזרה לעמוד הקודם")
         self.gif_label.mousePressEvent = self.go_back
-        self.movie.start()
+        self.movie = animation_manager().play(
+            self.gif_label, resource_path("assets/gif/left-arrow.gif"), QSize(50, 50), page=self)
 
         self.product_select = QComboBox()
         self.product_select.addItems(["Product A", "Product B", "Product C"])
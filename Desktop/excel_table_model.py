@@ -0,0 +1,81 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFontMetrics
+
+
+class ExcelTableModel(QAbstractTableModel):
+    # Rows are kept as the tuples read from the sheet; only edited cells are
+    # stored separately. The view pulls rows in batches through fetchMore.
+    FETCH_BATCH = 500
+    SAMPLE_ROWS = 200
+    MAX_COLUMN_WIDTH = 400
+    COLUMN_PADDING = 24
+
+    def __init__(self, headers: list, rows: list[tuple], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = rows
+        self._edits = {}
+        self._loaded = min(len(rows), self.FETCH_BATCH)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def value(self, row: int, column: int):
+        if (row, column) in self._edits:
+            return self._edits[(row, column)]
+        return self._rows[row][column]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return str(self.value(index.row(), index.column()))
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._edits[(index.row(), index.column())] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._headers[section])
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remaining = len(self._rows) - self._loaded
+        count = min(remaining, self.FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def total_rows(self) -> int:
+        return len(self._rows)
+
+    def sample_column_widths(self, font_metrics: QFontMetrics) -> list[int]:
+        sample = self._rows[:self.SAMPLE_ROWS]
+        widths = []
+        for column, header in enumerate(self._headers):
+            texts = [str(header)] + [str(row[column]) for row in sample]
+            width = max(font_metrics.horizontalAdvance(text) for text in texts) + self.COLUMN_PADDING
+            widths.append(min(width, self.MAX_COLUMN_WIDTH))
+        return widths
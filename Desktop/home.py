@@ -1,7 +1,8 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpacerItem, QSizePolicy
-from PyQt6.QtGui import QMovie, QCursor, QFont
+from PyQt6.QtGui import QCursor, QFont
 from PyQt6.QtCore import Qt, QSize
 from helper.paths import resource_path
+from Desktop.animations import animation_manager
 
 
 class HomePage(QWidget):
@@ -35,10 +36,7 @@ class HomePage(QWidget):
         # תוכן פנימי – gif + טקסט
         gif_label = QLabel()
         gif_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        movie = QMovie(gif_path)
-        movie.setScaledSize(QSize(64, 64))
-        gif_label.setMovie(movie)
-        movie.start()
+        animation_manager().play(gif_label, gif_path, QSize(64, 64), page=self)
 
         text_label = QLabel(text)
         text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
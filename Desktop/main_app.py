@@ -3,33 +3,61 @@ import sys
 from PyQt6.QtWidgets import QApplication, QStackedWidget
 from PyQt6.QtGui import QFont, QIcon
 from Desktop.login import LoginPage
-from Desktop.home import HomePage
-from Desktop.create_excel import CreateExcelPage
-from Desktop.convert_excel import ConvertExcelPage
 from helper.paths import resource_path
-
+from excel.metrics import enable_metrics
 
 
 def load_styles(app):
     with open(resource_path("assets/style.qss"), "r", encoding="utf-8") as f:
         app.setStyleSheet(f.read())
 class MainApp(QStackedWidget):
+    # Only the login page is built up front; the other pages, and the excel /
+    # openpyxl modules behind them, are created on first navigation.
     def __init__(self):
         super().__init__()
-        self.login_page = LoginPage(self.show_home)
-        self.home_page = HomePage(self.show_create_excel, self.show_convert_excel)
-        self.create_excel_page = CreateExcelPage()
-        self.create_excel_page.go_back_requested.connect(self.show_home)
-        self.convert_excel_page = ConvertExcelPage()
-        self.convert_excel_page.go_back_requested.connect(self.show_home)
-        for w in (self.login_page, self.home_page, self.create_excel_page, self.convert_excel_page):
-            w.setFont(QFont("Segoe UI", 11))
-        self.addWidget(self.login_page)
-        self.addWidget(self.home_page)
-        self.addWidget(self.create_excel_page)
-        self.addWidget(self.convert_excel_page)
+        self.pages = {}
+        self.login_page = self.add_page("login", LoginPage(self.show_home))
         self.setCurrentWidget(self.login_page)
 
+    def add_page(self, name, widget):
+        widget.setFont(QFont("Segoe UI", 11))
+        self.addWidget(widget)
+        self.pages[name] = widget
+        return widget
+
+    def page(self, name):
+        if name not in self.pages:
+            self.add_page(name, getattr(self, f"build_{name}_page")())
+        return self.pages[name]
+
+    def build_home_page(self):
+        from Desktop.home import HomePage
+        return HomePage(self.show_create_excel, self.show_convert_excel)
+
+    def build_create_excel_page(self):
+        from Desktop.create_excel import CreateExcelPage
+        page = CreateExcelPage()
+        page.go_back_requested.connect(self.show_home)
+        return page
+
+    def build_convert_excel_page(self):
+        from Desktop.convert_excel import ConvertExcelPage
+        page = ConvertExcelPage()
+        page.go_back_requested.connect(self.show_home)
+        return page
+
+    @property
+    def home_page(self):
+        return self.page("home")
+
+    @property
+    def create_excel_page(self):
+        return self.page("create_excel")
+
+    @property
+    def convert_excel_page(self):
+        return self.page("convert_excel")
+
     def show_home(self):
         self.setCurrentWidget(self.home_page)
     def show_create_excel(self):
@@ -38,12 +66,17 @@ class MainApp(QStackedWidget):
         self.setCurrentWidget(self.convert_excel_page)
 
 
-if __name__ == '__main__':
+def run() -> int:
     app = QApplication(sys.argv)
+    enable_metrics()
     load_styles(app)
     main_app = MainApp()
     main_app.setWindowIcon(QIcon(resource_path("assets/logo.ico")))
     main_app.setWindowTitle("GLIX-Smart and easy graphics")
     main_app.resize(900, 650)
     main_app.show()
-    sys.exit(app.exec())
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(run())
@@ -0,0 +1,58 @@
+import argparse
+import json
+import sys
+import time
+
+# Modules that must stay out of the import graph until a conversion or an
+# export is requested from one of the pages.
+DEFERRED_MODULES = (
+    "openpyxl",
+    "excel.excel_data",
+    "excel.excel_to_json",
+    "excel.excel_writer",
+    "Desktop.convert_excel",
+    "Desktop.create_excel",
+)
+
+DEFAULT_BUDGET_SECONDS = 2.0
+
+
+def measure_startup() -> dict:
+    # Time from the first import to the login page being shown and painted.
+    start = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    from Desktop.main_app import MainApp
+    imported = time.perf_counter()
+
+    window = MainApp()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+
+    result = {
+        "import_seconds": round(imported - start, 4),
+        "startup_seconds": round(shown - start, 4),
+        "pages_built": sorted(window.pages),
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in sys.modules],
+    }
+    window.close()
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure desktop startup time")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS)
+    args = parser.parse_args(argv)
+
+    result = measure_startup()
+    result["budget_seconds"] = args.budget
+    print(json.dumps(result, indent=2))
+    if result["deferred_loaded"] or result["startup_seconds"] > args.budget:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from excel.metrics import pipeline_run
+from excel.progress import ConversionCancelled, ProgressTracker
+
+
+class JobSignals(QObject):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    metrics = pyqtSignal(object)
+
+
+class ExcelJob(QRunnable):
+    # Runs one excel.* function on the thread pool. The function receives a
+    # ProgressTracker as `progress=`; signals are delivered on the GUI thread.
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = JobSignals()
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        tracker = ProgressTracker(self.signals.progress.emit, self.cancel_event)
+        name = getattr(self.func, "__name__", "job")
+        try:
+            with pipeline_run(name) as metrics:
+                result = self.func(*self.args, progress=tracker, **self.kwargs)
+        except ConversionCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        if metrics.enabled:
+            self.signals.metrics.emit(metrics.record())
+
+        # Only a ConversionCancelled counts as cancelled: a cancel requested
+        # after the function returned came too late, its output is written.
+        self.signals.finished.emit(result)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class JobRunner(QObject):
+    # Keeps at most one job per page alive and forwards its lifecycle.
+    started = pyqtSignal()
+    stopped = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool.globalInstance()
+        self.current_job = None
+        self._connections = []
+
+    @property
+    def busy(self) -> bool:
+        return self.current_job is not None
+
+    def start(self, job: ExcelJob, on_finished, on_failed, on_cancelled=None, on_progress=None,
+              on_metrics=None) -> bool:
+        if self.busy:
+            return False
+
+        callbacks = [
+            (job.signals.finished, on_finished),
+            (job.signals.failed, on_failed),
+            (job.signals.cancelled, on_cancelled),
+            (job.signals.progress, on_progress),
+            (job.signals.metrics, on_metrics),
+        ]
+        self._connections = [(signal, slot) for signal, slot in callbacks if slot is not None]
+        for signal, slot in self._connections:
+            signal.connect(slot)
+        for signal in (job.signals.finished, job.signals.failed, job.signals.cancelled):
+            signal.connect(self._job_done)
+
+        self.current_job = job
+        self.started.emit()
+        self.pool.start(job)
+        return True
+
+    def cancel(self):
+        if self.current_job is not None:
+            self.current_job.cancel()
+
+    def abandon(self):
+        # Cancels the job and drops the page's callbacks, for when the user
+        # leaves the page: nothing the job reports afterwards is shown.
+        self._disconnect()
+        self.cancel()
+
+    def _disconnect(self):
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        self._connections = []
+
+    def _job_done(self, *args):
+        self._disconnect()
+        self.current_job = None
+        self.stopped.emit()
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import requests
+
+from API.async_client import AsyncStickersClient
+
+ROUND_TRIP = 0.05
+
+
+class SlowApiHandler(BaseHTTPRequestHandler):
+    # Every request takes ROUND_TRIP seconds and echoes the name or model it
+    # was asked for; the server records the highest number of overlapping
+    # requests it saw.
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            path = unquote(self.path)
+            if path.startswith("/stickers/slow"):
+                server.release.wait(5)
+            else:
+                time.sleep(ROUND_TRIP)
+
+            if path == "/stickers":
+                self.send_json([{"dbId": 1}])
+            elif path.startswith("/stickers/names/"):
+                self.send_json([{"model": path.rsplit("/", 1)[1]}])
+            elif path.startswith("/stickers/missing"):
+                self.send_json({"error": "not found"}, status=404)
+            else:
+                self.send_json([{"itemName": path.rsplit("/", 1)[1]}])
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowApiHandler)
+        cls.server.daemon_threads = True
+        cls.server.request_queue_size = 256
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.release.set()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.release = threading.Event()
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_single_operations(self):
+        async def lookups():
+            async with AsyncStickersClient(self.base_url) as client:
+                return (await client.get_all_stickers(),
+                        await client.get_stickers_by_name("חד קרן"),
+                        await client.get_names_stickers_by_model("90x52"))
+
+        self.assertEqual(self.run_async(lookups()), (
+            [{"dbId": 1}], [{"itemName": "חד קרן"}], [{"model": "90x52"}]))
+
+    def test_batch_of_200_runs_concurrently_in_input_order(self):
+        names = [f"name-{i}" for i in range(200)]
+
+        async def batch():
+            async with AsyncStickersClient(self.base_url, concurrency=20) as client:
+                return await client.get_stickers_by_names(names)
+
+        start = time.perf_counter()
+        results = self.run_async(batch())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, [[{"itemName": name}] for name in names])
+        self.assertLessEqual(self.server.max_in_flight, 20)
+        self.assertGreater(self.server.max_in_flight, 1)
+        # 200 sequential round trips would take 10 seconds.
+        self.assertLess(elapsed, 200 * ROUND_TRIP / 4)
+
+    def test_repeated_models_are_fetched_once(self):
+        models = ["90x52", "90", "90x52", "90"]
+
+        async def batch():
+            async with AsyncStickersClient(self.base_url, concurrency=4) as client:
+                return await client.get_names_stickers_by_models(models)
+
+        results = self.run_async(batch())
+        self.assertEqual(results, [[{"model": model}] for model in models])
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_return_exceptions_keeps_positions(self):
+        async def batch():
+            async with AsyncStickersClient(self.base_url, retries=0) as client:
+                return await client.get_stickers_by_names(["a", "missing", "b"], return_exceptions=True)
+
+        first, missing, last = self.run_async(batch())
+        self.assertEqual(first, [{"itemName": "a"}])
+        self.assertIsInstance(missing, requests.HTTPError)
+        self.assertEqual(last, [{"itemName": "b"}])
+
+    def test_errors_propagate_without_return_exceptions(self):
+        async def batch():
+            async with AsyncStickersClient(self.base_url, retries=0) as client:
+                return await client.get_stickers_by_names(["a", "missing"])
+
+        with self.assertRaises(requests.HTTPError):
+            self.run_async(batch())
+
+    def test_per_request_timeout(self):
+        async def slow():
+            async with AsyncStickersClient(self.base_url, request_timeout=0.2, retries=0) as client:
+                return await client.get_stickers_by_names(["slow", "fast"], return_exceptions=True)
+
+        start = time.perf_counter()
+        timed_out, fast = self.run_async(slow())
+        self.assertIsInstance(timed_out, TimeoutError)
+        self.assertEqual(fast, [{"itemName": "fast"}])
+        self.assertLess(time.perf_counter() - start, 2)
+        self.server.release.set()
+
+    def test_client_is_reusable_across_event_loops(self):
+        client = AsyncStickersClient(self.base_url, concurrency=2)
+        try:
+            for _ in range(2):
+                self.assertEqual(self.run_async(client.get_names_stickers_by_models(["90", "91", "92"])),
+                                 [[{"model": "90"}], [{"model": "91"}], [{"model": "92"}]])
+        finally:
+            client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
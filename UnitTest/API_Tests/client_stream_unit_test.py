@@ -0,0 +1,116 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from API.client import StickersClient
+from API.response_cache import ResponseCache
+from excel.excel_writer import export_orders_to_excel
+
+LARGE_CATALOG = [
+    {
+        "dbId": i,
+        "itemName": f"מדבקות שם - דגם {i % 40}",
+        "productType": "sticker",
+        "model": "90x52" if i % 2 else "90",
+        "orderStatus": "Ready",
+        "graphicStatus": "Done",
+    }
+    for i in range(30000)
+]
+
+
+class SlowCatalogHandler(BaseHTTPRequestHandler):
+    # Serves /stickers in two halves; the second half is held back until the
+    # test sets `release`, so a client that buffers the whole body stalls.
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        body = server.body
+        use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        if use_gzip:
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"catalog-v1"')
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        half = len(body) // 2
+        self.wfile.write(body[:half])
+        self.wfile.flush()
+        if server.hold:
+            server.release.wait(5)
+        server.sent_all = True
+        self.wfile.write(body[half:])
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowCatalogHandler)
+        cls.server.daemon_threads = True
+        cls.server.body = json.dumps(LARGE_CATALOG, ensure_ascii=False).encode("utf-8")
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.release.set()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = 0
+        self.server.hold = False
+        self.server.sent_all = False
+        self.server.release = threading.Event()
+
+    def test_streams_the_full_catalog(self):
+        with StickersClient(self.base_url) as client:
+            self.assertEqual(list(client.iter_all_stickers()), LARGE_CATALOG)
+            self.assertEqual(client.get_all_stickers(), LARGE_CATALOG)
+
+    def test_first_records_arrive_before_download_finishes(self):
+        self.server.hold = True
+        with StickersClient(self.base_url, retries=0) as client:
+            # The gzipped catalog is small; read it in pieces well under half.
+            records = client.iter_all_stickers(chunk_size=8 * 1024)
+            first = [next(records) for _ in range(100)]
+            self.assertFalse(self.server.sent_all)
+            self.server.release.set()
+            self.assertEqual(first + list(records), LARGE_CATALOG)
+
+    def test_streamed_body_is_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(os.path.join(temp_dir, "cache.sqlite3"))
+            with StickersClient(self.base_url, cache=cache) as client:
+                self.assertEqual(list(client.iter_all_stickers()), LARGE_CATALOG)
+                self.assertEqual(list(client.iter_all_stickers()), LARGE_CATALOG)
+                self.assertEqual(client.get_all_stickers(), LARGE_CATALOG)
+                stats = client.cache_stats()
+            cache.close()
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 2))
+
+    def test_excel_writer_consumes_the_stream(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with StickersClient(self.base_url) as client:
+                report = export_orders_to_excel(client.iter_all_stickers(), output_dir, max_per_file=5000)
+        self.assertEqual(report["failed"], 0)
+        self.assertEqual(sum(f["orders"] for f in report["files"]), len(LARGE_CATALOG))
+
+
+if __name__ == '__main__':
+    unittest.main()
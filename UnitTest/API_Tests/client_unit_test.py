@@ -0,0 +1,114 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from API.client import StickersClient
+
+STICKERS = [
+    {"dbId": 1, "itemName": "מדבקות שם - חד קרן", "productType": "sticker", "model": "90x52"},
+    {"dbId": 2, "itemName": "שקופות - קשת בענן", "productType": "sticker", "model": "90"},
+]
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        gzip_body = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzip_body:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if gzip_body:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        server.client_ports.add(self.client_address[1])
+
+        if self.path == "/stickers":
+            self.send_json(STICKERS)
+        elif self.path == "/stickers/names/90x52":
+            self.send_json([STICKERS[0]])
+        elif self.path == "/flaky":
+            server.flaky_calls += 1
+            if server.flaky_calls < 3:
+                self.send_json({"error": "unavailable"}, status=503)
+            else:
+                self.send_json({"ok": True})
+        elif self.path == "/slow":
+            server.release.wait(5)
+            self.send_json({"ok": True})
+        else:
+            self.send_json({"error": "not found"}, status=404)
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeApiHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []
+        cls.server.client_ports = set()
+        cls.server.flaky_calls = 0
+        cls.server.release = threading.Event()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.release.set()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.server.client_ports.clear()
+        self.server.flaky_calls = 0
+
+    def test_queries_reuse_one_connection(self):
+        with StickersClient(self.base_url) as client:
+            self.assertEqual(client.get_all_stickers(), STICKERS)
+            self.assertEqual(client.get_names_stickers_by_model("90x52"), [STICKERS[0]])
+            self.assertEqual(client.get_all_stickers(), STICKERS)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    def test_retries_on_server_error(self):
+        with StickersClient(self.base_url, backoff_factor=0) as client:
+            self.assertEqual(client._get_json("/flaky"), {"ok": True})
+        self.assertEqual(self.server.flaky_calls, 3)
+
+    def test_gives_up_after_retries(self):
+        with StickersClient(self.base_url, retries=1, backoff_factor=0) as client:
+            with self.assertRaises(requests.HTTPError):
+                client._get_json("/flaky")
+        self.assertEqual(self.server.flaky_calls, 2)
+
+    def test_not_found_is_not_retried(self):
+        with StickersClient(self.base_url, backoff_factor=0) as client:
+            with self.assertRaises(requests.HTTPError):
+                client.get_stickers_by_name("missing")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_timeout(self):
+        with StickersClient(self.base_url, timeout=0.2, retries=0) as client:
+            with self.assertRaises((requests.Timeout, requests.ConnectionError)):
+                client._get_json("/slow")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import unittest
+
+from API.json_stream import iter_json_array
+
+RECORDS = [
+    {"dbId": 1, "itemName": "מדבקות שם - חד קרן", "tags": ["a", "]", ","], "price": 12.5},
+    {"dbId": 22, "itemName": "שקופות - קשת בענן \"גדול\"", "extra": {"nested": [1, 2, {"x": None}]}},
+    12345,
+    -0.5e3,
+    "text with [brackets], and commas",
+    True,
+    None,
+    [],
+]
+
+
+def split_every(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class MyTestCase(unittest.TestCase):
+    def test_every_chunk_boundary(self):
+        body = json.dumps(RECORDS, ensure_ascii=False, indent=1).encode("utf-8")
+        for size in (1, 2, 3, 7, 64, len(body)):
+            with self.subTest(size=size):
+                self.assertEqual(list(iter_json_array(split_every(body, size))), RECORDS)
+
+    def test_yields_before_the_body_ends(self):
+        def chunks():
+            yield b'[{"dbId": 1}, {"dbI'
+            raise AssertionError("read past the first record")
+
+        records = iter_json_array(chunks())
+        self.assertEqual(next(records), {"dbId": 1})
+
+    def test_number_split_across_chunks(self):
+        self.assertEqual(list(iter_json_array([b"[12", b"34, 5", b"6]"])), [1234, 56])
+
+    def test_empty_array_and_whitespace(self):
+        self.assertEqual(list(iter_json_array([b"  [", b" \n ", b"]  "])), [])
+
+    def test_invalid_input(self):
+        for body in (b'{"dbId": 1}', b"[1, 2", b"[1 2]", b'[{"dbId": }]', b""):
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array([body]))
+
+
+if __name__ == '__main__':
+    unittest.main()
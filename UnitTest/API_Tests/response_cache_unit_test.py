@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from API.client import StickersClient
+from API.response_cache import ResponseCache
+
+STICKERS = [{"dbId": 1, "itemName": "מדבקות שם - חד קרן", "productType": "sticker", "model": "90x52"}]
+
+
+class EtagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get("If-None-Match")))
+        etag = f'"v{self.server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps(STICKERS + [{"version": self.server.version}]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), EtagHandler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.version = 1
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.temp_dir.name, "cache.sqlite3"), ttl=60)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_fresh_entries_skip_the_network(self):
+        with StickersClient(self.base_url, cache=self.cache) as client:
+            first = client.get_all_stickers()
+            second = client.get_all_stickers()
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.requests), 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_expired_entries_are_revalidated_with_etag(self):
+        self.cache.ttl = 0
+        with StickersClient(self.base_url, cache=self.cache) as client:
+            client.get_all_stickers()
+            self.assertEqual(client.get_all_stickers()[-1], {"version": 1})
+            self.server.version = 2
+            self.assertEqual(client.get_all_stickers()[-1], {"version": 2})
+
+        self.assertEqual([etag for _, etag in self.server.requests], [None, '"v1"', '"v1"'])
+        stats = self.cache.stats()
+        self.assertEqual((stats["misses"], stats["revalidated"]), (2, 1))
+
+    def test_offline_serves_stale(self):
+        self.cache.ttl = 0
+        with StickersClient(self.base_url, cache=self.cache) as client:
+            client.get_all_stickers()
+
+        with StickersClient(self.base_url, cache=self.cache, offline=True) as client:
+            self.assertEqual(client.get_all_stickers()[0], STICKERS[0])
+            with self.assertRaises(requests.ConnectionError):
+                client.get_names_stickers_by_model("90x52")
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.cache.stats()["stale_served"], 1)
+
+    def test_size_based_eviction(self):
+        self.cache.max_bytes = 25
+        self.cache.put("a", b"x" * 10)
+        time.sleep(0.01)
+        self.cache.put("b", b"x" * 10)
+        self.cache.get("a")
+        time.sleep(0.01)
+        self.cache.put("c", b"x" * 10)
+
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_make_key_sorts_params(self):
+        self.assertEqual(ResponseCache.make_key("http://x/s", {"b": 2, "a": 1}), "http://x/s?a=1&b=2")
+
+
+if __name__ == '__main__':
+    unittest.main()
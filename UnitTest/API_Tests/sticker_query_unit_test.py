@@ -0,0 +1,92 @@
+import itertools
+import random
+import unittest
+from datetime import date, timedelta
+
+from API.sticker_query import StickerQuery, parse_date
+
+ORDER_STATUSES = ["Ready", "Not Ready"]
+GRAPHIC_STATUSES = ["Approved", "Rejected", "In Process"]
+MODELS = ["90x52", "90", "60x30"]
+PRODUCT_TYPES = ["sticker", "label"]
+FIRST_DAY = date(2025, 1, 1)
+
+
+def make_records(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        item = {
+            "dbId": i,
+            "orderStatus": rng.choice(ORDER_STATUSES),
+            "graphicStatus": rng.choice(GRAPHIC_STATUSES),
+            "model": rng.choice(MODELS),
+            "productType": rng.choice(PRODUCT_TYPES),
+        }
+        if i % 10:
+            item["orderDate"] = (FIRST_DAY + timedelta(days=rng.randrange(60))).isoformat()
+        records.append(item)
+    return records
+
+
+def linear_query(records, date_from=None, date_to=None, **filters):
+    fields = {"order_status": "orderStatus", "graphic_status": "graphicStatus",
+              "model": "model", "product_type": "productType"}
+    low, high = parse_date(date_from), parse_date(date_to)
+    matches = []
+    for item in records:
+        if any(item.get(fields[name]) not in (value if isinstance(value, list) else [value])
+               for name, value in filters.items()):
+            continue
+        if low or high:
+            item_date = parse_date(item.get("orderDate"))
+            if item_date is None or (low and item_date < low) or (high and item_date > high):
+                continue
+        matches.append(item)
+    return matches
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.records = make_records(2000)
+        cls.engine = StickerQuery(cls.records)
+
+    def test_combined_filters_match_linear_scan(self):
+        date_ranges = [(None, None), ("2025-01-10", "2025-01-12"), ("2025-02-01", None),
+                       (None, "2025-01-01"), (date(2025, 1, 5), date(2025, 1, 5))]
+        options = itertools.product([None, "Ready"], [None, "Approved", ["Rejected", "In Process"]],
+                                    [None, "90x52"], [None, "sticker"], date_ranges)
+        for order_status, graphic_status, model, product_type, (low, high) in options:
+            filters = {name: value for name, value in (
+                ("order_status", order_status), ("graphic_status", graphic_status),
+                ("model", model), ("product_type", product_type)) if value is not None}
+            with self.subTest(filters=filters, date_from=low, date_to=high):
+                self.assertEqual(self.engine.query(low, high, **filters),
+                                 linear_query(self.records, low, high, **filters))
+
+    def test_results_keep_record_order(self):
+        positions = self.engine.positions(order_status="Ready", date_from="2025-01-01")
+        self.assertEqual(positions, sorted(positions))
+
+    def test_unknown_values_and_empty_ranges(self):
+        self.assertEqual(self.engine.query(model="missing"), [])
+        self.assertEqual(self.engine.query(date_from="2025-03-01", date_to="2025-01-01"), [])
+        self.assertEqual(self.engine.count(date_from="2030-01-01"), 0)
+
+    def test_undated_records_are_left_out_of_date_queries(self):
+        dated = self.engine.query(date_from="2000-01-01")
+        self.assertEqual(len(dated), sum(1 for item in self.records if "orderDate" in item))
+
+    def test_invalid_filters(self):
+        with self.assertRaises(ValueError):
+            self.engine.query(colour="red")
+        with self.assertRaises(ValueError):
+            self.engine.query(date_from="yesterday")
+
+    def test_filter_values(self):
+        self.assertEqual(self.engine.values("graphic_status"), sorted(GRAPHIC_STATUSES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from API.sticker_repository import StickerRepository
+from API.sticker_source import create_sticker_source
+
+RECORDS = [
+    {"dbId": 1, "itemName": "מדבקות שם - חד קרן", "productType": "sticker", "model": "90x52",
+     "graphicStatus": "Approved", "orderStatus": "Ready"},
+    {"dbId": 2, "itemName": "שקופות - קשת בענן", "productType": "sticker", "model": "90",
+     "graphicStatus": "Rejected", "orderStatus": "Not Ready"},
+    {"dbId": 3, "itemName": "מדבקות שם - פרפרים", "productType": "label", "model": "90x52",
+     "graphicStatus": "Approved", "orderStatus": "Ready"},
+    {"dbId": 4, "itemName": "מדבקות שם - פרפרים", "productType": "sticker", "model": "90x52",
+     "graphicStatus": "In Process", "orderStatus": "Ready"},
+]
+
+
+def linear_by_name(records, item_name):
+    return [item for item in records if item.get("productType") == "sticker" and item_name in item.get("itemName", "")]
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "stickers_data.json")
+        self.write(RECORDS)
+        self.repository = StickerRepository(self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, records):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+
+    def test_get_all_stickers(self):
+        self.assertEqual([s["dbId"] for s in self.repository.get_all_stickers()], [1, 2, 4])
+
+    def test_get_stickers_by_name_matches_linear_scan(self):
+        for query in ["מדבקות שם", "פרפ", "ש", "", "קשת בענן", "לא קיים"]:
+            self.assertEqual(self.repository.get_stickers_by_name(query), linear_by_name(RECORDS, query), query)
+
+    def test_get_names_stickers_by_model(self):
+        self.assertEqual(self.repository.get_names_stickers_by_model("90x52"), [
+            {"dbId": 1, "itemName": "מדבקות שם - חד קרן", "graphicStatus": "Approved", "orderStatus": "Ready"},
+            {"dbId": 4, "itemName": "מדבקות שם - פרפרים", "graphicStatus": "In Process", "orderStatus": "Ready"},
+        ])
+
+    def test_query_combines_filters(self):
+        self.assertEqual([s["dbId"] for s in self.repository.query(
+            product_type="sticker", order_status="Ready", graphic_status=["Approved", "In Process"])], [1, 4])
+        self.assertEqual(self.repository.query(product_type="label", model="90"), [])
+        self.assertEqual(self.repository.filter_values("order_status"), ["Not Ready", "Ready"])
+
+    def test_reloads_only_when_file_changes(self):
+        first = self.repository.records()
+        self.assertIs(self.repository.records(), first)
+
+        time.sleep(0.01)
+        self.write(RECORDS[:1])
+        os.utime(self.path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        self.assertEqual(len(self.repository.records()), 1)
+        self.assertEqual(self.repository.get_names_stickers_by_model("90x52")[0]["dbId"], 1)
+
+    def test_create_sticker_source_local(self):
+        source = create_sticker_source(self.path)
+        self.assertIsInstance(source, StickerRepository)
+        self.assertEqual(len(source.get_all_stickers()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
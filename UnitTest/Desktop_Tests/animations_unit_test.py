@@ -0,0 +1,81 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import QApplication, QLabel, QStackedWidget, QVBoxLayout, QWidget
+
+from Desktop.animations import AnimationManager, clear_frame_cache, frame_sequence
+from helper.paths import resource_path
+
+ARROW = resource_path("assets/gif/left-arrow.gif")
+FOLDER = resource_path("assets/gif/folder.gif")
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        clear_frame_cache()
+        self.manager = AnimationManager()
+
+    def make_page(self, *paths):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        players = []
+        for path in paths:
+            label = QLabel()
+            layout.addWidget(label)
+            players.append(self.manager.play(label, path, QSize(50, 50), page=page))
+        return page, players
+
+    def test_frames_are_decoded_once_per_asset_and_size(self):
+        self.assertIs(frame_sequence(ARROW, QSize(50, 50)), frame_sequence(ARROW, QSize(50, 50)))
+        self.assertIsNot(frame_sequence(ARROW, QSize(50, 50)), frame_sequence(ARROW, QSize(64, 64)))
+
+        first_page, (first,) = self.make_page(ARROW)
+        second_page, (second,) = self.make_page(ARROW)
+        self.assertIs(first.frames, second.frames)
+        self.assertEqual(first.label.pixmap().size(), QSize(50, 50))
+
+    def test_sequence_wraps_after_the_last_frame(self):
+        sequence = frame_sequence(ARROW, QSize(50, 50))
+        index, seen = 0, []
+        while not seen or index != 0:
+            pixmap, delay, index = sequence.frame(index)
+            self.assertGreater(delay, 0)
+            seen.append(pixmap)
+        self.assertTrue(sequence.complete)
+        self.assertEqual(len(sequence), len(seen))
+        self.assertIs(sequence.frame(len(seen))[0], seen[0])
+
+    def test_only_the_current_page_animates(self):
+        stack = QStackedWidget()
+        home, home_players = self.make_page(ARROW, FOLDER)
+        convert, convert_players = self.make_page(ARROW)
+        stack.addWidget(home)
+        stack.addWidget(convert)
+        stack.setCurrentWidget(home)
+        stack.show()
+        self.app.processEvents()
+
+        self.assertTrue(all(p.running for p in home_players))
+        self.assertFalse(any(p.running for p in convert_players))
+
+        stack.setCurrentWidget(convert)
+        self.app.processEvents()
+        self.assertFalse(any(p.running for p in home_players))
+        self.assertTrue(all(p.running for p in convert_players))
+
+        stack.hide()
+        self.app.processEvents()
+        self.assertFalse(any(p.running for p in convert_players))
+        self.assertEqual(len(self.manager.players(home)), 2)
+        stack.deleteLater()
+
+
+if __name__ == '__main__':
+    unittest.main()
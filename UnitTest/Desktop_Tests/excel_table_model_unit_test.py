@@ -0,0 +1,100 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from Desktop.excel_table_model import ExcelTableModel
+
+HEADERS = ["dbId", "Item Name", "Line Comments"]
+
+
+def make_rows(count: int):
+    return [(i, f"מדבקות שם {i}", "x" * (i % 7)) for i in range(count)]
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_rows_are_fetched_in_batches(self):
+        model = ExcelTableModel(HEADERS, make_rows(1200))
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+        self.assertEqual(model.rowCount(), ExcelTableModel.FETCH_BATCH)
+        self.assertEqual(model.columnCount(), len(HEADERS))
+        self.assertEqual(model.total_rows(), 1200)
+
+        self.assertTrue(model.canFetchMore())
+        model.fetchMore()
+        self.assertEqual(model.rowCount(), 1000)
+        model.fetchMore()
+        self.assertEqual(model.rowCount(), 1200)
+        self.assertFalse(model.canFetchMore())
+        model.fetchMore()
+
+        self.assertEqual(inserted, [(500, 999), (1000, 1199)])
+
+    def test_small_sheets_load_at_once(self):
+        model = ExcelTableModel(HEADERS, make_rows(3))
+        self.assertEqual(model.rowCount(), 3)
+        self.assertFalse(model.canFetchMore())
+        self.assertEqual(model.rowCount(model.index(0, 0)), 0)
+
+    def test_edits_overlay_the_source_rows(self):
+        rows = make_rows(10)
+        model = ExcelTableModel(HEADERS, rows)
+        index = model.index(2, 1)
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right, roles: changed.append(top_left.row()))
+
+        self.assertEqual(model.data(index), "מדבקות שם 2")
+        self.assertTrue(model.setData(index, "חד קרן"))
+        self.assertEqual(model.data(index), "חד קרן")
+        self.assertEqual(model.data(index, Qt.ItemDataRole.EditRole), "חד קרן")
+        self.assertEqual(model.value(2, 1), "חד קרן")
+        self.assertEqual(rows[2][1], "מדבקות שם 2")
+        self.assertEqual(changed, [2])
+
+        self.assertFalse(model.setData(index, "x", Qt.ItemDataRole.DisplayRole))
+        self.assertFalse(model.setData(QModelIndex(), "x"))
+        self.assertIsNone(model.data(index, Qt.ItemDataRole.ToolTipRole))
+
+    def test_headers_and_flags(self):
+        model = ExcelTableModel(HEADERS, make_rows(2))
+        self.assertEqual(model.headerData(1, Qt.Orientation.Horizontal), "Item Name")
+        self.assertEqual(model.headerData(0, Qt.Orientation.Vertical), "1")
+        self.assertTrue(model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsEditable)
+
+    def test_view_fetches_more_when_scrolled(self):
+        model = ExcelTableModel(HEADERS, make_rows(1200))
+        view = QTableView()
+        view.setModel(model)
+        view.resize(400, 300)
+        view.show()
+        view.scrollToBottom()
+        self.app.processEvents()
+        self.assertGreater(model.rowCount(), ExcelTableModel.FETCH_BATCH)
+        view.close()
+
+    def test_sample_column_widths(self):
+        rows = make_rows(300) + [(999, "x" * 1000, "")]
+        model = ExcelTableModel(HEADERS, rows)
+        metrics = QTableView().fontMetrics()
+
+        widths = model.sample_column_widths(metrics)
+
+        self.assertEqual(len(widths), len(HEADERS))
+        expected = max(metrics.horizontalAdvance(text) for text in ["dbId"] + [str(i) for i in range(200)])
+        self.assertEqual(widths[0], expected + ExcelTableModel.COLUMN_PADDING)
+        self.assertLessEqual(max(widths), ExcelTableModel.MAX_COLUMN_WIDTH)
+        # Only the first SAMPLE_ROWS rows are measured; the long row is past them.
+        self.assertLess(widths[1], ExcelTableModel.MAX_COLUMN_WIDTH)
+
+
+if __name__ == '__main__':
+    unittest.main()
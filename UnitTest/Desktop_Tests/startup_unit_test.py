@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from Desktop.startup import DEFAULT_BUDGET_SECONDS
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+NAVIGATION_SCRIPT = """
+import json, sys
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+from Desktop.main_app import MainApp
+window = MainApp()
+before = sorted(window.pages)
+window.show_home()
+after_home = sorted(window.pages)
+openpyxl_after_home = "openpyxl" in sys.modules
+window.show_convert_excel()
+window.show_home()
+window.show_convert_excel()
+print(json.dumps({
+    "before": before,
+    "after_home": after_home,
+    "openpyxl_after_home": openpyxl_after_home,
+    "after_convert": sorted(window.pages),
+    "count": window.count(),
+    "current": window.currentWidget() is window.convert_excel_page,
+}))
+"""
+
+
+def run_python(*args):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=ROOT)
+    completed = subprocess.run([sys.executable, *args], cwd=ROOT, env=env,
+                               capture_output=True, text=True, timeout=120)
+    return completed
+
+
+class MyTestCase(unittest.TestCase):
+    def test_startup_within_budget_without_excel_imports(self):
+        budget = float(os.environ.get("STARTUP_BUDGET_SECONDS", DEFAULT_BUDGET_SECONDS))
+        completed = run_python("-m", "Desktop.startup", "--budget", str(budget))
+        result = json.loads(completed.stdout)
+
+        self.assertEqual(result["deferred_loaded"], [])
+        self.assertEqual(result["pages_built"], ["login"])
+        self.assertLessEqual(result["startup_seconds"], budget)
+        self.assertEqual(completed.returncode, 0)
+
+    def test_pages_are_built_once_on_first_navigation(self):
+        completed = run_python("-c", NAVIGATION_SCRIPT)
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(result["before"], ["login"])
+        self.assertEqual(result["after_home"], ["home", "login"])
+        self.assertFalse(result["openpyxl_after_home"])
+        self.assertEqual(result["after_convert"], ["convert_excel", "home", "login"])
+        self.assertEqual(result["count"], 3)
+        self.assertTrue(result["current"])
+
+
+if __name__ == '__main__':
+    unittest.main()
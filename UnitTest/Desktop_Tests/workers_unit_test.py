@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from Desktop.workers import ExcelJob, JobRunner
+
+
+def blocking_job(release: threading.Event, check_cancel: bool, progress=None):
+    release.wait(5)
+    if check_cancel:
+        progress.check_cancelled()
+    return "written"
+
+
+class MyTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.runner = JobRunner()
+        self.release = threading.Event()
+        self.calls = []
+
+    def tearDown(self):
+        self.release.set()
+        self.runner.pool.waitForDone(5000)
+
+    def start(self, check_cancel: bool):
+        self.runner.start(
+            ExcelJob(blocking_job, self.release, check_cancel),
+            on_finished=lambda result: self.calls.append(("finished", result)),
+            on_failed=lambda error: self.calls.append(("failed", error)),
+            on_cancelled=lambda: self.calls.append(("cancelled",)),
+        )
+
+    def wait_until_idle(self):
+        deadline = time.monotonic() + 5
+        while self.runner.busy and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        self.assertFalse(self.runner.busy)
+
+    def test_cancel_raised_by_the_job_is_reported(self):
+        self.start(check_cancel=True)
+        self.runner.cancel()
+        self.release.set()
+        self.wait_until_idle()
+        self.assertEqual(self.calls, [("cancelled",)])
+
+    def test_cancel_after_the_work_is_done_still_finishes(self):
+        self.start(check_cancel=False)
+        self.runner.cancel()
+        self.release.set()
+        self.wait_until_idle()
+        self.assertEqual(self.calls, [("finished", "written")])
+
+    def test_abandoned_job_reports_nothing(self):
+        stopped = []
+        self.runner.stopped.connect(lambda: stopped.append(True))
+        self.start(check_cancel=True)
+        self.runner.abandon()
+        self.release.set()
+        self.wait_until_idle()
+        self.assertEqual(self.calls, [])
+        self.assertEqual(stopped, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
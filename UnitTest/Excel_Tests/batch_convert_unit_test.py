@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import multiprocessing
+import unittest
+from unittest import mock
+from openpyxl import Workbook
+
+from excel.batch_convert import collect_excel_files, convert_files
+from excel.json_backends import configure_json_output
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(3):
+            wb = Workbook()
+            ws = wb.active
+            ws.append(["Business Partner Reference Number", "Item Name", "Quantity", "Line Comments"])
+            for j in range(5 + i):
+                ws.append([
+                    f"REF{i}-{j}",
+                    "מדבקות שם - חד קרן - סט מדבקות 52+90",
+                    1,
+                    f"שם הילד שיודפס על גבי המדבקות: ילד{j}"
+                ])
+            path = os.path.join(self.temp_dir.name, f"orders_{i}.xlsx")
+            wb.save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_json(self, path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_collect_excel_files_from_folder_and_glob(self):
+        self.assertEqual(collect_excel_files(self.temp_dir.name), self.paths)
+        self.assertEqual(collect_excel_files(os.path.join(self.temp_dir.name, "orders_[01].xlsx")), self.paths[:2])
+
+    def test_parallel_output_matches_serial(self):
+        serial = convert_files(self.temp_dir.name, mode="json", workers=1)
+        serial_outputs = [self.read_json(p.replace(".xlsx", ".json")) for p in self.paths]
+
+        parallel = convert_files(self.temp_dir.name, mode="json", workers=2)
+        parallel_outputs = [self.read_json(p.replace(".xlsx", ".json")) for p in self.paths]
+
+        self.assertEqual(serial_outputs, parallel_outputs)
+        self.assertEqual(parallel["workers"], 2)
+        self.assertEqual(parallel["succeeded"], 3)
+        self.assertEqual([r["path"] for r in parallel["files"]], self.paths)
+        self.assertEqual([r["rows"] for r in parallel["files"]], [r["rows"] for r in serial["files"]])
+
+    def test_spawned_workers_use_the_configured_json_output(self):
+        configure_json_output("stdlib", indent=False)
+        self.addCleanup(configure_json_output)
+        spawn = multiprocessing.get_context("spawn")
+        with mock.patch("excel.batch_convert.multiprocessing.get_context", return_value=spawn):
+            summary = convert_files(self.paths[:2], mode="json-stream", workers=2)
+
+        self.assertEqual(summary["workers"], 2)
+        self.assertEqual(summary["succeeded"], 2)
+        for result in summary["files"]:
+            with open(result["output"], "rb") as f:
+                data = f.read()
+            self.assertNotIn(b"\n", data)
+            self.assertEqual(len(json.loads(data)), result["rows"])
+
+    def test_failed_file_is_reported(self):
+        missing = os.path.join(self.temp_dir.name, "missing.xlsx")
+        summary = convert_files([self.paths[0], missing], mode="filtered", workers=2)
+        self.assertEqual(summary["succeeded"], 1)
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(summary["files"][0]["rows"], 10)
+        self.assertFalse(summary["files"][1]["ok"])
+
+    def test_incremental_mode_reports_output_folder(self):
+        summary = convert_files(self.paths[:1], mode="incremental", workers=1)
+        result = summary["files"][0]
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["rows"], 5)
+        self.assertEqual(result["output"], self.paths[0].replace(".xlsx", "_jsons"))
+
+    def test_every_mode_reports_rows_and_output(self):
+        for mode, rows in (("filtered", 10), ("stream", 10), ("json", 5), ("json-stream", 5)):
+            with self.subTest(mode=mode):
+                summary = convert_files(self.paths[:1], mode=mode, workers=1)
+                result = summary["files"][0]
+                self.assertEqual(result["rows"], rows)
+                self.assertEqual(summary["rows"], rows)
+                self.assertTrue(os.path.exists(result["output"]))
+                if mode in ("filtered", "stream"):
+                    self.assertTrue(os.path.basename(result["output"]).startswith("orders_0_jsons_"))
+                else:
+                    self.assertEqual(result["output"], self.paths[0].replace(".xlsx", ".json"))
+                self.assertGreaterEqual(summary["file_seconds"], result["seconds"])
+                self.assertGreaterEqual(result["cpu_seconds"], 0)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            convert_files(self.paths, mode="xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks import pipeline_bench
+from benchmarks.pipeline_bench import bench_size, compare_results
+from benchmarks.workbooks import ORDER_HEADERS, order_rows, write_order_workbook
+from excel.excel_data import excel_to_dict
+from excel.logging_setup import LOG_FILE_NAME, log_directory
+from excel.line_item_classifier import (
+    TYPE_PATTERN_BACKGROUND, TYPE_PATTERN_FONT, TYPE_PATTERN_NO_ILLUSTRATIONS, TYPE_PATTERN_SET,
+    extract_name_details, extract_type_details
+)
+
+
+class MyTestCase(unittest.TestCase):
+    def test_generated_items_cover_every_type_pattern(self):
+        rows = list(order_rows(50))
+        items = [row[ORDER_HEADERS.index("Item Name")] for row in rows]
+
+        self.assertTrue(any(TYPE_PATTERN_SET.search(i) for i in items))
+        self.assertTrue(any(TYPE_PATTERN_BACKGROUND.search(i) for i in items))
+        self.assertTrue(any(TYPE_PATTERN_NO_ILLUSTRATIONS.search(i) and not TYPE_PATTERN_BACKGROUND.search(i)
+                            for i in items))
+        self.assertTrue(any(TYPE_PATTERN_FONT.search(i) and not TYPE_PATTERN_SET.search(i) for i in items))
+        self.assertTrue(any(extract_type_details(i) is None for i in items))
+
+    def test_generated_comments_match_name_pattern(self):
+        comments = [row[ORDER_HEADERS.index("Line Comments")] for row in order_rows(40)]
+        names = [extract_name_details(c) for c in comments]
+        self.assertEqual(sum(1 for n in names if n), 30)
+        self.assertFalse(any("\\" in n or "\n" in n for n in names if n))
+
+    def test_generation_is_deterministic(self):
+        self.assertEqual(list(order_rows(20, seed=3)), list(order_rows(20, seed=3)))
+
+    def test_write_order_workbook(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_order_workbook(os.path.join(temp_dir, "orders.xlsx"), 25)
+            data = excel_to_dict(path)
+        self.assertEqual(len(data), 25)
+        self.assertEqual(list(data[0]), ORDER_HEADERS)
+        self.assertEqual(data[0]["dbId"], 100000)
+
+    def test_bench_size_releases_the_export_log(self):
+        logged_to = []
+        real_save = pipeline_bench.save_orders_to_excel
+
+        def save(orders, output_dir):
+            result = real_save(orders, output_dir=output_dir)
+            logged_to.append(os.path.exists(os.path.join(log_directory(), LOG_FILE_NAME)))
+            return result
+
+        with mock.patch.object(pipeline_bench, "save_orders_to_excel", save), \
+                contextlib.redirect_stderr(io.StringIO()):
+            results = bench_size(30, repeat=3, only=["save_orders_to_excel"])
+
+        self.assertEqual([r["operation"] for r in results], ["save_orders_to_excel"])
+        # Each repetition logs into a live file, and nothing is left open.
+        self.assertEqual(logged_to, [True] * 3)
+        self.assertIsNone(log_directory())
+
+    def test_compare_results_flags_slowdowns_past_threshold(self):
+        baseline = {"results": [
+            {"operation": "excel_to_dict", "rows": 1000, "seconds": 1.0},
+            {"operation": "convert_excel_to_json", "rows": 1000, "seconds": 1.0},
+        ]}
+        current = {"results": [
+            {"operation": "excel_to_dict", "rows": 1000, "seconds": 1.2},
+            {"operation": "convert_excel_to_json", "rows": 1000, "seconds": 1.5},
+            {"operation": "save_orders_to_excel", "rows": 1000, "seconds": 9.0},
+        ]}
+
+        regressions = compare_results(baseline, current, threshold=1.25)
+
+        self.assertEqual([r["operation"] for r in regressions], ["convert_excel_to_json"])
+        self.assertEqual(regressions[0]["ratio"], 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
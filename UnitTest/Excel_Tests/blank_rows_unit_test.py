@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+
+from excel.excel_data import excel_to_dict
+from excel.excel_to_json import convert_excel_to_json, excel_to_filtered_json, stream_excel_to_filtered_json_report, \
+    stream_excel_to_json_report
+from excel.workbook_cache import parse_sheet
+
+HEADERS = ["Business Partner Reference Number", "Item Name", "Quantity", "Line Comments"]
+
+
+def write_workbook_with_formatted_blank_rows(path: str) -> None:
+    # Rows 2, 3 and 5 hold data. Row 4 and rows 6-9 have no cells, only a
+    # custom height, so they are stored as empty <row> elements.
+    wb = Workbook()
+    ws = wb.active
+    ws.append(HEADERS)
+    ws.append(["REF0", "שקופות - קשת בענן ללא איורים 90", 1, "x"])
+    ws.append(["REF1", "שקופות - קשת בענן ללא איורים 90", 1, "x"])
+    ws.cell(row=5, column=1, value="REF3")
+    ws.cell(row=5, column=2, value="שקופות - קשת בענן ללא איורים 90")
+    for row in range(4, 10):
+        if row != 5:
+            ws.row_dimensions[row].height = 30
+    wb.save(path)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "orders.xlsx")
+        write_workbook_with_formatted_blank_rows(self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_trailing_height_only_rows_are_dropped(self):
+        rows = parse_sheet(self.path).rows
+        self.assertEqual([row[0] for row in rows], ["REF0", "REF1", None, "REF3"])
+        # The blank row between data rows is kept, padded to the header width.
+        self.assertEqual(rows[2], (None,) * len(HEADERS))
+
+    def test_entry_points_have_no_phantom_records(self):
+        self.assertEqual(len(excel_to_dict(self.path)), 4)
+        self.assertEqual(len(convert_excel_to_json(self.path)), 4)
+        items = excel_to_filtered_json(self.path)
+        self.assertEqual(len(items), 4)
+        self.assertEqual(items[-1]["referenceNumber"], "REF3")
+
+    def test_stream_filtered_json_has_no_phantom_items(self):
+        report = stream_excel_to_filtered_json_report(self.path)
+        self.assertEqual(report["rows"], 4)
+        with open(os.path.join(report["output"], "data_part_1.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)[-1]["referenceNumber"], "REF3")
+
+    def test_stream_json_has_no_phantom_rows(self):
+        report = stream_excel_to_json_report(self.path)
+        self.assertEqual(report["rows"], 4)
+        with open(report["output"], encoding="utf-8") as f:
+            records = json.load(f)
+        self.assertEqual(records[-1]["Business Partner Reference Number"], "REF3")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from openpyxl import Workbook, load_workbook
+
+from excel.cli import main
+from excel.logging_setup import LOG_FILE_NAME
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+HEADLESS_SCRIPT = """
+import json, sys
+import excel.cli
+code = excel.cli.main(sys.argv[1:])
+loaded = sorted(m for m in sys.modules if m.split(".")[0] in ("PyQt6", "Desktop"))
+print(json.dumps(loaded), file=sys.stderr)
+sys.exit(code)
+"""
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        self.paths = []
+        for i in range(2):
+            wb = Workbook()
+            ws = wb.active
+            ws.append(["dbId", "Business Partner Reference Number", "Item Name", "Quantity", "Line Comments",
+                       "orderStatus"])
+            for j in range(3):
+                ws.append([i * 10 + j, f"REF{j}", "מדבקות שם - חד קרן - סט מדבקות 52+90", 1,
+                           f"שם הילד שיודפס על גבי המדבקות: ילד{j}", "Not Ready"])
+            path = os.path.join(self.folder, f"orders_{i}.xlsx")
+            wb.save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = main(list(argv))
+        return code, json.loads(out.getvalue())
+
+    def column_values(self, path, column):
+        ws = load_workbook(path).active
+        index = [c.value for c in ws[1]].index(column)
+        return [row[index] for row in ws.iter_rows(min_row=2, values_only=True)]
+
+    def test_json_for_folder_reports_timings(self):
+        code, report = self.run_cli("json", self.folder, "--metrics")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["command"], "json")
+        self.assertEqual(report["succeeded"], 2)
+        self.assertEqual([f["rows"] for f in report["files"]], [3, 3])
+        self.assertTrue(all(f["seconds"] >= 0 for f in report["files"]))
+        self.assertEqual([m["run"] for m in report["metrics"]], ["convert_excel_to_json"] * 2)
+        self.assertTrue(os.path.exists(self.paths[0].replace(".xlsx", ".json")))
+
+    def test_metrics_from_pool_workers(self):
+        code, report = self.run_cli("filtered-json", self.folder, "--workers", "2", "--metrics")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["workers"], 2)
+        self.assertEqual([m["run"] for m in report["metrics"]], ["excel_to_filtered_json"] * 2)
+        self.assertTrue(all(m["rows"] == 3 for m in report["metrics"]))
+        self.assertTrue(all("metrics" not in f for f in report["files"]))
+
+    def test_filtered_json_incremental_with_glob(self):
+        code, report = self.run_cli("filtered-json", os.path.join(self.folder, "orders_*.xlsx"), "--incremental")
+        self.assertEqual(code, 0)
+        self.assertEqual([f["output"] for f in report["files"]],
+                         [p.replace(".xlsx", "_jsons") for p in self.paths])
+
+    def test_save_orders_from_json_files(self):
+        orders_path = os.path.join(self.folder, "orders.json")
+        with open(orders_path, "w", encoding="utf-8") as f:
+            json.dump([{"dbId": i, "name": f"ילד{i}"} for i in range(30)], f, ensure_ascii=False)
+
+        code, report = self.run_cli("save-orders", orders_path, "--output-dir", os.path.join(self.folder, "out"))
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["files"][0]["orders"], 30)
+        self.assertEqual(len(report["files"][0]["excel_files"]), 2)
+
+    def test_save_orders_keeps_explicit_log_dir(self):
+        orders_path = os.path.join(self.folder, "orders.json")
+        with open(orders_path, "w", encoding="utf-8") as f:
+            json.dump([{"dbId": 1, "name": "ילד"}], f, ensure_ascii=False)
+        log_dir = os.path.join(self.folder, "logs")
+
+        code, report = self.run_cli("save-orders", orders_path, "--output-dir", os.path.join(self.folder, "out"),
+                                    "--log-dir", log_dir)
+
+        self.assertEqual(code, 0)
+        with open(os.path.join(log_dir, LOG_FILE_NAME), encoding="utf-8") as f:
+            log = f.read()
+        self.assertIn("Output directory created", log)
+        self.assertIn("Saved 1/1 Excel file(s)", log)
+        self.assertFalse(os.path.exists(os.path.join(report["files"][0]["folder"], LOG_FILE_NAME)))
+
+    def test_update_rows_and_column(self):
+        updates_path = os.path.join(self.folder, "updates.json")
+        with open(updates_path, "w", encoding="utf-8") as f:
+            json.dump({"0": {"orderStatus": "Ready"}, "99": {"orderStatus": "Ready"}}, f)
+
+        code, report = self.run_cli("update-rows", self.paths[0], "--updates", f"@{updates_path}")
+        self.assertEqual(code, 0)
+        self.assertEqual(report["files"][0]["updated"], {"0": 2})
+        self.assertEqual(report["files"][0]["missing"], ["99"])
+
+        code, report = self.run_cli("update-column", self.paths[1], "--column", "orderStatus",
+                                    "--value", "Ready", "--dbids", "10", "12")
+        self.assertEqual(code, 0)
+        self.assertEqual(report["files"][0]["updated_rows"], 2)
+        self.assertEqual(self.column_values(self.paths[1], "orderStatus"), ["Ready", "Not Ready", "Ready"])
+
+    def test_missing_file_fails(self):
+        code, report = self.run_cli("update-column", os.path.join(self.folder, "missing.xlsx"),
+                                    "--column", "orderStatus", "--value", "Ready", "--dbids", "1")
+        self.assertEqual(code, 1)
+        self.assertEqual(report["failed"], 1)
+
+    def test_cli_never_imports_qt_or_desktop(self):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        completed = subprocess.run([sys.executable, "-c", HEADLESS_SCRIPT, "json", self.folder],
+                                   cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(json.loads(completed.stderr.strip().splitlines()[-1]), [])
+        self.assertEqual(json.loads(completed.stdout)["succeeded"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from openpyxl import Workbook, load_workbook
+
+from excel.dbid_index import normalize_dbid, index_path_for, load_dbid_index
+from excel.excel_writer import update_excel_column_by_dbid, update_excel_rows_by_dbid
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_file = os.path.join(self.temp_dir.name, "orders.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["dbId", "graphicStatus", "orderStatus"])
+        ws.append([123, "Old", "Old"])
+        ws.append(["456", "Old", "Old"])
+        ws.append([789.0, "Old", "Old"])
+        ws.append([None, "Old", "Old"])
+        wb.save(self.test_file)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_normalize_dbid(self):
+        self.assertEqual(normalize_dbid(123), "123")
+        self.assertEqual(normalize_dbid("123"), "123")
+        self.assertEqual(normalize_dbid(" 123 "), "123")
+        self.assertEqual(normalize_dbid(123.0), "123")
+        self.assertEqual(normalize_dbid(12.5), "12.5")
+        self.assertEqual(normalize_dbid(None), "")
+
+    def test_update_column_matches_mixed_types(self):
+        update_excel_column_by_dbid(self.test_file, ["123", 456, "789", None], "orderStatus", "Ready")
+        ws = load_workbook(self.test_file).active
+        self.assertEqual([ws.cell(row=r, column=3).value for r in range(2, 6)],
+                         ["Ready", "Ready", "Ready", "Old"])
+        self.assertFalse(os.path.exists(index_path_for(self.test_file)))
+
+    def test_sidecar_index_is_written_and_reused(self):
+        update_excel_column_by_dbid(self.test_file, [123], "orderStatus", "Ready", use_index=True)
+        rows = load_dbid_index(self.test_file, 1)
+        self.assertEqual(rows, {"123": [2], "456": [3], "789": [4]})
+
+        report = update_excel_rows_by_dbid(self.test_file, {456: {"graphicStatus": "Done"}}, use_index=True)
+        self.assertEqual(report["updated"], {456: 3})
+        self.assertIsNotNone(load_dbid_index(self.test_file, 1))
+
+    def test_sidecar_index_invalidated_by_file_change(self):
+        update_excel_column_by_dbid(self.test_file, [123], "orderStatus", "Ready", use_index=True)
+
+        wb = load_workbook(self.test_file)
+        ws = wb.active
+        ws.insert_rows(2)
+        ws.append([999, "Old", "Old"])
+        wb.save(self.test_file)
+
+        self.assertIsNone(load_dbid_index(self.test_file, 1))
+        report = update_excel_rows_by_dbid(self.test_file, {123: {"graphicStatus": "Done"}}, use_index=True)
+        self.assertEqual(report["updated"], {123: 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
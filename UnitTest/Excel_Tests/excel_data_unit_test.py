@@ -2,7 +2,7 @@ import os
 import tempfile
 import unittest
 from openpyxl import Workbook
-from excel.excel_data import excel_to_dict
+from excel.excel_data import excel_to_dict, excel_to_rows
 
 
 class MyTestCase(unittest.TestCase):
@@ -72,6 +72,20 @@ class MyTestCase(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             excel_to_dict("nonexistent_file.xlsx")
 
+    def test_excel_to_rows_pads_partial_rows(self):
+        headers = ["Name", "Age", "City"]
+        rows = [["Alice", 30], ["Bob"]]
+        file_path = self.create_excel_file(headers, rows)
+        result_headers, result_rows = excel_to_rows(file_path)
+        self.assertEqual(result_headers, headers)
+        self.assertEqual(result_rows, [("Alice", 30, None), ("Bob", None, None)])
+        os.unlink(file_path)
+
+    def test_excel_to_rows_only_headers(self):
+        file_path = self.create_excel_file(["Name", "Age"], [])
+        self.assertEqual(excel_to_rows(file_path), (["Name", "Age"], []))
+        os.unlink(file_path)
+
 
 
 if __name__ == '__main__':
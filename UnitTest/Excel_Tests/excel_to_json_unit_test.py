@@ -1,10 +1,13 @@
+import json
 import os
+import shutil
 import unittest
 from openpyxl import Workbook
 
 from tempfile import NamedTemporaryFile
 
-from excel.excel_to_json import excel_to_filtered_json, split_item_variants, extract_name_details, extract_type_details
+from excel.excel_to_json import excel_to_filtered_json, split_item_variants, extract_name_details, extract_type_details, \
+    stream_excel_to_filtered_json
 
 
 class MyTestCase(unittest.TestCase):
@@ -111,7 +114,53 @@ class MyTestCase(unittest.TestCase):
         self.assertIsNone(result)
         os.remove(path)
 
+    def test_stream_excel_to_filtered_json_writes_chunks(self):
+        wb = Workbook()
+        ws = wb.active
+        ws.append([
+            "Business Partner Reference Number",
+            "Item Name",
+            "Quantity",
+            "Line Comments"
+        ])
+        for i in range(30):
+            ws.append([
+                f"REF{i}",
+                "מדבקות שם - חד קרן - סט מדבקות 52+90",
+                1,
+                f"שם הילד שיודפס על גבי המדבקות: ילד{i}"
+            ])
+
+        with NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
+            path = tmp.name
+            wb.save(path)
 
+        output_dir = stream_excel_to_filtered_json(path)
+
+        self.assertIsNotNone(output_dir)
+        files = sorted(os.listdir(output_dir))
+        self.assertEqual(files, ["data_part_1.json", "data_part_2.json", "data_part_3.json"])
+
+        chunks = []
+        for i in range(1, 4):
+            with open(os.path.join(output_dir, f"data_part_{i}.json"), encoding="utf-8") as f:
+                chunks.append(json.load(f))
+        self.assertEqual([len(c) for c in chunks], [24, 24, 12])
+        self.assertEqual(chunks[0][0]["itemName"], "חד קרן_52")
+        self.assertEqual(chunks[0][1]["itemName"], "חד קרן_90")
+        self.assertEqual(chunks[2][-1]["name"], "ילד29")
+
+        shutil.rmtree(output_dir)
+        os.remove(path)
+
+    def test_stream_excel_to_filtered_json_empty_file(self):
+        wb = Workbook()
+        with NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
+            path = tmp.name
+            wb.save(path)
+
+        self.assertIsNone(stream_excel_to_filtered_json(path))
+        os.remove(path)
 
 
 if __name__ == '__main__':
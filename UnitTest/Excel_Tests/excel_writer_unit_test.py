@@ -1,8 +1,11 @@
 import json
 import os
+import tempfile
 import unittest
+from datetime import datetime
 from openpyxl  import Workbook,load_workbook
-from excel.excel_writer import parse_json_orders, split_orders, update_excel_row_by_dbid
+from excel.excel_writer import parse_json_orders, split_orders, update_excel_row_by_dbid, update_excel_rows_by_dbid, \
+    export_orders_to_excel, save_orders_to_excel
 
 
 class MyTestCase(unittest.TestCase):
@@ -38,6 +41,38 @@ class MyTestCase(unittest.TestCase):
         wb = load_workbook(self.test_file)
         ws = wb.active
         self.assertEqual(ws["B2"].value, "OldGraphic")
+
+    def test_update_excel_rows_batch_report(self):
+        wb = load_workbook(self.test_file)
+        ws = wb.active
+        ws.append(["456", "OldGraphic", "OldOrder"])
+        wb.save(self.test_file)
+
+        report = update_excel_rows_by_dbid(
+            self.test_file,
+            {
+                123: {"graphicStatus": "NewGraphic"},
+                456: {"orderStatus": "NewOrder"},
+                999: {"orderStatus": "NewOrder"},
+            }
+        )
+
+        self.assertEqual(report["updated"], {123: 2, 456: 3})
+        self.assertEqual(report["missing"], [999])
+        ws = load_workbook(self.test_file).active
+        self.assertEqual(ws["B2"].value, "NewGraphic")
+        self.assertEqual(ws["C2"].value, "OldOrder")
+        self.assertEqual(ws["C3"].value, "NewOrder")
+
+    def test_update_excel_rows_unknown_column_saves_nothing(self):
+        report = update_excel_rows_by_dbid(
+            self.test_file,
+            {123: {"graphicStatus": "NewGraphic", "missingColumn": "x"}}
+        )
+        self.assertIsNone(report)
+        ws = load_workbook(self.test_file).active
+        self.assertEqual(ws["B2"].value, "OldGraphic")
+
     def test_parse_json_orders_with_invalid_json(self):
         bad_json = '{"not": "a list"}'
         result = parse_json_orders(bad_json)
@@ -63,6 +98,56 @@ class MyTestCase(unittest.TestCase):
     def test_split_orders_empty(self):
         self.assertEqual(split_orders([], 5), [])
 
+    def test_export_orders_to_excel_parallel(self):
+        orders = [{"dbId": i, "itemName": f"item {i}", "orderStatus": "Ready"} for i in range(50)]
+        today = datetime.today().strftime("%Y-%m-%d")
+        with tempfile.TemporaryDirectory() as output_dir:
+            report = export_orders_to_excel(orders, output_dir, max_per_file=24, workers=2)
+
+            self.assertEqual(report["succeeded"], 3)
+            self.assertEqual(report["failed"], 0)
+            self.assertEqual([f["orders"] for f in report["files"]], [24, 24, 2])
+            self.assertEqual(
+                [os.path.basename(f["path"]) for f in report["files"]],
+                [f"orders_{today}_{i}.xlsx" for i in range(1, 4)]
+            )
+
+            ws = load_workbook(report["files"][2]["path"]).active
+            self.assertEqual(ws.title, "Orders")
+            self.assertEqual([c.value for c in ws[1]], ["dbId", "itemName", "orderStatus"])
+            self.assertEqual([c.value for c in ws[3]], [49, "item 49", "Ready"])
+
+    def test_save_orders_to_excel_reports_failed_chunk(self):
+        orders = [{"dbId": 1, "details": {"nested": True}}]
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.assertFalse(save_orders_to_excel(orders, output_dir))
+            self.assertTrue(save_orders_to_excel([{"dbId": 1}], output_dir))
+
+    def test_export_orders_from_generator_writes_chunks_as_they_fill(self):
+        seen_files = []
+
+        def orders(output_dir):
+            for i in range(30):
+                if i == 25:
+                    seen_files.extend(os.listdir(os.path.join(output_dir, os.listdir(output_dir)[0])))
+                yield {"dbId": i, "itemName": f"item {i}"}
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            report = export_orders_to_excel(orders(output_dir), output_dir, max_per_file=24)
+
+            self.assertEqual([f["orders"] for f in report["files"]], [24, 6])
+            self.assertEqual(len([name for name in seen_files if name.endswith(".xlsx")]), 1)
+
+    def test_export_orders_invalid_item_mid_stream(self):
+        orders = ({"dbId": i} if i != 30 else "broken" for i in range(40))
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.assertFalse(save_orders_to_excel(orders, output_dir, max_per_file=24))
+
+    def test_export_orders_empty_generator_creates_no_folder(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.assertIsNone(export_orders_to_excel(iter(()), output_dir))
+            self.assertEqual(os.listdir(output_dir), [])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import unittest
+from openpyxl import Workbook
+
+from excel.excel_to_json import stream_excel_to_filtered_json
+from excel.incremental_export import incremental_excel_to_filtered_json, manifest_path_for
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "orders.xlsx")
+        self.output_dir = os.path.join(self.temp_dir.name, "orders_jsons")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def save_orders(self, names):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Business Partner Reference Number", "Item Name", "Quantity", "Line Comments"])
+        for i, name in enumerate(names):
+            ws.append([
+                f"REF{i}",
+                "מדבקות שם - חד קרן - סט מדבקות 52+90",
+                1,
+                f"שם הילד שיודפס על גבי המדבקות: {name}"
+            ])
+        wb.save(self.path)
+
+    def read_chunks(self, output_dir):
+        files = sorted(os.listdir(output_dir), key=lambda name: int(name.split("_")[-1].split(".")[0]))
+        chunks = []
+        for name in files:
+            with open(os.path.join(output_dir, name), encoding="utf-8") as f:
+                chunks.append(json.load(f))
+        return files, chunks
+
+    def chunk_mtimes(self):
+        return {name: os.stat(os.path.join(self.output_dir, name)).st_mtime_ns
+                for name in os.listdir(self.output_dir)}
+
+    def test_first_run_matches_full_export(self):
+        self.save_orders([f"ילד{i}" for i in range(30)])
+
+        report = incremental_excel_to_filtered_json(self.path)
+        self.assertEqual(report["chunks_written"], 3)
+        self.assertEqual(report["rows_processed"], 30)
+        self.assertTrue(os.path.exists(manifest_path_for(self.path)))
+
+        full_dir = stream_excel_to_filtered_json(self.path)
+        self.assertEqual(self.read_chunks(self.output_dir), self.read_chunks(full_dir))
+
+    def test_unchanged_source_rewrites_nothing(self):
+        self.save_orders([f"ילד{i}" for i in range(30)])
+        incremental_excel_to_filtered_json(self.path)
+        before = self.chunk_mtimes()
+
+        report = incremental_excel_to_filtered_json(self.path)
+
+        self.assertEqual(report["chunks_written"], 0)
+        self.assertEqual(report["chunks_unchanged"], 3)
+        self.assertEqual(report["rows_processed"], 0)
+        self.assertEqual(report["rows_reused"], 30)
+        self.assertEqual(self.chunk_mtimes(), before)
+
+    def test_changed_row_rewrites_only_its_chunk(self):
+        names = [f"ילד{i}" for i in range(30)]
+        self.save_orders(names)
+        incremental_excel_to_filtered_json(self.path)
+        before = self.chunk_mtimes()
+
+        names[20] = "שירה"
+        self.save_orders(names)
+        report = incremental_excel_to_filtered_json(self.path)
+
+        self.assertEqual(report["rows_processed"], 1)
+        self.assertEqual(report["chunks_written"], 1)
+        after = self.chunk_mtimes()
+        self.assertEqual(after["data_part_1.json"], before["data_part_1.json"])
+        self.assertNotEqual(after["data_part_2.json"], before["data_part_2.json"])
+        self.assertEqual(after["data_part_3.json"], before["data_part_3.json"])
+
+        _, chunks = self.read_chunks(self.output_dir)
+        self.assertEqual(chunks[1][16]["name"], "שירה")
+
+    def test_appended_and_removed_rows(self):
+        names = [f"ילד{i}" for i in range(30)]
+        self.save_orders(names)
+        incremental_excel_to_filtered_json(self.path)
+
+        self.save_orders(names + ["דנה", "נועה"])
+        report = incremental_excel_to_filtered_json(self.path)
+        self.assertEqual(report["rows_processed"], 2)
+        self.assertEqual(report["chunks_written"], 1)
+        self.assertEqual(report["chunks_unchanged"], 2)
+
+        self.save_orders(names[:10])
+        report = incremental_excel_to_filtered_json(self.path)
+        self.assertEqual(report["rows_processed"], 0)
+        self.assertEqual(report["chunks_removed"], 2)
+        files, chunks = self.read_chunks(self.output_dir)
+        self.assertEqual(files, ["data_part_1.json"])
+        self.assertEqual(len(chunks[0]), 20)
+
+    def test_inserted_row_shifts_chunks_without_reusing_overwritten_files(self):
+        names = [f"ילד{i}" for i in range(30)]
+        self.save_orders(names)
+        incremental_excel_to_filtered_json(self.path)
+
+        self.save_orders(["ראשון"] + names)
+        incremental_excel_to_filtered_json(self.path)
+
+        self.save_orders(["ראשון"] + names)
+        expected_dir = stream_excel_to_filtered_json(self.path)
+        self.assertEqual(self.read_chunks(self.output_dir), self.read_chunks(expected_dir))
+
+    def test_tampered_chunk_is_rebuilt(self):
+        self.save_orders([f"ילד{i}" for i in range(30)])
+        incremental_excel_to_filtered_json(self.path)
+        with open(os.path.join(self.output_dir, "data_part_2.json"), "w", encoding="utf-8") as f:
+            f.write("[]")
+
+        report = incremental_excel_to_filtered_json(self.path)
+
+        self.assertEqual(report["chunks_written"], 1)
+        self.assertEqual(report["rows_processed"], 12)
+        _, chunks = self.read_chunks(self.output_dir)
+        self.assertEqual(len(chunks[1]), 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from openpyxl import Workbook
+
+from excel.json_backends import JsonArrayWriter, StdlibSerializer, get_serializer, orjson
+from excel.excel_to_json import convert_excel_to_json, stream_excel_to_json
+
+ROWS = [
+    {"itemName": "מדבקות שם - חד קרן", "quantity": 1, "name": "יוסי"},
+    {"itemName": "שקופות", "quantity": None, "name": " ", "nested": {"a": [1, 2]}},
+]
+
+
+def backends():
+    return ["stdlib", "orjson"] if orjson is not None else ["stdlib"]
+
+
+class MyTestCase(unittest.TestCase):
+    def write_array(self, items, serializer):
+        buffer = io.BytesIO()
+        with JsonArrayWriter(buffer, serializer) as writer:
+            writer.write_many(items)
+        return buffer.getvalue()
+
+    def test_indented_stream_matches_json_dump(self):
+        expected = json.dumps(ROWS, ensure_ascii=False, indent=2).encode("utf-8")
+        for backend in backends():
+            self.assertEqual(self.write_array(ROWS, get_serializer(backend)), expected, backend)
+
+    def test_compact_stream(self):
+        for backend in backends():
+            data = self.write_array(ROWS, get_serializer(backend, indent=False))
+            self.assertNotIn(b"\n", data)
+            self.assertEqual(json.loads(data), ROWS)
+
+    def test_empty_array(self):
+        self.assertEqual(self.write_array([], StdlibSerializer()), b"[]")
+        self.assertEqual(self.write_array([], StdlibSerializer(indent=False)), b"[]")
+
+    def test_dates_and_non_string_keys(self):
+        value = {"date": datetime(2025, 6, 25, 10, 30), 1: "x"}
+        for backend in backends():
+            self.assertEqual(json.loads(get_serializer(backend).dumps(value)),
+                             {"date": "2025-06-25T10:30:00", "1": "x"})
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_serializer("yaml")
+
+    def test_stream_excel_to_json_matches_convert(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "orders.xlsx")
+            wb = Workbook()
+            ws = wb.active
+            ws.append(["dbId", "Item Name", None, "Date"])
+            for i in range(30):
+                ws.append([i, f"item {i}", "skip", datetime(2025, 1, 1 + i % 28)])
+            wb.save(path)
+
+            data = convert_excel_to_json(path, serializer=get_serializer("stdlib"))
+            with open(os.path.join(temp_dir, "orders.json"), "rb") as f:
+                converted = f.read()
+
+            output_path = stream_excel_to_json(path, serializer=get_serializer("stdlib"))
+            with open(output_path, "rb") as f:
+                streamed = f.read()
+
+            self.assertEqual(streamed, converted)
+            self.assertEqual(len(data), 30)
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["orders.json", "orders.xlsx"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from excel.line_item_classifier import LineItemClassifier, extract_type_details, extract_name_details
+
+
+class MyTestCase(unittest.TestCase):
+    def test_classify_matches_extract_functions(self):
+        classifier = LineItemClassifier()
+        samples = [
+            ("מדבקות שם - חברים - סט מדבקות 52+90", "שם הילד שיודפס על גבי המדבקות: יוסי"),
+            ("מדבקות שם קטנות במיוחד - ברקע חד קרן ללא איורים", "שם הילדה שיודפס על גבי המדבקות: שירה\nהערה"),
+            ("שקופות - קשת בענן ללא איורים 90", ""),
+            ("מדבקות שם - פרפרים - כתב יד", None),
+            ("לא תואם שום תבנית", 12345),
+        ]
+        for item_name, comments in samples:
+            self.assertEqual(
+                classifier.classify(item_name, comments),
+                (extract_type_details(item_name), extract_name_details(comments))
+            )
+
+    def test_classify_many_keeps_order_and_counts_hits(self):
+        classifier = LineItemClassifier()
+        pairs = [
+            ("מדבקות שם - חברים - סט מדבקות 52+90", "שם הילד שיודפס על גבי המדבקות: יוסי"),
+            ("מדבקות שם - חברים - סט מדבקות 52+90", "שם הילד שיודפס על גבי המדבקות: דני"),
+            ("שקופות - קשת בענן ללא איורים 90", "שם הילד שיודפס על גבי המדבקות: יוסי"),
+        ]
+        result = list(classifier.classify_many(pairs))
+        self.assertEqual(result, [
+            ("חברים_52+90", "יוסי"),
+            ("חברים_52+90", "דני"),
+            ("קשת בענן_90", "יוסי"),
+        ])
+
+        info = classifier.cache_info()
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["misses"], 4)
+        self.assertEqual(info["type_entries"], 2)
+        self.assertEqual(info["name_entries"], 2)
+
+    def test_cache_is_bounded_lru(self):
+        classifier = LineItemClassifier(maxsize=2)
+        classifier.type_details("מדבקות שם - א - 52")
+        classifier.type_details("מדבקות שם - ב - 52")
+        classifier.type_details("מדבקות שם - א - 52")
+        classifier.type_details("מדבקות שם - ג - 52")
+
+        info = classifier.cache_info()
+        self.assertEqual(info["type_entries"], 2)
+
+        classifier.type_details("מדבקות שם - א - 52")
+        self.assertEqual(classifier.cache_info()["hits"], 2)
+        classifier.type_details("מדבקות שם - ב - 52")
+        self.assertEqual(classifier.cache_info()["misses"], 4)
+
+    def test_invalid_values_are_not_cached(self):
+        classifier = LineItemClassifier()
+        self.assertEqual(classifier.classify(None, None), (None, None))
+        self.assertEqual(classifier.classify("", 5), (None, None))
+        info = classifier.cache_info()
+        self.assertEqual(info["hits"] + info["misses"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
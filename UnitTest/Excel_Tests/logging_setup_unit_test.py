@@ -0,0 +1,90 @@
+import logging as lg
+import logging.handlers
+import os
+import shutil
+import tempfile
+import unittest
+
+from excel.excel_writer import save_orders_to_excel
+from excel.logging_setup import LOG_FILE_NAME, log_directory, setup_logging, shutdown_logging
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.logger = lg.getLogger("OrderExport")
+
+    def tearDown(self):
+        shutdown_logging()
+        shutil.rmtree(self.temp_dir)
+
+    def queue_handlers(self):
+        return [h for h in self.logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+
+    def read_log(self, folder):
+        with open(os.path.join(folder, LOG_FILE_NAME), encoding="utf-8") as f:
+            return f.read()
+
+    def test_repeated_setup_adds_one_handler(self):
+        for _ in range(3):
+            setup_logging(self.temp_dir)
+        self.assertEqual(len(self.queue_handlers()), 1)
+        self.assertFalse(any(isinstance(h, lg.FileHandler) for h in self.logger.handlers))
+
+        self.logger.info("only once")
+        shutdown_logging()
+        self.assertEqual(self.read_log(self.temp_dir).count("only once"), 1)
+
+    def test_switching_folder_moves_the_file_handler(self):
+        first = os.path.join(self.temp_dir, "first")
+        second = os.path.join(self.temp_dir, "second")
+
+        setup_logging(first)
+        self.logger.info("to first")
+        setup_logging(second)
+        self.logger.info("to second")
+        shutdown_logging()
+
+        self.assertEqual(len(self.queue_handlers()), 0)
+        self.assertIn("to first", self.read_log(first))
+        self.assertNotIn("to second", self.read_log(first))
+        self.assertIn("to second", self.read_log(second))
+        self.assertIsNone(log_directory())
+
+    def test_pinned_folder_is_not_replaced(self):
+        pinned = os.path.join(self.temp_dir, "pinned")
+        output = os.path.join(self.temp_dir, "output")
+
+        setup_logging(pinned, pinned=True)
+        setup_logging(output)
+        self.logger.info("still pinned")
+        self.assertEqual(log_directory(), os.path.abspath(pinned))
+        shutdown_logging()
+
+        self.assertIn("still pinned", self.read_log(pinned))
+        self.assertFalse(os.path.exists(output))
+
+    def test_repeated_saves_do_not_duplicate_lines(self):
+        orders = [{"dbId": 1, "name": "יוסי"}]
+        for _ in range(3):
+            self.assertTrue(save_orders_to_excel(orders, output_dir=self.temp_dir))
+
+        self.assertEqual(len(self.queue_handlers()), 1)
+        folder = log_directory()
+        shutdown_logging()
+        log = self.read_log(folder)
+        self.assertEqual(log.count("Output directory created"), 3)
+        self.assertRegex(log.splitlines()[0], r"^\d{4}-\d{2}-\d{2} .* - INFO - ")
+
+    def test_saves_keep_an_explicit_level(self):
+        self.logger.setLevel(lg.WARNING)
+        self.addCleanup(self.logger.setLevel, lg.INFO)
+        self.assertTrue(save_orders_to_excel([{"dbId": 1, "name": "יוסי"}], output_dir=self.temp_dir))
+        self.assertEqual(self.logger.level, lg.WARNING)
+
+        setup_logging(self.temp_dir, level=lg.DEBUG)
+        self.assertEqual(self.logger.level, lg.DEBUG)
+
+
+if __name__ == '__main__':
+    unittest.main()
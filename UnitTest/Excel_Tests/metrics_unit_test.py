@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+from openpyxl import Workbook
+
+from excel import metrics
+from excel.excel_to_json import convert_excel_to_json, excel_to_filtered_json
+from excel.excel_writer import save_orders_to_excel
+from excel.metrics import (
+    NULL_METRICS, add_metrics_listener, current_metrics, enable_metrics, format_summary, pipeline_run,
+    remove_metrics_listener
+)
+from excel.progress import ConversionCancelled
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.was_enabled = metrics.metrics_enabled()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "orders.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Business Partner Reference Number", "Item Name", "Quantity", "Line Comments"])
+        for i in range(10):
+            ws.append([f"REF{i}", "מדבקות שם - חד קרן - סט מדבקות 52+90", 1,
+                       f"שם הילד שיודפס על גבי המדבקות: ילד{i}"])
+        wb.save(self.path)
+
+        self.records = []
+        add_metrics_listener(self.records.append)
+
+    def tearDown(self):
+        remove_metrics_listener(self.records.append)
+        enable_metrics(self.was_enabled)
+        shutil.rmtree(self.temp_dir)
+
+    def test_disabled_metrics_are_a_no_op(self):
+        enable_metrics(False)
+        with pipeline_run("job") as run:
+            self.assertIs(run, NULL_METRICS)
+            with run.span("stage"):
+                pass
+        self.assertIsNotNone(excel_to_filtered_json(self.path))
+        self.assertEqual(self.records, [])
+        self.assertIs(current_metrics(), NULL_METRICS)
+
+    def test_filtered_json_record_has_stages_rows_and_bytes(self):
+        enable_metrics()
+        excel_to_filtered_json(self.path)
+
+        self.assertEqual(len(self.records), 1)
+        record = self.records[0]
+        self.assertEqual(record["run"], "excel_to_filtered_json")
+        self.assertEqual(record["status"], "ok")
+        self.assertEqual(record["rows"], 10)
+        self.assertEqual(record["counters"]["items"], 20)
+        self.assertEqual(record["counters"]["files"], 1)
+        self.assertGreater(record["bytes_written"], 0)
+        for stage in ("read_workbook", "filter_rows", "classify", "split_item_variants", "write_json"):
+            self.assertIn(stage, record["stages"])
+
+    def test_nested_calls_add_to_outer_run(self):
+        enable_metrics()
+        with pipeline_run("batch"):
+            convert_excel_to_json(self.path)
+            convert_excel_to_json(self.path)
+
+        self.assertEqual([r["run"] for r in self.records], ["batch"])
+        self.assertEqual(self.records[0]["rows"], 20)
+        self.assertEqual(self.records[0]["counters"]["files"], 2)
+
+    def test_save_orders_counts_files_and_bytes(self):
+        enable_metrics()
+        orders = [{"dbId": i, "name": f"ילד{i}"} for i in range(30)]
+        self.assertTrue(save_orders_to_excel(orders, output_dir=self.temp_dir, max_per_file=24))
+
+        record = self.records[-1]
+        self.assertEqual(record["run"], "save_orders_to_excel")
+        self.assertEqual(record["rows"], 30)
+        self.assertEqual(record["counters"]["files"], 2)
+        self.assertGreater(record["bytes_written"], 0)
+        self.assertIn("write_excel", record["stages"])
+
+    def test_cancelled_run_is_recorded(self):
+        enable_metrics()
+        with self.assertRaises(ConversionCancelled):
+            with pipeline_run("job"):
+                raise ConversionCancelled()
+        self.assertEqual(self.records[0]["status"], "cancelled")
+
+    def test_format_summary(self):
+        record = {"rows": 1200, "seconds": 0.5, "rows_per_sec": 2400.0, "bytes_written": 2048,
+                  "stages": {"read_workbook": 0.3, "write_json": 0.1}}
+        summary = format_summary(record)
+        self.assertIn("1,200 rows in 0.50s (2,400 rows/s), 2.0 KB written", summary)
+        self.assertIn("read_workbook: 0.300s", summary)
+        self.assertEqual(format_summary(None), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from openpyxl import Workbook
+
+from excel.excel_to_json import convert_excel_to_json, excel_to_filtered_json
+from excel.progress import ConversionCancelled, ProgressTracker
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "orders.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Business Partner Reference Number", "Item Name", "Quantity", "Line Comments"])
+        for i in range(600):
+            ws.append([f"REF{i}", "שקופות - קשת בענן ללא איורים 90", 1, ""])
+        wb.save(self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_progress_reports_row_counts(self):
+        reports = []
+        tracker = ProgressTracker(lambda done, total: reports.append((done, total)), every=250)
+        data = convert_excel_to_json(self.path, progress=tracker)
+        self.assertEqual(len(data), 600)
+        # One pass while parsing the sheet, where the row count is only known
+        # at the end, and one while converting the rows.
+        self.assertEqual(reports, [(0, 0), (250, 0), (500, 0), (600, 600),
+                                   (0, 600), (250, 600), (500, 600), (600, 600)])
+
+    def test_cancel_before_start_raises(self):
+        tracker = ProgressTracker()
+        tracker.cancel()
+        with self.assertRaises(ConversionCancelled):
+            excel_to_filtered_json(self.path, progress=tracker)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["orders.xlsx"])
+
+    def test_cancel_inside_loop_raises(self):
+        tracker = ProgressTracker(every=100)
+        tracker.callback = lambda done, total: tracker.cancel() if done >= 100 else None
+        with self.assertRaises(ConversionCancelled):
+            convert_excel_to_json(self.path, progress=tracker)
+        self.assertLess(tracker.rows, 600)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, "orders.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
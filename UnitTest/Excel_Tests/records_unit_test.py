@@ -0,0 +1,41 @@
+import unittest
+
+from excel.records import Record, RecordHeader, records_from_rows, to_dicts
+from excel.excel_to_json import split_item_variants
+
+
+class MyTestCase(unittest.TestCase):
+    def test_records_share_header(self):
+        records = list(records_from_rows(["Name", "Age"], [("Alice", 30), ("Bob", 25)]))
+        self.assertIs(records[0].header, records[1].header)
+        self.assertEqual(records[0]["Name"], "Alice")
+        self.assertEqual(records[1].get("Age"), 25)
+        self.assertIsNone(records[1].get("City"))
+        self.assertIn("Age", records[0])
+        self.assertEqual(list(records[0].keys()), ["Name", "Age"])
+
+    def test_record_compares_equal_to_dict(self):
+        record = Record(RecordHeader(["Name", "Age"]), ["Alice", 30])
+        self.assertEqual(record, {"Name": "Alice", "Age": 30})
+        self.assertEqual(to_dicts([record, {"x": 1}]), [{"Name": "Alice", "Age": 30}, {"x": 1}])
+
+    def test_replace_returns_new_record(self):
+        record = Record(RecordHeader(["itemName", "name"]), ["a", "b"])
+        changed = record.replace({"name": "c"})
+        self.assertEqual(record["name"], "b")
+        self.assertEqual(changed.values, ("a", "c"))
+        self.assertIs(changed.header, record.header)
+
+    def test_records_have_no_instance_dict(self):
+        record = Record(RecordHeader(["a"]), [1])
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_split_item_variants_with_record(self):
+        record = Record(RecordHeader(["itemName", "other"]), ["חד קרן_52+90", "value"])
+        result = split_item_variants(record)
+        self.assertEqual([r["itemName"] for r in result], ["חד קרן_52", "חד קרן_90"])
+        self.assertTrue(all(isinstance(r, Record) for r in result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+import zipfile
+
+from openpyxl import Workbook
+
+from excel.excel_data import excel_to_dict, excel_to_rows
+from excel.excel_to_json import convert_excel_to_json, excel_to_filtered_json, stream_excel_to_filtered_json, \
+    stream_excel_to_json
+from excel.progress import ProgressTracker
+from excel.workbook_cache import parse_sheet
+
+ROWS = 100
+HEADERS = ["Business Partner Reference Number", "Item Name", "Quantity", "Line Comments"]
+
+
+def write_workbook_with_dimension(path: str, dimension: str) -> None:
+    # Saves a ROWS-row workbook, then rewrites the sheet's <dimension> record
+    # the way stale exports carry it.
+    wb = Workbook()
+    ws = wb.active
+    ws.append(HEADERS)
+    for i in range(ROWS):
+        # Every other row leaves the last column empty, so it is stored short.
+        ws.append([f"REF{i}", "שקופות - קשת בענן ללא איורים 90", 1, "שם: יוסי" if i % 2 else None])
+    source = path + ".src"
+    wb.save(source)
+
+    with zipfile.ZipFile(source) as original, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as patched:
+        for info in original.infolist():
+            data = original.read(info.filename)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', f'<dimension ref="{dimension}"'.encode(), data)
+            patched.writestr(info, data)
+    os.remove(source)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "orders.xlsx")
+        write_workbook_with_dimension(self.path, "A1:D10")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_sheet_ignores_stale_dimension(self):
+        reports = []
+        sheet = parse_sheet(self.path, ProgressTracker(lambda done, total: reports.append((done, total))))
+        self.assertEqual(sheet.headers, tuple(HEADERS))
+        self.assertEqual(len(sheet.rows), ROWS)
+        self.assertTrue(all(len(row) == len(HEADERS) for row in sheet.rows))
+        self.assertEqual(sheet.rows[0][3], None)
+        self.assertEqual(reports[-1], (ROWS, ROWS))
+
+    def test_entry_points_return_every_row(self):
+        self.assertEqual(len(excel_to_dict(self.path)), ROWS)
+        self.assertEqual(len(excel_to_rows(self.path)[1]), ROWS)
+        self.assertEqual(len(excel_to_filtered_json(self.path)), ROWS)
+        self.assertEqual(len(convert_excel_to_json(self.path)), ROWS)
+
+    def test_stream_filtered_json_writes_every_row(self):
+        reports = []
+        output_dir = stream_excel_to_filtered_json(
+            self.path, chunk_size=24, progress=ProgressTracker(lambda done, total: reports.append((done, total))))
+        self.assertEqual(len(os.listdir(output_dir)), 5)
+        # The stale record must not be used as the progress total.
+        self.assertEqual(reports[0], (0, 0))
+        self.assertEqual(reports[-1], (ROWS, ROWS))
+
+    def test_stream_json_writes_every_row(self):
+        output_path = stream_excel_to_json(self.path)
+        with open(output_path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), ROWS)
+
+
+if __name__ == '__main__':
+    unittest.main()
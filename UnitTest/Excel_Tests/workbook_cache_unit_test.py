@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from openpyxl import Workbook
+
+from excel import workbook_cache
+from excel.workbook_cache import WorkbookCache
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_excel_file(self, name, rows):
+        path = os.path.join(self.temp_dir.name, name)
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Name", "Age"])
+        for row in rows:
+            ws.append(row)
+        wb.save(path)
+        return path
+
+    def test_second_read_is_served_from_cache(self):
+        cache = WorkbookCache()
+        path = self.create_excel_file("a.xlsx", [["Alice", 30]])
+
+        first = cache.get(path)
+        with mock.patch.object(workbook_cache, "load_workbook") as load:
+            second = cache.get(path)
+            load.assert_not_called()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.headers, ("Name", "Age"))
+        self.assertEqual(first.rows, [("Alice", 30)])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_changed_file_is_parsed_again(self):
+        cache = WorkbookCache()
+        path = self.create_excel_file("a.xlsx", [["Alice", 30]])
+        cache.get(path)
+
+        time.sleep(0.01)
+        self.create_excel_file("a.xlsx", [["Alice", 30], ["Bob", 25]])
+        self.assertEqual(len(cache.get(path).rows), 2)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_lru_eviction_by_cells(self):
+        cache = WorkbookCache(max_cells=10)
+        a = self.create_excel_file("a.xlsx", [["Alice", 30], ["Bob", 25]])
+        b = self.create_excel_file("b.xlsx", [["Carol", 40]])
+        c = self.create_excel_file("c.xlsx", [["Dan", 50]])
+
+        cache.get(a)
+        cache.get(b)
+        cache.get(c)
+
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertLessEqual(stats["cells"], 10)
+        cache.get(a)
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_sheet_larger_than_bound_is_not_cached(self):
+        cache = WorkbookCache(max_cells=2)
+        path = self.create_excel_file("a.xlsx", [["Alice", 30]])
+        self.assertEqual(cache.get(path).rows, [("Alice", 30)])
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import argparse
+import io
+import json
+import time
+
+from excel.json_backends import BACKENDS, JsonArrayWriter, get_serializer, orjson
+
+
+def sample_rows(count: int) -> list[dict]:
+    return [
+        {
+            "referenceNumber": f"SO-{100000 + i}",
+            "itemName": "חד קרן_52" if i % 2 else "קשת בענן_90",
+            "quantity": i % 5 + 1,
+            "name": f"ילד {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_backend(backend: str, indent: bool, rows: list[dict], repeat: int) -> dict:
+    serializer = get_serializer(backend, indent)
+    size = len(serializer.dumps(rows))
+
+    def whole():
+        serializer.dumps(rows)
+
+    def streamed():
+        with JsonArrayWriter(io.BytesIO(), serializer) as writer:
+            writer.write_many(rows)
+
+    results = {}
+    for mode, func in (("document", whole), ("stream", streamed)):
+        seconds = measure(func, repeat)
+        results[mode] = {
+            "seconds": round(seconds, 5),
+            "rows_per_sec": round(len(rows) / seconds),
+            "mb_per_sec": round(size / seconds / 1_000_000, 2),
+        }
+    return {"backend": serializer.name, "indent": indent, "bytes": size, **results}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="JSON serializer throughput per backend")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = sample_rows(args.rows)
+    backends = [b for b in BACKENDS if b != "auto" and (b != "orjson" or orjson is not None)]
+    results = [bench_backend(b, indent, rows, args.repeat) for b in backends for indent in (True, False)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{args.rows} rows, best of {args.repeat}")
+        for r in results:
+            layout = "indent " if r["indent"] else "compact"
+            print(f"{r['backend']:>7} {layout}  document {r['document']['mb_per_sec']:>8} MB/s"
+                  f"  stream {r['stream']['mb_per_sec']:>8} MB/s  ({r['bytes']} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
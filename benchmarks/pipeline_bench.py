@@ -0,0 +1,159 @@
+import argparse
+import contextlib
+import io
+import json
+import logging as lg
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.workbooks import order_dicts, write_order_workbook
+from excel.excel_data import excel_to_dict
+from excel.excel_to_json import convert_excel_to_json, excel_to_filtered_json
+from excel.excel_writer import save_orders_to_excel, update_excel_column_by_dbid, update_excel_rows_by_dbid
+from excel.logging_setup import shutdown_logging
+from excel.workbook_cache import default_workbook_cache
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 1.25
+UPDATES_PER_RUN = 100
+
+
+def measure(func: Callable, repeat: int, setup: Optional[Callable] = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def remove_outputs(workdir: str, keep: str) -> None:
+    for name in os.listdir(workdir):
+        path = os.path.join(workdir, name)
+        if path == keep:
+            continue
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
+def operations(source: str, workdir: str, rows: int) -> Dict[str, Callable]:
+    orders = order_dicts(rows)
+    target = os.path.join(workdir, "updated.xlsx")
+    step = max(rows // UPDATES_PER_RUN, 1)
+    dbids = [100000 + i for i in range(0, rows, step)][:UPDATES_PER_RUN]
+    updates = {dbid: {"orderStatus": "Ready", "graphicStatus": "Approved"} for dbid in dbids}
+
+    return {
+        "excel_to_dict": lambda: excel_to_dict(source),
+        "excel_to_filtered_json": lambda: excel_to_filtered_json(source),
+        "convert_excel_to_json": lambda: convert_excel_to_json(source),
+        "save_orders_to_excel": lambda: save_orders_to_excel(orders, output_dir=os.path.join(workdir, "orders")),
+        "update_excel_rows_by_dbid": lambda: update_excel_rows_by_dbid(source, updates, save_as=target),
+        "update_excel_column_by_dbid": lambda: update_excel_column_by_dbid(
+            source, dbids, "graphicStatus", "Approved", save_as=target),
+    }
+
+
+def bench_size(rows: int, repeat: int, only: Optional[List[str]] = None) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, f"orders_{rows}.xlsx")
+        start = time.perf_counter()
+        write_order_workbook(source, rows)
+        print(f"generated {rows} rows in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+        def cold_start():
+            # Every operation is timed from a cold workbook cache and without
+            # the outputs of the previous repetition. save_orders_to_excel
+            # keeps export_orders.log open inside orders/<date>/, so the file
+            # handler is closed before that folder is deleted.
+            default_workbook_cache.invalidate()
+            shutdown_logging()
+            remove_outputs(workdir, keep=source)
+
+        try:
+            for name, func in operations(source, workdir, rows).items():
+                if only and name not in only:
+                    continue
+                with contextlib.redirect_stdout(io.StringIO()):
+                    seconds = measure(func, repeat, setup=cold_start)
+                results.append({
+                    "operation": name,
+                    "rows": rows,
+                    "seconds": round(seconds, 4),
+                    "rows_per_sec": round(rows / seconds) if seconds else None,
+                })
+                print(f"{name:>28} {rows:>7} rows  {seconds:8.3f}s", file=sys.stderr)
+        finally:
+            shutdown_logging()
+    return results
+
+
+def run(sizes, repeat: int, only: Optional[List[str]] = None) -> Dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": [r for rows in sizes for r in bench_size(rows, repeat, only)],
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    previous = {(r["operation"], r["rows"]): r["seconds"] for r in baseline.get("results", [])}
+    regressions = []
+    for r in current["results"]:
+        before = previous.get((r["operation"], r["rows"]))
+        if before and r["seconds"] > before * threshold:
+            regressions.append({
+                "operation": r["operation"],
+                "rows": r["rows"],
+                "baseline": before,
+                "seconds": r["seconds"],
+                "ratio": round(r["seconds"] / before, 2),
+            })
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Order pipeline benchmarks on synthetic Hebrew workbooks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="run only these operations")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="fail when slower than this results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown ratio against the baseline (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    lg.getLogger("OrderExport").setLevel(lg.WARNING)
+    current = run(args.sizes, args.repeat, args.only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+    else:
+        print(json.dumps(current, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, current, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['operation']} @ {r['rows']} rows: "
+                  f"{r['seconds']}s vs {r['baseline']}s (x{r['ratio']})", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+import random
+from typing import Dict, Iterator, List
+
+from openpyxl import Workbook
+
+ORDER_HEADERS = [
+    "dbId",
+    "Business Partner Reference Number",
+    "Item Name",
+    "Quantity",
+    "Line Comments",
+    "orderStatus",
+    "graphicStatus",
+]
+
+DESIGNS = ["חד קרן", "קשת בענן", "חברים", "דינוזאורים", "פרפרים", "חלל", "נסיכות", "כדורגל"]
+FONTS = ["כתב יד", "כתב דפוס", "כתב מעוגל"]
+SIZES = ["52", "90", "52+90"]
+CHILD_NAMES = ["יוסי", "שירה", "נועה", "איתי", "מיכל", "דניאל", "תמר", "אורי", "רוני", "הדר"]
+CHILD_TITLES = ["שם הילד", "שם הילדה", "שם הילד/ה", "ש היל"]
+ORDER_STATUSES = ["Ready", "Not Ready"]
+GRAPHIC_STATUSES = ["Approved", "Rejected", "In Process"]
+
+
+def item_name(rng: random.Random, kind: int) -> str:
+    # One value per extract_type_details branch, plus an unmatched item.
+    design = rng.choice(DESIGNS)
+    if kind == 0:
+        return f"מדבקות שם - {design} - סט מדבקות {rng.choice(SIZES)}"
+    if kind == 1:
+        return f"מדבקות שם קטנות במיוחד - ברקע {design} ללא איורים {rng.choice(SIZES)}"
+    if kind == 2:
+        return f"שקופות - {design} ללא איורים {rng.choice(SIZES)}"
+    if kind == 3:
+        return f"מדבקות שם - {design} - {rng.choice(FONTS)}"
+    return f"כרטיס ברכה - {design}"
+
+
+def line_comments(rng: random.Random, index: int) -> str:
+    name = rng.choice(CHILD_NAMES)
+    title = rng.choice(CHILD_TITLES)
+    variant = index % 4
+    if variant == 0:
+        return f"{title} שיודפס על גבי המדבקות: {name}"
+    if variant == 1:
+        return f"{title} שיודפס על גבי המדבקות: {name}\nהערה: משלוח מהיר"
+    if variant == 2:
+        return f"{title} שיודפס על גבי המדבקות- \\{name}"
+    return "ללא הערות"
+
+
+def order_rows(rows: int, seed: int = 0) -> Iterator[list]:
+    rng = random.Random(seed)
+    for i in range(rows):
+        yield [
+            100000 + i,
+            f"SO-{200000 + i}",
+            item_name(rng, i % 5),
+            rng.randint(1, 5),
+            line_comments(rng, i),
+            rng.choice(ORDER_STATUSES),
+            rng.choice(GRAPHIC_STATUSES),
+        ]
+
+
+def write_order_workbook(path: str, rows: int, seed: int = 0) -> str:
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Orders")
+    ws.append(ORDER_HEADERS)
+    for row in order_rows(rows, seed):
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def order_dicts(rows: int, seed: int = 0) -> List[Dict]:
+    return [dict(zip(ORDER_HEADERS, row)) for row in order_rows(rows, seed)]
@@ -0,0 +1,143 @@
+import glob
+import os
+import time
+import logging as lg
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Union
+
+from excel.excel_to_json import (
+    excel_to_filtered_json_report, convert_excel_to_json_report, stream_excel_to_filtered_json_report,
+    stream_excel_to_json_report
+)
+from excel.incremental_export import incremental_excel_to_filtered_json
+from excel.json_backends import configure_json_output, json_output_settings
+from excel.metrics import add_metrics_listener, enable_metrics, metrics_enabled, remove_metrics_listener
+from excel.worker_logging import init_worker_logging, worker_log_queue
+
+logger = lg.getLogger("OrderExport")
+
+# Every converter returns a report dict with the row count and its output
+# path ("output", or "output_dir" for the incremental export), or None.
+CONVERTERS = {
+    "filtered": excel_to_filtered_json_report,
+    "stream": stream_excel_to_filtered_json_report,
+    "json": convert_excel_to_json_report,
+    "json-stream": stream_excel_to_json_report,
+    "incremental": incremental_excel_to_filtered_json,
+}
+
+EXCEL_PATTERNS = ("*.xlsx", "*.xlsm")
+
+
+def collect_excel_files(inputs: Union[str, Iterable[str]]) -> List[str]:
+    return collect_files(inputs, EXCEL_PATTERNS)
+
+
+def collect_files(inputs: Union[str, Iterable[str]], patterns: Iterable[str]) -> List[str]:
+    if isinstance(inputs, str):
+        inputs = [inputs]
+
+    files = []
+    for entry in inputs:
+        if os.path.isdir(entry):
+            matches = []
+            for pattern in patterns:
+                matches.extend(glob.glob(os.path.join(entry, pattern)))
+        elif glob.has_magic(entry):
+            matches = glob.glob(entry, recursive=True)
+        else:
+            matches = [entry]
+
+        for path in sorted(matches):
+            # Skip Excel's "~$name.xlsx" lock files left next to open workbooks.
+            if os.path.basename(path).startswith("~$"):
+                continue
+            if path not in files:
+                files.append(path)
+    return files
+
+
+def _init_worker(log_queue, json_backend: str, indent: bool) -> None:
+    # Spawned workers start from a fresh import, so the parent's JSON output
+    # settings (e.g. the CLI's --compact / --json-backend) are applied again.
+    init_worker_logging(log_queue)
+    configure_json_output(json_backend, indent)
+
+
+def _convert_file(mode: str, path: str, collect_metrics: bool = False) -> Dict:
+    # With collect_metrics the run's metrics record travels back in the result,
+    # which is the only way out of a pool worker process.
+    records = []
+    was_enabled = metrics_enabled()
+    if collect_metrics:
+        enable_metrics()
+        add_metrics_listener(records.append)
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    error = None
+    result = None
+    try:
+        result = CONVERTERS[mode](path)
+        if result is None:
+            error = "conversion failed, see log for details"
+    except Exception as e:
+        error = str(e)
+    finally:
+        if collect_metrics:
+            remove_metrics_listener(records.append)
+            enable_metrics(was_enabled)
+
+    file_result = {
+        "path": path,
+        "ok": error is None,
+        "rows": result["rows"] if result else None,
+        "output": (result.get("output") or result.get("output_dir")) if result else None,
+        "seconds": round(time.perf_counter() - start, 4),
+        "cpu_seconds": round(time.process_time() - cpu_start, 4),
+        "error": error,
+    }
+    if collect_metrics:
+        file_result["metrics"] = records[-1] if records else None
+    return file_result
+
+
+def convert_files(inputs: Union[str, Iterable[str]],
+                  mode: str = "filtered",
+                  workers: Optional[int] = None,
+                  collect_metrics: bool = False) -> Dict:
+    if mode not in CONVERTERS:
+        raise ValueError(f"Unknown conversion mode: {mode}")
+
+    files = collect_excel_files(inputs)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files) or 1))
+    start = time.perf_counter()
+
+    if workers == 1:
+        results = [_convert_file(mode, path, collect_metrics) for path in files]
+    else:
+        ctx = multiprocessing.get_context()
+        with worker_log_queue(ctx) as log_queue:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                     initializer=_init_worker,
+                                     initargs=(log_queue, *json_output_settings())) as pool:
+                results = list(pool.map(_convert_file, [mode] * len(files), files,
+                                        [collect_metrics] * len(files)))
+
+    summary = {
+        "mode": mode,
+        "workers": workers,
+        "files": results,
+        "succeeded": sum(1 for r in results if r["ok"]),
+        "failed": sum(1 for r in results if not r["ok"]),
+        "rows": sum(r["rows"] or 0 for r in results),
+        "seconds": round(time.perf_counter() - start, 4),
+        "file_seconds": round(sum(r["seconds"] for r in results), 4),
+        "cpu_seconds": round(sum(r["cpu_seconds"] for r in results), 4),
+    }
+    logger.info(
+        f"Converted {summary['succeeded']}/{len(files)} file(s) in {summary['seconds']}s "
+        f"using {workers} worker(s) (mode: {mode})"
+    )
+    return summary
@@ -0,0 +1,212 @@
+import argparse
+import contextlib
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+from excel.batch_convert import collect_excel_files, collect_files, convert_files
+from excel.excel_writer import export_orders_to_excel, update_excel_column_by_dbid, update_excel_rows_by_dbid
+from excel.json_backends import BACKENDS, configure_json_output
+from excel.logging_setup import setup_logging, shutdown_logging
+from excel.metrics import add_metrics_listener, enable_metrics, metrics_enabled, remove_metrics_listener
+
+# Headless entry point for scheduled jobs. Only excel.* is imported here, so
+# neither PyQt6 nor anything under Desktop/ is loaded.
+
+ORDER_PATTERNS = ("*.json",)
+
+
+def _timed(path: str, func) -> Dict:
+    start = time.perf_counter()
+    error = None
+    result = None
+    try:
+        result = func()
+        if result is None:
+            error = "operation failed, see log for details"
+    except Exception as e:
+        error = str(e)
+    return {
+        "path": path,
+        "ok": error is None,
+        "result": result,
+        "seconds": round(time.perf_counter() - start, 4),
+        "error": error,
+    }
+
+
+def _summary(command: str, files: List[Dict], start: float, **extra) -> Dict:
+    return {
+        "command": command,
+        "files": files,
+        "succeeded": sum(1 for f in files if f["ok"]),
+        "failed": sum(1 for f in files if not f["ok"]),
+        "seconds": round(time.perf_counter() - start, 4),
+        **extra,
+    }
+
+
+def run_filtered_json(args) -> Dict:
+    mode = "incremental" if args.incremental else "stream" if args.stream else "filtered"
+    return _conversion_summary("filtered-json", args, mode)
+
+
+def run_json(args) -> Dict:
+    return _conversion_summary("json", args, "json-stream" if args.stream else "json")
+
+
+def _conversion_summary(command: str, args, mode: str) -> Dict:
+    # Conversions may run in pool workers, where the listener registered in
+    # main() never sees their runs; each file's record comes back in its result.
+    summary = convert_files(args.inputs, mode=mode, workers=args.workers, collect_metrics=args.metrics)
+    summary["command"] = command
+    if args.metrics:
+        summary["metrics"] = [f.pop("metrics") for f in summary["files"] if f.get("metrics")]
+    return summary
+
+
+def run_save_orders(args) -> Dict:
+    start = time.perf_counter()
+    files = []
+    for path in collect_files(args.inputs, ORDER_PATTERNS):
+        def export(path=path):
+            with open(path, "r", encoding="utf-8") as f:
+                orders = f.read()
+            report = export_orders_to_excel(orders, args.output_dir, args.max_per_file, args.workers)
+            if report is not None and report["failed"]:
+                raise RuntimeError(f"{report['failed']} Excel file(s) failed")
+            return report
+
+        result = _timed(path, export)
+        report = result.pop("result")
+        result["folder"] = report["folder"] if report else None
+        result["excel_files"] = [f["path"] for f in report["files"]] if report else []
+        result["orders"] = sum(f["orders"] for f in report["files"]) if report else 0
+        files.append(result)
+    return _summary("save-orders", files, start)
+
+
+def _load_updates(value: str) -> Dict:
+    if value.startswith("@"):
+        with open(value[1:], "r", encoding="utf-8") as f:
+            return json.load(f)
+    return json.loads(value)
+
+
+def run_update_rows(args) -> Dict:
+    updates = _load_updates(args.updates)
+    start = time.perf_counter()
+    files = []
+    for path in collect_excel_files(args.inputs):
+        result = _timed(path, lambda path=path: update_excel_rows_by_dbid(
+            path, updates, save_as=args.save_as, use_index=args.use_index))
+        report = result.pop("result")
+        result["updated"] = report["updated"] if report else {}
+        result["missing"] = report["missing"] if report else []
+        files.append(result)
+    return _summary("update-rows", files, start)
+
+
+def run_update_column(args) -> Dict:
+    start = time.perf_counter()
+    files = []
+    for path in collect_excel_files(args.inputs):
+        result = _timed(path, lambda path=path: update_excel_column_by_dbid(
+            path, args.dbids, args.column, args.value, save_as=args.save_as, use_index=args.use_index))
+        result["updated_rows"] = result.pop("result")
+        files.append(result)
+    return _summary("update-column", files, start, column=args.column)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json-backend", choices=BACKENDS, default="auto")
+    common.add_argument("--compact", action="store_true", help="write JSON without indentation")
+    common.add_argument("--log-dir",
+                        help="write export_orders.log to this folder (save-orders otherwise logs to its output folder)")
+    common.add_argument("--metrics", action="store_true", help="include per-stage metrics in the report")
+    common.add_argument("--pretty", action="store_true", help="indent the report")
+
+    parser = argparse.ArgumentParser(prog="python -m excel.cli",
+                                     description="Headless order conversions; prints a JSON report to stdout.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    filtered = commands.add_parser("filtered-json", parents=[common],
+                                   help="excel_to_filtered_json: 24-item JSON chunks per workbook")
+    filtered.add_argument("inputs", nargs="+", help="workbooks, folders or glob patterns")
+    filtered.add_argument("--workers", type=int, default=1)
+    variant = filtered.add_mutually_exclusive_group()
+    variant.add_argument("--stream", action="store_true", help="read-only streaming conversion")
+    variant.add_argument("--incremental", action="store_true", help="rewrite only changed chunks")
+    filtered.set_defaults(func=run_filtered_json)
+
+    raw = commands.add_parser("json", parents=[common], help="convert_excel_to_json: one JSON array per workbook")
+    raw.add_argument("inputs", nargs="+", help="workbooks, folders or glob patterns")
+    raw.add_argument("--workers", type=int, default=1)
+    raw.add_argument("--stream", action="store_true", help="read-only streaming conversion")
+    raw.set_defaults(func=run_json)
+
+    save = commands.add_parser("save-orders", parents=[common],
+                               help="save_orders_to_excel: JSON order lists to Excel files")
+    save.add_argument("inputs", nargs="+", help="JSON files, folders or glob patterns")
+    save.add_argument("--output-dir", default="data")
+    save.add_argument("--max-per-file", type=int, default=24)
+    save.add_argument("--workers", type=int, default=1)
+    save.set_defaults(func=run_save_orders)
+
+    rows = commands.add_parser("update-rows", parents=[common],
+                               help="update_excel_rows_by_dbid: per-dbId column updates")
+    rows.add_argument("inputs", nargs="+", help="workbooks, folders or glob patterns")
+    rows.add_argument("--updates", required=True,
+                      help='JSON object {"dbId": {"column": value}} or @file.json')
+    rows.add_argument("--save-as")
+    rows.add_argument("--use-index", action="store_true")
+    rows.set_defaults(func=run_update_rows)
+
+    column = commands.add_parser("update-column", parents=[common],
+                                 help="update_excel_column_by_dbid: one value for many dbIds")
+    column.add_argument("inputs", nargs="+", help="workbooks, folders or glob patterns")
+    column.add_argument("--column", required=True)
+    column.add_argument("--value", required=True)
+    column.add_argument("--dbids", nargs="+", required=True)
+    column.add_argument("--save-as")
+    column.add_argument("--use-index", action="store_true")
+    column.set_defaults(func=run_update_column)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    configure_json_output(args.json_backend, indent=not args.compact)
+    if args.log_dir:
+        setup_logging(args.log_dir, pinned=True)
+
+    records = []
+    was_enabled = metrics_enabled()
+    if args.metrics:
+        enable_metrics()
+        add_metrics_listener(records.append)
+
+    try:
+        # Library functions print progress messages; keep stdout for the report.
+        with contextlib.redirect_stdout(sys.stderr):
+            report = args.func(args)
+    finally:
+        if args.metrics:
+            remove_metrics_listener(records.append)
+            enable_metrics(was_enabled)
+        if args.log_dir:
+            shutdown_logging()
+
+    if args.metrics:
+        report.setdefault("metrics", records)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2 if args.pretty else None, default=str))
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+import json
+import os
+import logging as lg
+from typing import Dict, List, Optional, Union
+
+logger = lg.getLogger("OrderExport")
+
+INDEX_SUFFIX = ".dbid-index.json"
+INDEX_VERSION = 1
+
+
+def normalize_dbid(value: Union[int, float, str, None]) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def index_path_for(file_path: str) -> str:
+    return file_path + INDEX_SUFFIX
+
+
+def build_dbid_index(ws, dbid_col_idx: int) -> Dict[str, List[int]]:
+    index = {}
+    for row_number, values in enumerate(
+            ws.iter_rows(min_row=2, min_col=dbid_col_idx, max_col=dbid_col_idx, values_only=True), start=2):
+        key = normalize_dbid(values[0])
+        if key:
+            index.setdefault(key, []).append(row_number)
+    return index
+
+
+def load_dbid_index(file_path: str, dbid_col_idx: int) -> Optional[Dict[str, List[int]]]:
+    try:
+        with open(index_path_for(file_path), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+    if (stored.get("version") != INDEX_VERSION
+            or stored.get("mtime_ns") != stat.st_mtime_ns
+            or stored.get("size") != stat.st_size
+            or stored.get("column") != dbid_col_idx):
+        logger.info(f"dbId index for {file_path} is stale, rebuilding.")
+        return None
+
+    return stored.get("rows")
+
+
+def save_dbid_index(file_path: str, dbid_col_idx: int, rows: Dict[str, List[int]]) -> None:
+    stat = os.stat(file_path)
+    index_path = index_path_for(file_path)
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": INDEX_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "column": dbid_col_idx,
+            "rows": rows,
+        }, f, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+    logger.info(f"dbId index saved: {index_path}")
+
+
+def remove_dbid_index(file_path: str) -> None:
+    try:
+        os.remove(index_path_for(file_path))
+    except FileNotFoundError:
+        pass
+
+
+class DbIdIndex:
+    # Maps normalized dbId -> row numbers for one worksheet. When loaded from
+    # the sidecar file, rows are spot-checked on lookup and the index is
+    # rebuilt from the sheet if the stored position no longer matches.
+    def __init__(self, ws, dbid_col_idx: int, rows: Optional[Dict[str, List[int]]] = None):
+        self.ws = ws
+        self.dbid_col_idx = dbid_col_idx
+        self.from_sidecar = rows is not None
+        self.rows = rows if rows is not None else build_dbid_index(ws, dbid_col_idx)
+
+    @classmethod
+    def open(cls, ws, file_path: str, dbid_col_idx: int, use_index: bool = False) -> "DbIdIndex":
+        rows = load_dbid_index(file_path, dbid_col_idx) if use_index else None
+        return cls(ws, dbid_col_idx, rows)
+
+    def _rebuild(self) -> None:
+        logger.warning("dbId index does not match the sheet, rebuilding.")
+        self.rows = build_dbid_index(self.ws, self.dbid_col_idx)
+        self.from_sidecar = False
+
+    def find_all(self, dbid: Union[int, str]) -> List[int]:
+        key = normalize_dbid(dbid)
+        row_numbers = self.rows.get(key, [])
+        if self.from_sidecar and any(
+                normalize_dbid(self.ws.cell(row=r, column=self.dbid_col_idx).value) != key for r in row_numbers):
+            self._rebuild()
+            row_numbers = self.rows.get(key, [])
+        return row_numbers
+
+    def find(self, dbid: Union[int, str]) -> Optional[int]:
+        row_numbers = self.find_all(dbid)
+        return row_numbers[0] if row_numbers else None
+
+    def save(self, file_path: str) -> None:
+        save_dbid_index(file_path, self.dbid_col_idx, self.rows)
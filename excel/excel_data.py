@@ -1,17 +1,23 @@
-from typing import List, Dict
-from openpyxl import load_workbook
+from typing import List, Dict, Tuple, Optional
+
+from excel.progress import ProgressTracker
+from excel.records import Record, records_from_rows, to_dicts
+from excel.workbook_cache import read_sheet
 
 
 def excel_to_dict(file_path: str) -> List[Dict[str, str]]:
 
-    wb = load_workbook(file_path)
-    ws = wb.active
+    return to_dicts(excel_to_records(file_path))
+
+
+def excel_to_records(file_path: str, progress: Optional[ProgressTracker] = None) -> List[Record]:
+
+    headers, rows = excel_to_rows(file_path, progress)
+    return list(records_from_rows(headers, rows))
 
-    headers = [cell.value for cell in ws[1]]
-    data = []
 
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        row_dict = {headers[i]: row[i] for i in range(len(headers))}
-        data.append(row_dict)
+def excel_to_rows(file_path: str,
+                  progress: Optional[ProgressTracker] = None) -> Tuple[List[str], List[tuple]]:
 
-    return data
\ No newline at end of file
+    sheet = read_sheet(file_path, progress)
+    return list(sheet.headers), sheet.rows
@@ -1,200 +1,380 @@
-import json
 import os
-import re
 from datetime import datetime
-from typing import Union, List, Dict, Optional
+from itertools import tee
+from typing import Union, List, Dict, Optional, Iterable, Iterator, Tuple, Callable
 
 from openpyxl import load_workbook
 import logging as lg
 
-logger = lg.getLogger("OrderExport")
-logger.setLevel(lg.INFO)
-formatter = lg.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+from excel.line_item_classifier import (
+    LineItemClassifier, default_classifier, extract_type_details, extract_name_details
+)
+from excel.progress import ConversionCancelled, ProgressTracker, track
+from excel.records import Record, RecordHeader, to_dicts
+from excel.json_backends import JsonArrayWriter, dump_json_file, dump_json_array_file
+from excel.logging_setup import setup_logging
+from excel.metrics import current_metrics, instrumented
+from excel.workbook_cache import iter_sheet_rows, read_sheet
 
-def setup_logger(log_dir: str) -> None:
-    log_path = os.path.join(log_dir, "export_orders.log")
-    file_handler = lg.FileHandler(log_path, encoding='utf-8')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+logger = lg.getLogger("OrderExport")
 
+setup_logger = setup_logging
 
-def extract_type_details(line_item: str) -> Optional[str]:
-    if not line_item or not isinstance(line_item, str):
-        return None
 
-    line_item = line_item.strip()
+def split_item_variants(item: Union[Dict, Record]) -> List[Union[Dict, Record]]:
 
-    pattern1 = r"^מדבקות שם(?:\s*-\s*.+)*?\s*-\s*(?P<design>[^-]+?)\s*-\s*(?:סט\s+מדבקות\s*)?(?P<quantity>\d+(?:\+\d+)?)"
+    item_name = item.get("itemName", "")
+    if isinstance(item_name, str) and "_52+90" in item_name:
+        base_name = item_name.replace("_52+90", "")
+        if isinstance(item, Record):
+            return [item.replace({"itemName": f"{base_name}_52"}), item.replace({"itemName": f"{base_name}_90"})]
+        item_52 = item.copy()
+        item_52["itemName"] = f"{base_name}_52"
+        item_90 = item.copy()
+        item_90["itemName"] = f"{base_name}_90"
+        return [item_52, item_90]
+    return [item]
 
-    pattern2 = r"ברקע\s+(?P<design>.+?)\s+ללא\s+איורים"
 
-    pattern3 = r"-\s*(?P<design>[^-]+?)\s+ללא\s+איורים"
+FIELD_MAPPING = {
+    "Business Partner Reference Number": "referenceNumber",
+    "Item Name": "itemName",
+    "Quantity": "quantity",
+    "Line Comments": "name"
+}
 
-    pattern4 = r"^מדבקות שם\s*-\s*(?P<design>[^-]+?)\s*-\s*(?P<font>כתב\s+\S+)"
 
+def map_filtered_headers(headers) -> Dict[str, int]:
+    return {FIELD_MAPPING[key]: headers.index(key) for key in FIELD_MAPPING if key in headers}
 
-    match1 = re.search(pattern1, line_item)
-    if match1:
-        design = match1.group("design").strip()
-        quantity = match1.group("quantity").strip()
-        return f"{design}_{quantity}"
 
-    match2 = re.search(pattern2, line_item)
-    if match2:
-        design = match2.group("design").strip()
-        quantity_match = re.search(r"(\d+(?:\+\d+)?)", line_item)
-        quantity = quantity_match.group(1) if quantity_match else "unknown"
-        return f"{design}_{quantity}"
+def filtered_header(header_indexes: Dict[str, int]) -> RecordHeader:
+    fields = list(header_indexes)
+    if "name" not in header_indexes:
+        fields.append("name")
+    return RecordHeader(fields)
 
-    match3 = re.search(pattern3, line_item)
-    if match3:
-        design = match3.group("design").strip()
-        quantity_match = re.search(r"(\d+(?:\+\d+)?)", line_item)
-        quantity = quantity_match.group(1) if quantity_match else "unknown"
-        return f"{design}_{quantity}"
 
-    match4 = re.search(pattern4, line_item)
-    if match4:
-        design = match4.group("design").strip()
-        font = match4.group("font").strip()
-        return f"{design} {font}"
-    return None
+def filtered_layout(header_indexes: Dict[str, int]) -> Tuple[RecordHeader, List[int], List, Optional[int], int]:
+    header = filtered_header(header_indexes)
+    indexes = list(header_indexes.values())
+    padding = [None] * (len(header) - len(indexes))
+    return header, indexes, padding, header.positions.get("itemName"), header.positions["name"]
 
 
-def extract_name_details(line_item: str) -> Optional[str]:
-    if not line_item or not isinstance(line_item, str):
-        return None
+def iter_filtered_items(rows: Iterable,
+                        header_indexes: Dict[str, int],
+                        classifier: Optional[LineItemClassifier] = None,
+                        progress: Optional[ProgressTracker] = None) -> Iterator[Record]:
+    classifier = classifier or default_classifier
+    header, indexes, padding, item_pos, name_pos = filtered_layout(header_indexes)
+    metrics = current_metrics()
+    split = metrics.timed("split_item_variants", split_item_variants)
 
-    cleaned = re.sub(r'\\(?=[\u0590-\u05FF])', '', line_item)
+    selected = ([row[idx] if idx < len(row) else None for idx in indexes] + padding
+                for row in track(rows, progress))
+    values_iter, to_classify = tee(selected)
+    pairs = ((values[item_pos] if item_pos is not None else None, values[name_pos]) for values in to_classify)
+    classified = metrics.timed_iter("classify", classifier.classify_many(pairs))
 
-    pattern = r"ש(?:ם)?\s+היל(?:ד|דה|ד/ה|ה)?\s+שיודפס\s+על\s+גבי\s+המדבקות[:\-]?\s*([^\n\r]*)"
+    row_count = 0
+    for values, (item_details, item_name) in zip(values_iter, classified):
+        row_count += 1
+        if item_details:
+            values[item_pos] = item_details
+        values[name_pos] = item_name if item_name else " "
+        yield from split(Record(header, values))
+    metrics.count("rows", row_count)
 
-    match = re.search(pattern, cleaned, re.IGNORECASE )
-    if match:
-        name = match.group(1).strip()
-        if name:
-            return name
 
-    return None
+def make_row_filter(header_indexes: Dict[str, int],
+                    classifier: Optional[LineItemClassifier] = None) -> Callable[[tuple], List[Record]]:
+    classifier = classifier or default_classifier
+    header, indexes, padding, item_pos, name_pos = filtered_layout(header_indexes)
 
+    def filter_row(row) -> List[Record]:
+        values = [row[idx] if idx < len(row) else None for idx in indexes] + padding
+        item_details, item_name = classifier.classify(
+            values[item_pos] if item_pos is not None else None, values[name_pos]
+        )
+        if item_details:
+            values[item_pos] = item_details
+        values[name_pos] = item_name if item_name else " "
+        return split_item_variants(Record(header, values))
 
-def split_item_variants(item: Dict) -> List[Dict]:
+    return filter_row
 
-    item_name = item.get("itemName", "")
-    if isinstance(item_name, str) and "_52+90" in item_name:
-        base_name = item_name.replace("_52+90", "")
-        item_52 = item.copy()
-        item_52["itemName"] = f"{base_name}_52"
-        item_90 = item.copy()
-        item_90["itemName"] = f"{base_name}_90"
-        return [item_52, item_90]
-    return [item]
 
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
-def export_json_chunks(base_path: str, data: list[dict], chunk_size: int = 24) -> str:
 
+def create_json_output_dir(base_path: str) -> str:
     now_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     output_dir = f"{base_path}_jsons_{now_str}"
     os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def write_json_chunk(output_dir: str, chunk: list[Union[dict, Record]], file_index: int,
+                     serializer=None) -> str:
+    output_path = os.path.join(output_dir, f"data_part_{file_index}.json")
+    metrics = current_metrics()
+    metrics.count("bytes_written", dump_json_file(output_path, to_dicts(chunk), serializer))
+    metrics.count("files")
+    logger.info(f"Exported chunk to {output_path}")
+    return output_path
+
+
+def export_json_chunks(base_path: str, data: list[Union[dict, Record]], chunk_size: int = 24,
+                       serializer=None) -> str:
+
+    output_dir = create_json_output_dir(base_path)
 
     for i in range(0, len(data), chunk_size):
         chunk = data[i:i + chunk_size]
         file_index = i // chunk_size + 1
-        output_path = os.path.join(output_dir, f"data_part_{file_index}.json")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(chunk, f, ensure_ascii=False, indent=2)
-        logger.info(f"Exported chunk to {output_path}")
+        write_json_chunk(output_dir, chunk, file_index, serializer)
 
     return output_dir
 
-def excel_to_filtered_json(excel_file_path: str) -> list[list[dict]] | None:
+def excel_to_filtered_json(excel_file_path: str,
+                           progress: Optional[ProgressTracker] = None,
+                           serializer=None) -> list[list[dict]] | None:
+    report = excel_to_filtered_json_report(excel_file_path, progress, serializer)
+    return report["data"] if report is not None else None
 
-    try:
-        wb=load_workbook(excel_file_path)
-        ws=wb.active
 
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows or len(rows) < 2:
+@instrumented("excel_to_filtered_json")
+def excel_to_filtered_json_report(excel_file_path: str,
+                                  progress: Optional[ProgressTracker] = None,
+                                  serializer=None) -> Optional[Dict]:
+    # Returns {"rows", "output", "data"}: the item count, the timestamped
+    # _jsons_ folder and the items themselves.
+    metrics = current_metrics()
+    try:
+        with metrics.span("read_workbook"):
+            sheet = read_sheet(excel_file_path, progress)
+        if not sheet.rows:
             logger.warning("Excel file is empty or missing data.")
             return None
 
-        headers = rows[0]
-
-        field_mapping = {
-            "Business Partner Reference Number": "referenceNumber",
-            "Item Name": "itemName",
-            "Quantity": "quantity",
-            "Line Comments":"name"
-        }
-
-        header_indexes = {field_mapping[key]: headers.index(key) for key in field_mapping if key in headers}
-
-        filtered_data = []
-        for row in rows[1:]:
-            item = {
-                new_key: row[idx] for new_key, idx in header_indexes.items() if idx < len(row)
-            }
-
-            item_line_raw_type = item.get("itemName")
-            item_details = extract_type_details(item_line_raw_type)
-            if item_details:
-                item["itemName"] = item_details
+        if progress is not None:
+            progress.restart(len(sheet.rows))
 
-            item_line_raw_name = item.get("name")
-            item_name=extract_name_details(item_line_raw_name)
-            if item_name:
-                item["name"]=item_name
-            else:
-                item["name"]=" "
-
-            final_item= split_item_variants(item)
-            filtered_data.extend(final_item)
+        header_indexes = map_filtered_headers(sheet.headers)
+        with metrics.span("filter_rows"):
+            filtered_data = list(iter_filtered_items(sheet.rows, header_indexes, progress=progress))
+        metrics.count("items", len(filtered_data))
 
         if not filtered_data:
             logger.warning("No valid data found to export.")
             return None
         base_dir = os.path.splitext(excel_file_path)[0]
-        export_json_chunks(base_dir, filtered_data, chunk_size=24)
+        with metrics.span("write_json"):
+            output_dir = export_json_chunks(base_dir, filtered_data, chunk_size=24, serializer=serializer)
+
+        return {"rows": len(filtered_data), "output": output_dir, "data": to_dicts(filtered_data)}
 
-        return filtered_data
+    except ConversionCancelled:
+        logger.warning(f"Filtered JSON conversion cancelled: {excel_file_path}")
+        raise
 
     except Exception as e:
         logger.exception(f"Failed to convert Excel to filtered JSON: {e}")
         return None
 
-def convert_excel_to_json(excel_file_path: str) -> list[dict] | None:
+
+def stream_excel_to_filtered_json(excel_file_path: str,
+                                  chunk_size: int = 24,
+                                  progress: Optional[ProgressTracker] = None,
+                                  serializer=None) -> Optional[str]:
+    report = stream_excel_to_filtered_json_report(excel_file_path, chunk_size, progress, serializer)
+    return report["output"] if report is not None else None
+
+
+@instrumented("stream_excel_to_filtered_json")
+def stream_excel_to_filtered_json_report(excel_file_path: str,
+                                         chunk_size: int = 24,
+                                         progress: Optional[ProgressTracker] = None,
+                                         serializer=None) -> Optional[Dict]:
+    # Returns {"rows", "output"}: the item count and the _jsons_ folder.
+    # Read-only mode keeps only the current row in memory; each chunk is
+    # written as soon as it fills, so memory depends on chunk_size only.
+    metrics = current_metrics()
+    wb = None
     try:
-        wb = load_workbook(excel_file_path)
+        with metrics.span("open_workbook"):
+            wb = load_workbook(excel_file_path, read_only=True)
         ws = wb.active
 
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows or len(rows) < 2:
+        rows = iter_sheet_rows(ws)
+        headers = next(rows, None)
+        if headers is None:
+            logger.warning("Excel file is empty or missing data.")
+            return None
+
+        if progress is not None:
+            progress.set_total(0)
+
+        header_indexes = map_filtered_headers(headers)
+        base_dir = os.path.splitext(excel_file_path)[0]
+
+        output_dir = None
+        exported = 0
+        items = iter_filtered_items(rows, header_indexes, progress=progress)
+        for file_index, chunk in enumerate(iter_chunks(items, chunk_size), start=1):
+            if output_dir is None:
+                output_dir = create_json_output_dir(base_dir)
+            with metrics.span("write_json"):
+                write_json_chunk(output_dir, chunk, file_index, serializer)
+            exported += len(chunk)
+        metrics.count("items", exported)
+
+        if output_dir is None:
+            logger.warning("No valid data found to export.")
+            return None
+
+        logger.info(f"Streamed {exported} item(s) to {output_dir}")
+        return {"rows": exported, "output": output_dir}
+
+    except ConversionCancelled:
+        logger.warning(f"Streaming JSON conversion cancelled: {excel_file_path}")
+        raise
+
+    except Exception as e:
+        logger.exception(f"Failed to stream Excel to filtered JSON: {e}")
+        return None
+
+    finally:
+        if wb is not None:
+            wb.close()
+
+def raw_record_header(headers) -> Tuple[RecordHeader, List[int]]:
+    keep = [i for i, header in enumerate(headers) if header is not None and str(header).strip() != ""]
+    return RecordHeader(headers[i] for i in keep), keep
+
+
+def raw_record(record_header: RecordHeader, keep: List[int], row) -> Record:
+    return Record(record_header, [row[i] if i < len(row) and row[i] is not None else "" for i in keep])
+
+
+def convert_excel_to_json(excel_file_path: str,
+                          progress: Optional[ProgressTracker] = None,
+                          serializer=None) -> list[dict] | None:
+    report = convert_excel_to_json_report(excel_file_path, progress, serializer)
+    return report["data"] if report is not None else None
+
+
+@instrumented("convert_excel_to_json")
+def convert_excel_to_json_report(excel_file_path: str,
+                                 progress: Optional[ProgressTracker] = None,
+                                 serializer=None) -> Optional[Dict]:
+    # Returns {"rows", "output", "data"}: the row count, the .json file and
+    # the records themselves.
+    metrics = current_metrics()
+    try:
+        with metrics.span("read_workbook"):
+            sheet = read_sheet(excel_file_path, progress)
+        if not sheet.rows:
             logger.warning("Excel file is empty or missing data.")
             return None
 
-        headers = rows[0]
-        data = []
+        if progress is not None:
+            progress.restart(len(sheet.rows))
 
-        for row in rows[1:]:
-            item = {
-                header: (row[i] if row[i] is not None else "")
-                for i, header in enumerate(headers)
-                if header is not None and str(header).strip() != ""
-            }
-            data.append(item)
+        with metrics.span("build_records"):
+            record_header, keep = raw_record_header(sheet.headers)
+            records = [raw_record(record_header, keep, row) for row in track(sheet.rows, progress)]
+            data = to_dicts(records)
+        metrics.count("rows", len(data))
 
         base_name = os.path.splitext(excel_file_path)[0]
         output_json_path = base_name + ".json"
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with metrics.span("write_json"):
+            dump_json_array_file(output_json_path, data, serializer)
+        metrics.count("bytes_written", os.path.getsize(output_json_path))
+        metrics.count("files")
 
         logger.info(f"Exported raw JSON to {output_json_path}")
-        return data
+        return {"rows": len(data), "output": output_json_path, "data": data}
+
+    except ConversionCancelled:
+        logger.warning(f"JSON conversion cancelled: {excel_file_path}")
+        raise
 
     except Exception as e:
         logger.exception(f"Failed to convert Excel to JSON: {e}")
         return None
 
 
+def stream_excel_to_json(excel_file_path: str,
+                         progress: Optional[ProgressTracker] = None,
+                         serializer=None) -> Optional[str]:
+    report = stream_excel_to_json_report(excel_file_path, progress, serializer)
+    return report["output"] if report is not None else None
+
+
+@instrumented("stream_excel_to_json")
+def stream_excel_to_json_report(excel_file_path: str,
+                                progress: Optional[ProgressTracker] = None,
+                                serializer=None) -> Optional[Dict]:
+    # Returns {"rows", "output"}: the row count and the .json file.
+    # Rows go straight from the read-only sheet into a streaming JSON array;
+    # the output is written to a temporary file and moved into place at the end.
+    wb = None
+    output_json_path = os.path.splitext(excel_file_path)[0] + ".json"
+    partial_path = output_json_path + ".part"
+    try:
+        with current_metrics().span("open_workbook"):
+            wb = load_workbook(excel_file_path, read_only=True)
+        ws = wb.active
+
+        rows = iter_sheet_rows(ws)
+        headers = next(rows, None)
+        if headers is None:
+            logger.warning("Excel file is empty or missing data.")
+            return None
 
+        if progress is not None:
+            progress.set_total(0)
+
+        record_header, keep = raw_record_header(headers)
+        with open(partial_path, "wb") as f:
+            with JsonArrayWriter(f, serializer) as writer:
+                for row in track(rows, progress):
+                    writer.write(raw_record(record_header, keep, row).to_dict())
+
+        if writer.count == 0:
+            os.remove(partial_path)
+            logger.warning("Excel file is empty or missing data.")
+            return None
+
+        os.replace(partial_path, output_json_path)
+        metrics = current_metrics()
+        metrics.count("rows", writer.count)
+        metrics.count("bytes_written", writer.bytes_written)
+        metrics.count("files")
+        logger.info(f"Streamed {writer.count} row(s) to {output_json_path} ({writer.bytes_written} bytes)")
+        return {"rows": writer.count, "output": output_json_path}
+
+    except ConversionCancelled:
+        logger.warning(f"Streaming JSON conversion cancelled: {excel_file_path}")
+        raise
+
+    except Exception as e:
+        logger.exception(f"Failed to stream Excel to JSON: {e}")
+        return None
 
+    finally:
+        if wb is not None:
+            wb.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
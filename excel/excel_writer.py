@@ -1,22 +1,27 @@
 import os
 import json
+import time
+import multiprocessing
+from collections import deque
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from openpyxl import Workbook
 from datetime import datetime
 from openpyxl import load_workbook
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Optional, Iterator
 import logging as lg
 import re
 
-logger = lg.getLogger("OrderExport")
-logger.setLevel(lg.INFO)
-formatter = lg.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+from excel.dbid_index import DbIdIndex, normalize_dbid
+from excel.logging_setup import setup_logging
+from excel.metrics import current_metrics, instrumented
+from excel.worker_logging import init_worker_logging, worker_log_queue
+from excel.records import Record
 
-def setup_logger(log_dir: str) -> None:
-    log_path = os.path.join(log_dir, "export_orders.log")
-    file_handler = lg.FileHandler(log_path, encoding='utf-8')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+logger = lg.getLogger("OrderExport")
 
+setup_logger = setup_logging
 
 
 def parse_json_orders(orders: Union[str, List[Dict]]) -> Union[List[Dict], None]:
@@ -38,11 +43,39 @@ def parse_json_orders(orders: Union[str, List[Dict]]) -> Union[List[Dict], None]
     return orders
 
 
+def iter_orders(orders: Union[str, Iterable]) -> Iterator[Mapping]:
+    # Validates orders one at a time as they are consumed, so generators and
+    # streamed API results never have to be materialized as a list.
+    if isinstance(orders, str):
+        try:
+            orders = json.loads(orders)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON format.")
+        if not isinstance(orders, list):
+            raise ValueError("Invalid structure – must be a list of dictionaries.")
+    elif isinstance(orders, Mapping) or not isinstance(orders, Iterable):
+        raise ValueError("Invalid structure – must be an iterable of dictionaries.")
+
+    for position, order in enumerate(orders):
+        if not isinstance(order, Mapping):
+            raise ValueError(f"Invalid order at position {position} – must be a dictionary.")
+        yield order
+
+
+def iter_order_chunks(orders: Iterable[Mapping], chunk_size: int) -> Iterator[List[Mapping]]:
+    iterator = iter(orders)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def create_output_folder(base_dir: str) -> str:
     today = datetime.today().strftime("%Y-%m-%d")
     full_path = os.path.join(base_dir, today)
     os.makedirs(full_path, exist_ok=True)
-    setup_logger(full_path)
+    setup_logging(full_path)
     logger.info(f"Output directory created: {full_path}")
     return full_path
 
@@ -51,43 +84,136 @@ def split_orders(orders: List[Dict], chunk_size: int) -> List[List[Dict]]:
     return [orders[i:i + chunk_size] for i in range(0, len(orders), chunk_size)]
 
 
-def write_excel_file(orders_chunk: List[Dict], output_path: str, file_index: int) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Orders"
+def excel_file_name(file_index: int, file_date: Optional[str] = None) -> str:
+    file_date = file_date or datetime.today().strftime("%Y-%m-%d")
+    return f"orders_{file_date}_{file_index}.xlsx"
+
 
-    headers = list(orders_chunk[0].keys())
+def write_excel_file(orders_chunk: List[Union[Dict, Record]], output_path: str, file_index: int,
+                     file_date: Optional[str] = None) -> str:
+    # Write-only workbooks stream rows to the file instead of keeping a cell
+    # object per value in memory.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Orders")
+
+    first = orders_chunk[0]
+    if isinstance(first, Record):
+        headers = list(first.header.fields)
+    else:
+        headers = list(first.keys())
     ws.append(headers)
 
     for order in orders_chunk:
-        ws.append([order.get(k, "") for k in headers])
+        if isinstance(order, Record) and order.header == first.header:
+            ws.append(order.values)
+        else:
+            ws.append([order.get(k, "") for k in headers])
 
-    today = datetime.today().strftime("%Y-%m-%d")
-    filename = f"orders_{today}_{file_index}.xlsx"
-    full_path = os.path.join(output_path, filename)
+    full_path = os.path.join(output_path, excel_file_name(file_index, file_date))
     wb.save(full_path)
     logger.info(f"Saved file: {full_path}")
+    return full_path
 
 
-def save_orders_to_excel( orders: Union[str, List[Dict]],
-                          output_dir: str = "data",
-                          max_per_file: int = 24) -> bool:
+def _write_chunk(orders_chunk: List[Dict], output_path: str, file_index: int, file_date: str) -> Dict:
+    result = {
+        "index": file_index,
+        "path": os.path.join(output_path, excel_file_name(file_index, file_date)),
+        "orders": len(orders_chunk),
+        "ok": True,
+        "error": None,
+    }
+    try:
+        write_excel_file(orders_chunk, output_path, file_index, file_date)
+    except Exception as e:
+        logger.exception(f"Failed to write file #{file_index}: {e}")
+        result["ok"] = False
+        result["error"] = str(e)
+    return result
+
+
+def write_excel_chunks(chunks: Iterable[List[Dict]], output_path: str, workers: int = 1) -> Dict:
+    # Chunks may come from a generator: each file is written (or handed to a
+    # worker) as soon as its chunk arrives, with at most two chunks per worker
+    # in flight.
+    file_date = datetime.today().strftime("%Y-%m-%d")
+    workers = max(1, workers or os.cpu_count() or 1)
+    if hasattr(chunks, "__len__"):
+        workers = min(workers, len(chunks) or 1)
+    start = time.perf_counter()
+
+    results = []
+    if workers == 1:
+        for file_index, chunk in enumerate(chunks, start=1):
+            results.append(_write_chunk(chunk, output_path, file_index, file_date))
+    else:
+        ctx = multiprocessing.get_context()
+        with worker_log_queue(ctx) as log_queue:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                     initializer=init_worker_logging, initargs=(log_queue,)) as pool:
+                pending = deque()
+                for file_index, chunk in enumerate(chunks, start=1):
+                    pending.append(pool.submit(_write_chunk, chunk, output_path, file_index, file_date))
+                    if len(pending) >= workers * 2:
+                        results.append(pending.popleft().result())
+                results.extend(future.result() for future in pending)
+
+    return {
+        "folder": output_path,
+        "workers": workers,
+        "files": results,
+        "succeeded": sum(1 for r in results if r["ok"]),
+        "failed": sum(1 for r in results if not r["ok"]),
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+@instrumented("export_orders_to_excel")
+def export_orders_to_excel(orders: Union[str, Iterable[Dict]],
+                           output_dir: str = "data",
+                           max_per_file: int = 24,
+                           workers: int = 1) -> Optional[Dict]:
+    # An invalid order stops the export where it is found; files for the
+    # chunks before it have already been written.
+    metrics = current_metrics()
     try:
-        parsed_orders = parse_json_orders(orders)
-        if parsed_orders is None:
-            return False
+        validated = metrics.timed_iter("parse_orders", iter_orders(orders))
+        first = next(validated, None)
+        if first is None:
+            logger.warning("No orders provided.")
+            return None
 
         folder_path = create_output_folder(output_dir)
-        chunks = split_orders(parsed_orders, max_per_file)
-
-        for i, chunk in enumerate(chunks, start=1):
-            write_excel_file(chunk, folder_path, i)
-        logger.info(f"Successfully saved {len(chunks)} Excel file(s).")
-        return True
+        chunks = iter_order_chunks(chain([first], validated), max_per_file)
+
+        with metrics.span("write_excel"):
+            report = write_excel_chunks(chunks, folder_path, workers=workers)
+        metrics.count("rows", sum(r["orders"] for r in report["files"]))
+        if metrics.enabled:
+            metrics.count("files", report["succeeded"])
+            metrics.count("bytes_written", sum(os.path.getsize(r["path"]) for r in report["files"] if r["ok"]))
+        logger.info(
+            f"Saved {report['succeeded']}/{len(report['files'])} Excel file(s) in {report['seconds']}s "
+            f"using {report['workers']} worker(s)."
+        )
+        return report
+
+    except ValueError as e:
+        logger.error(str(e))
+        return None
 
     except Exception as e:
         logger.exception(f"Unexpected error occurred: {e}")
-        return False
+        return None
+
+
+@instrumented("save_orders_to_excel")
+def save_orders_to_excel( orders: Union[str, Iterable[Dict]],
+                          output_dir: str = "data",
+                          max_per_file: int = 24,
+                          workers: int = 1) -> bool:
+    report = export_orders_to_excel(orders, output_dir, max_per_file, workers)
+    return report is not None and report["failed"] == 0
 
 
 
@@ -103,15 +229,18 @@ def find_row_by_dbid(ws, dbid: Union[int, str], dbid_col_idx: int):
     return None
 
 
-def update_excel_row_by_dbid(
+@instrumented("update_excel_rows_by_dbid")
+def update_excel_rows_by_dbid(
     file_path: str,
-    dbid: Union[int, str],
-    updates: Dict[str, Union[str, int, float]],
-    save_as: Optional[str] = None
-) -> None:
+    updates: Dict[Union[int, str], Dict[str, Union[str, int, float]]],
+    save_as: Optional[str] = None,
+    use_index: bool = False
+) -> Optional[Dict[str, Union[Dict, List]]]:
 
+    metrics = current_metrics()
     try:
-        wb = load_workbook(file_path)
+        with metrics.span("load_workbook"):
+            wb = load_workbook(file_path)
         ws = wb.active
 
         headers = load_excel_headers(ws)
@@ -119,26 +248,41 @@ def update_excel_row_by_dbid(
         if "dbId" not in headers:
             raise ValueError("Missing required column: 'dbId'")
 
-        dbid_col_idx = headers["dbId"]
-        target_row = find_row_by_dbid(ws, dbid, dbid_col_idx)
-
-        if target_row is None:
-            msg = f"dbId {dbid} not found in file."
-            logger.warning(msg)
-            print(msg)
-            return
-
-        for column, new_value in updates.items():
-            if column not in headers:
-                raise ValueError(f"Column '{column}' not found in file.")
-            col_idx = headers[column]
-            target_row[col_idx - 1].value = new_value
-            logger.info(f"dbId={dbid}: '{column}' updated to '{new_value}'")
-
-        output_path = save_as or file_path
-        wb.save(output_path)
-        logger.info(f"File saved: {output_path}")
-        print(f"Row with dbId={dbid} updated successfully.")
+        for row_updates in updates.values():
+            for column in row_updates:
+                if column not in headers:
+                    raise ValueError(f"Column '{column}' not found in file.")
+
+        with metrics.span("open_index"):
+            index = DbIdIndex.open(ws, file_path, headers["dbId"], use_index=use_index)
+        report = {"updated": {}, "missing": []}
+
+        find = metrics.timed("find_rows", index.find)
+        for dbid, row_updates in updates.items():
+            row_number = find(dbid)
+            if row_number is None:
+                logger.warning(f"dbId {dbid} not found in file.")
+                report["missing"].append(dbid)
+                continue
+
+            for column, new_value in row_updates.items():
+                ws.cell(row=row_number, column=headers[column]).value = new_value
+            report["updated"][dbid] = row_number
+            logger.info(f"dbId={dbid}: updated {', '.join(map(str, row_updates))}")
+
+        metrics.count("rows", len(report["updated"]))
+        if report["updated"]:
+            output_path = save_as or file_path
+            with metrics.span("save_workbook"):
+                wb.save(output_path)
+            metrics.count("bytes_written", os.path.getsize(output_path))
+            logger.info(f"File saved: {output_path} ({len(report['updated'])} row(s) updated)")
+            if use_index:
+                if any("dbId" in row_updates for row_updates in updates.values()):
+                    index = DbIdIndex(ws, headers["dbId"])
+                index.save(output_path)
+
+        return report
 
     except FileNotFoundError:
         msg = f"File not found: {file_path}"
@@ -146,20 +290,44 @@ def update_excel_row_by_dbid(
         print(f"Error: {msg}")
 
     except Exception as e:
-        logger.exception("Unexpected error occurred while updating row.")
+        logger.exception("Unexpected error occurred while updating rows.")
         print(f"Unexpected error: {e}")
 
+    return None
+
 
+def update_excel_row_by_dbid(
+    file_path: str,
+    dbid: Union[int, str],
+    updates: Dict[str, Union[str, int, float]],
+    save_as: Optional[str] = None
+) -> None:
+
+    report = update_excel_rows_by_dbid(file_path, {dbid: updates}, save_as=save_as)
+    if report is None:
+        return
+
+    if report["missing"]:
+        print(f"dbId {dbid} not found in file.")
+        return
+
+    print(f"Row with dbId={dbid} updated successfully.")
+
+
+@instrumented("update_excel_column_by_dbid")
 def update_excel_column_by_dbid(
     file_path: str,
     dbids_to_update: List[Union[str, int]],
     column_name: str,
     new_value: str,
-    save_as: str = None
-) -> None:
+    save_as: str = None,
+    use_index: bool = False
+) -> Optional[int]:
 
+    metrics = current_metrics()
     try:
-        wb = load_workbook(file_path)
+        with metrics.span("load_workbook"):
+            wb = load_workbook(file_path)
         ws = wb.active
 
         headers = {cell.value: idx for idx, cell in enumerate(ws[1], start=1)}
@@ -171,22 +339,41 @@ def update_excel_column_by_dbid(
         col_idx = headers[column_name]
         dbid_idx = headers["dbId"]
 
+        keys = {normalize_dbid(dbid) for dbid in dbids_to_update}
+        keys.discard("")
         updated_rows = 0
-        for row in ws.iter_rows(min_row=2):
-            dbid_cell = row[dbid_idx - 1].value
-            if str(dbid_cell) in map(str, dbids_to_update):
-                row[col_idx - 1].value = new_value
-                updated_rows += 1
-
-        if save_as:
-            wb.save(save_as)
-            logger.info(f"File saved as {save_as}")
-        else:
-            wb.save(file_path)
-            logger.info(f"File overwritten: {file_path}")
+
+        with metrics.span("find_rows"):
+            if use_index:
+                index = DbIdIndex.open(ws, file_path, dbid_idx, use_index=True)
+                for key in keys:
+                    for row_number in index.find_all(key):
+                        ws.cell(row=row_number, column=col_idx).value = new_value
+                        updated_rows += 1
+            else:
+                for row in ws.iter_rows(min_row=2):
+                    if normalize_dbid(row[dbid_idx - 1].value) in keys:
+                        row[col_idx - 1].value = new_value
+                        updated_rows += 1
+        metrics.count("rows", updated_rows)
+
+        with metrics.span("save_workbook"):
+            if save_as:
+                wb.save(save_as)
+                logger.info(f"File saved as {save_as}")
+            else:
+                wb.save(file_path)
+                logger.info(f"File overwritten: {file_path}")
+        metrics.count("bytes_written", os.path.getsize(save_as or file_path))
+
+        if use_index:
+            if column_name == "dbId":
+                index = DbIdIndex(ws, dbid_idx)
+            index.save(save_as or file_path)
 
         logger.info(f"{updated_rows} rows updated successfully (column: {column_name})")
         print(f"{updated_rows} rows updated successfully.")
+        return updated_rows
 
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
@@ -196,6 +383,8 @@ def update_excel_column_by_dbid(
         logger.exception("An unexpected error occurred while updating Excel.")
         print(f"Unexpected error: {e}")
 
+    return None
+
 
 
 
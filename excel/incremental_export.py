@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import logging as lg
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from excel.excel_to_json import iter_chunks, make_row_filter, map_filtered_headers
+from excel.json_backends import default_serializer
+from excel.progress import ConversionCancelled, ProgressTracker, track
+from excel.records import to_dict
+from excel.workbook_cache import read_sheet
+
+logger = lg.getLogger("OrderExport")
+
+MANIFEST_SUFFIX = ".export-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def manifest_path_for(excel_file_path: str) -> str:
+    return os.path.splitext(excel_file_path)[0] + MANIFEST_SUFFIX
+
+
+def output_dir_for(excel_file_path: str) -> str:
+    return os.path.splitext(excel_file_path)[0] + "_jsons"
+
+
+def chunk_file_name(file_index: int) -> str:
+    return f"data_part_{file_index}.json"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def row_hash(row) -> str:
+    # Cell values are str/int/float/datetime/None, whose repr is stable.
+    return content_hash(repr(tuple(row)).encode("utf-8"))
+
+
+def file_matches(path: str, data: bytes) -> bool:
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def load_manifest(manifest_path: str) -> Optional[Dict]:
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        logger.info(f"Export manifest {manifest_path} has an unknown version, exporting everything.")
+        return None
+    return manifest
+
+
+def save_manifest(manifest_path: str, manifest: Dict) -> None:
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+
+
+class PreviousExport:
+    # Read access to the items of the last export. A chunk file is only trusted
+    # while its bytes still match the hash recorded in the manifest, so files
+    # already rewritten during this run are never read back as old data.
+    def __init__(self, manifest: Optional[Dict], output_dir: str, cached_chunks: int = 8):
+        self.output_dir = output_dir
+        self.chunk_size = manifest["chunk_size"] if manifest else 0
+        self.chunk_hashes = manifest["chunks"] if manifest else []
+        self.offsets = {}
+        self._chunks = OrderedDict()
+        self._cached_chunks = cached_chunks
+
+        offset = 0
+        for digest, count in (manifest["rows"] if manifest else []):
+            self.offsets.setdefault(digest, (offset, count))
+            offset += count
+
+    def _load_chunk(self, chunk_index: int) -> Optional[List[Dict]]:
+        if chunk_index in self._chunks:
+            self._chunks.move_to_end(chunk_index)
+            return self._chunks[chunk_index]
+
+        items = None
+        if chunk_index < len(self.chunk_hashes):
+            path = os.path.join(self.output_dir, chunk_file_name(chunk_index + 1))
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                if content_hash(data) == self.chunk_hashes[chunk_index]:
+                    items = json.loads(data)
+            except (OSError, ValueError):
+                items = None
+
+        self._chunks[chunk_index] = items
+        if len(self._chunks) > self._cached_chunks:
+            self._chunks.popitem(last=False)
+        return items
+
+    def items_for(self, digest: str) -> Optional[List[Dict]]:
+        location = self.offsets.get(digest)
+        if location is None or not self.chunk_size:
+            return None
+
+        offset, count = location
+        items = []
+        while len(items) < count:
+            position = offset + len(items)
+            chunk = self._load_chunk(position // self.chunk_size)
+            if chunk is None:
+                return None
+            start = position % self.chunk_size
+            if start >= len(chunk):
+                return None
+            items.extend(chunk[start:start + count - len(items)])
+        return items
+
+
+def incremental_excel_to_filtered_json(excel_file_path: str,
+                                       chunk_size: int = 24,
+                                       progress: Optional[ProgressTracker] = None,
+                                       serializer=None) -> Optional[Dict]:
+    # Re-exports into a stable "<name>_jsons" folder. Rows whose content hash
+    # is in the manifest reuse their previous output instead of being
+    # classified again, and only chunk files whose bytes change are rewritten.
+    serializer = serializer or default_serializer()
+    manifest_path = manifest_path_for(excel_file_path)
+    output_dir = output_dir_for(excel_file_path)
+
+    try:
+        sheet = read_sheet(excel_file_path, progress)
+        if not sheet.rows:
+            logger.warning("Excel file is empty or missing data.")
+            return None
+
+        if progress is not None:
+            progress.restart(len(sheet.rows))
+
+        header_indexes = map_filtered_headers(sheet.headers)
+        manifest = load_manifest(manifest_path)
+        if manifest is not None and (manifest.get("chunk_size") != chunk_size
+                                     or manifest.get("headers") != header_indexes):
+            logger.info("Export settings or headers changed, exporting everything.")
+            manifest = None
+        previous = PreviousExport(manifest, output_dir)
+        filter_row = make_row_filter(header_indexes)
+
+        row_entries = []
+        counts = {"reused": 0, "processed": 0}
+
+        def items():
+            for row in track(sheet.rows, progress):
+                digest = row_hash(row)
+                row_items = previous.items_for(digest)
+                if row_items is None:
+                    row_items = [to_dict(item) for item in filter_row(row)]
+                    counts["processed"] += 1
+                else:
+                    counts["reused"] += 1
+                row_entries.append([digest, len(row_items)])
+                yield from row_items
+
+        os.makedirs(output_dir, exist_ok=True)
+        chunk_hashes = []
+        written = unchanged = 0
+        for chunk_index, chunk in enumerate(iter_chunks(items(), chunk_size)):
+            data = serializer.dumps(chunk)
+            digest = content_hash(data)
+            chunk_hashes.append(digest)
+            path = os.path.join(output_dir, chunk_file_name(chunk_index + 1))
+            if (chunk_index < len(previous.chunk_hashes)
+                    and previous.chunk_hashes[chunk_index] == digest
+                    and file_matches(path, data)):
+                unchanged += 1
+                continue
+            with open(path, "wb") as f:
+                f.write(data)
+            written += 1
+
+        removed = 0
+        for chunk_index in range(len(chunk_hashes), len(previous.chunk_hashes)):
+            try:
+                os.remove(os.path.join(output_dir, chunk_file_name(chunk_index + 1)))
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+        save_manifest(manifest_path, {
+            "version": MANIFEST_VERSION,
+            "source": os.path.basename(excel_file_path),
+            "chunk_size": chunk_size,
+            "headers": header_indexes,
+            "output_dir": os.path.basename(output_dir),
+            "rows": row_entries,
+            "chunks": chunk_hashes,
+        })
+
+        report = {
+            "output_dir": output_dir,
+            "rows": len(row_entries),
+            "rows_processed": counts["processed"],
+            "rows_reused": counts["reused"],
+            "chunks": len(chunk_hashes),
+            "chunks_written": written,
+            "chunks_unchanged": unchanged,
+            "chunks_removed": removed,
+        }
+        logger.info(
+            f"Incremental export of {excel_file_path}: {written} chunk(s) written, "
+            f"{unchanged} unchanged, {removed} removed ({counts['processed']} row(s) processed)"
+        )
+        return report
+
+    except ConversionCancelled:
+        logger.warning(f"Incremental JSON conversion cancelled: {excel_file_path}")
+        raise
+
+    except Exception as e:
+        logger.exception(f"Failed incremental conversion of Excel to filtered JSON: {e}")
+        return None
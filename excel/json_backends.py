@@ -0,0 +1,132 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, BinaryIO, Iterable, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKENDS = ("auto", "stdlib", "orjson")
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StdlibSerializer:
+    name = "stdlib"
+
+    def __init__(self, indent: bool = True):
+        self.indent = indent
+        if indent:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, indent=2, default=_default)
+        else:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+    def dumps(self, obj) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+
+class OrjsonSerializer:
+    name = "orjson"
+
+    def __init__(self, indent: bool = True):
+        self.indent = indent
+        self.option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj, default=_default, option=self.option)
+
+
+def get_serializer(backend: str = "auto", indent: bool = True):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    if backend == "orjson" and orjson is None:
+        raise ValueError("orjson is not installed")
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        return OrjsonSerializer(indent)
+    return StdlibSerializer(indent)
+
+
+_default_serializer = get_serializer()
+
+
+def configure_json_output(backend: str = "auto", indent: bool = True) -> None:
+    global _default_serializer
+    _default_serializer = get_serializer(backend, indent)
+
+
+def default_serializer():
+    return _default_serializer
+
+
+def json_output_settings() -> Tuple[str, bool]:
+    # The backend and indent configure_json_output was last given, resolved,
+    # so the same output can be set up again in another process.
+    return _default_serializer.name, _default_serializer.indent
+
+
+class JsonArrayWriter:
+    # Writes a JSON array one element at a time. With indent the bytes match
+    # json.dump(items, indent=2) of the complete list.
+    def __init__(self, fh: BinaryIO, serializer=None):
+        self.fh = fh
+        self.serializer = serializer or default_serializer()
+        self.count = 0
+        self.bytes_written = 0
+        self._closed = False
+
+    def _write(self, data: bytes) -> None:
+        self.fh.write(data)
+        self.bytes_written += len(data)
+
+    def write(self, item) -> None:
+        encoded = self.serializer.dumps(item)
+        if self.serializer.indent:
+            encoded = b"  " + encoded.replace(b"\n", b"\n  ")
+            self._write((b"[\n" if self.count == 0 else b",\n") + encoded)
+        else:
+            self._write((b"[" if self.count == 0 else b",") + encoded)
+        self.count += 1
+
+    def write_many(self, items: Iterable) -> None:
+        for item in items:
+            self.write(item)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self.count == 0:
+            self._write(b"[]")
+        elif self.serializer.indent:
+            self._write(b"\n]")
+        else:
+            self._write(b"]")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+
+def dump_json_file(path: str, obj, serializer=None) -> int:
+    data = (serializer or default_serializer()).dumps(obj)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def dump_json_array_file(path: str, items: Iterable, serializer=None) -> int:
+    with open(path, "wb") as f:
+        with JsonArrayWriter(f, serializer) as writer:
+            writer.write_many(items)
+    return writer.count
@@ -0,0 +1,125 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+TYPE_PATTERN_SET = re.compile(
+    r"^מדבקות שם(?:\s*-\s*.+)*?\s*-\s*(?P<design>[^-]+?)\s*-\s*(?:סט\s+מדבקות\s*)?(?P<quantity>\d+(?:\+\d+)?)"
+)
+TYPE_PATTERN_BACKGROUND = re.compile(r"ברקע\s+(?P<design>.+?)\s+ללא\s+איורים")
+TYPE_PATTERN_NO_ILLUSTRATIONS = re.compile(r"-\s*(?P<design>[^-]+?)\s+ללא\s+איורים")
+TYPE_PATTERN_FONT = re.compile(r"^מדבקות שם\s*-\s*(?P<design>[^-]+?)\s*-\s*(?P<font>כתב\s+\S+)")
+QUANTITY_PATTERN = re.compile(r"(\d+(?:\+\d+)?)")
+
+NAME_ESCAPE_PATTERN = re.compile(r'\\(?=[\u0590-\u05FF])')
+NAME_PATTERN = re.compile(
+    r"ש(?:ם)?\s+היל(?:ד|דה|ד/ה|ה)?\s+שיודפס\s+על\s+גבי\s+המדבקות[:\-]?\s*([^\n\r]*)",
+    re.IGNORECASE
+)
+
+
+def extract_type_details(line_item: str) -> Optional[str]:
+    if not line_item or not isinstance(line_item, str):
+        return None
+
+    line_item = line_item.strip()
+
+    match1 = TYPE_PATTERN_SET.search(line_item)
+    if match1:
+        design = match1.group("design").strip()
+        quantity = match1.group("quantity").strip()
+        return f"{design}_{quantity}"
+
+    match2 = TYPE_PATTERN_BACKGROUND.search(line_item) or TYPE_PATTERN_NO_ILLUSTRATIONS.search(line_item)
+    if match2:
+        design = match2.group("design").strip()
+        quantity_match = QUANTITY_PATTERN.search(line_item)
+        quantity = quantity_match.group(1) if quantity_match else "unknown"
+        return f"{design}_{quantity}"
+
+    match4 = TYPE_PATTERN_FONT.search(line_item)
+    if match4:
+        design = match4.group("design").strip()
+        font = match4.group("font").strip()
+        return f"{design} {font}"
+    return None
+
+
+def extract_name_details(line_item: str) -> Optional[str]:
+    if not line_item or not isinstance(line_item, str):
+        return None
+
+    cleaned = NAME_ESCAPE_PATTERN.sub('', line_item)
+
+    match = NAME_PATTERN.search(cleaned)
+    if match:
+        name = match.group(1).strip()
+        if name:
+            return name
+
+    return None
+
+
+class LineItemClassifier:
+    # Only a few hundred distinct "Item Name" values exist, so results are
+    # kept per input string in a bounded LRU instead of re-running the regexes.
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._type_cache: OrderedDict = OrderedDict()
+        self._name_cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, cache: OrderedDict, extract, line_item) -> Optional[str]:
+        if not line_item or not isinstance(line_item, str):
+            return None
+
+        with self._lock:
+            if line_item in cache:
+                self.hits += 1
+                cache.move_to_end(line_item)
+                return cache[line_item]
+
+        result = extract(line_item)
+
+        with self._lock:
+            self.misses += 1
+            cache[line_item] = result
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return result
+
+    def type_details(self, line_item: str) -> Optional[str]:
+        return self._lookup(self._type_cache, extract_type_details, line_item)
+
+    def name_details(self, line_item: str) -> Optional[str]:
+        return self._lookup(self._name_cache, extract_name_details, line_item)
+
+    def classify(self, item_name: str, line_comments: str) -> Tuple[Optional[str], Optional[str]]:
+        return self.type_details(item_name), self.name_details(line_comments)
+
+    def classify_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+        for item_name, line_comments in pairs:
+            yield self.classify(item_name, line_comments)
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "type_entries": len(self._type_cache),
+                "name_entries": len(self._name_cache),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._type_cache.clear()
+            self._name_cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+default_classifier = LineItemClassifier()
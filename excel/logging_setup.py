@@ -0,0 +1,90 @@
+import atexit
+import os
+import queue
+import threading
+import logging as lg
+import logging.handlers
+from typing import Optional
+
+LOGGER_NAME = "OrderExport"
+LOG_FILE_NAME = "export_orders.log"
+
+formatter = lg.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+logger = lg.getLogger(LOGGER_NAME)
+logger.setLevel(lg.INFO)
+
+_lock = threading.Lock()
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_file_handler: Optional[lg.FileHandler] = None
+_log_dir: Optional[str] = None
+_pinned = False
+_atexit_registered = False
+
+
+def setup_logging(log_dir: str, level: Optional[int] = None, pinned: bool = False) -> str:
+    # The OrderExport logger only gets one QueueHandler; the FileHandler lives
+    # on a background QueueListener thread. Calling this again with the same
+    # folder is a no-op, and a new folder replaces the file handler in place.
+    # A pinned folder (an explicit --log-dir) stays in place: later unpinned
+    # calls, e.g. from create_output_folder, leave it alone. The logger level
+    # (INFO from import) only changes when a level is passed.
+    global _queue_handler, _listener, _file_handler, _log_dir, _pinned, _atexit_registered
+
+    log_dir = os.path.abspath(log_dir)
+    with _lock:
+        if level is not None:
+            logger.setLevel(level)
+        if _listener is not None and (_log_dir == log_dir or (_pinned and not pinned)):
+            _pinned = _pinned or pinned
+            return os.path.join(_log_dir, LOG_FILE_NAME)
+
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, LOG_FILE_NAME)
+        file_handler = lg.FileHandler(log_path, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+
+        if _listener is not None:
+            # stop() drains records already queued into the old file first.
+            _listener.stop()
+            _file_handler.close()
+
+        if _queue_handler is None or _queue_handler not in logger.handlers:
+            _queue_handler = logging.handlers.QueueHandler(_queue)
+            logger.addHandler(_queue_handler)
+
+        _listener = logging.handlers.QueueListener(_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        _file_handler = file_handler
+        _log_dir = log_dir
+        _pinned = pinned
+
+        if not _atexit_registered:
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
+
+    logger.info(f"Logging to {log_path}")
+    return log_path
+
+
+def shutdown_logging() -> None:
+    global _queue_handler, _listener, _file_handler, _log_dir, _pinned
+
+    with _lock:
+        if _queue_handler is not None:
+            logger.removeHandler(_queue_handler)
+            _queue_handler = None
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        if _file_handler is not None:
+            _file_handler.close()
+            _file_handler = None
+        _log_dir = None
+        _pinned = False
+
+
+def log_directory() -> Optional[str]:
+    return _log_dir
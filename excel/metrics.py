@@ -0,0 +1,227 @@
+import functools
+import json
+import os
+import time
+import logging as lg
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from excel.progress import ConversionCancelled
+
+logger = lg.getLogger("OrderExport")
+
+_enabled = os.environ.get("ORDER_EXPORT_METRICS", "").lower() in ("1", "true", "yes")
+_current: ContextVar = ContextVar("order_export_metrics", default=None)
+_listeners: List[Callable[[Dict], None]] = []
+_last_record: Optional[Dict] = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullMetrics:
+    # Stand-in used when metrics are disabled or no run is active: every call
+    # is a no-op and span() hands back one shared context manager.
+    enabled = False
+
+    def span(self, stage: str):
+        return _NULL_SPAN
+
+    def count(self, name: str, amount: int = 1) -> None:
+        pass
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        pass
+
+    def timed(self, stage: str, func: Callable) -> Callable:
+        return func
+
+    def timed_iter(self, stage: str, iterable: Iterable) -> Iterable:
+        return iterable
+
+
+NULL_METRICS = NullMetrics()
+
+
+class RunMetrics:
+    # Wall time per stage and named counters for one pipeline run. Stages may
+    # nest, so their times can add up to more than the total.
+    enabled = True
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.status = "ok"
+
+    @contextmanager
+    def span(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timed(self, stage: str, func: Callable) -> Callable:
+        # For per-row helpers: wraps func only while metrics are collected, so
+        # the disabled path keeps calling the original function directly.
+        perf_counter = time.perf_counter
+        add_time = self.add_time
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add_time(stage, perf_counter() - start)
+
+        return wrapper
+
+    def timed_iter(self, stage: str, iterable: Iterable) -> Iterator:
+        # Charges the time spent producing each item to stage.
+        perf_counter = time.perf_counter
+        iterator = iter(iterable)
+        total = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    total += perf_counter() - start
+                    return
+                total += perf_counter() - start
+                yield item
+        finally:
+            self.add_time(stage, total)
+
+    def finish(self, status: str = "ok") -> None:
+        self.seconds = time.perf_counter() - self.started
+        self.status = status
+
+    def record(self) -> Dict:
+        seconds = self.seconds if self.seconds is not None else time.perf_counter() - self.started
+        rows = self.counters.get("rows", 0)
+        return {
+            "run": self.name,
+            "status": self.status,
+            "seconds": round(seconds, 4),
+            "rows": rows,
+            "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+            "bytes_written": self.counters.get("bytes_written", 0),
+            "stages": {stage: round(value, 4) for stage, value in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+
+def enable_metrics(enabled: bool = True) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+def current_metrics():
+    run = _current.get()
+    return run if run is not None else NULL_METRICS
+
+
+def add_metrics_listener(listener: Callable[[Dict], None]) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_metrics_listener(listener: Callable[[Dict], None]) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def last_metrics() -> Optional[Dict]:
+    return _last_record
+
+
+def _emit(record: Dict) -> None:
+    global _last_record
+    _last_record = record
+    logger.info(f"Run metrics: {json.dumps(record, ensure_ascii=False)}", extra={"metrics": record})
+    for listener in list(_listeners):
+        try:
+            listener(record)
+        except Exception:
+            logger.exception("Metrics listener failed.")
+
+
+@contextmanager
+def pipeline_run(name: str):
+    # Opens a metrics run unless one is already active in this context, in
+    # which case nested pipeline calls add to the outer run.
+    if not _enabled:
+        yield NULL_METRICS
+        return
+
+    parent = _current.get()
+    if parent is not None:
+        yield parent
+        return
+
+    run = RunMetrics(name)
+    token = _current.set(run)
+    status = "ok"
+    try:
+        yield run
+    except ConversionCancelled:
+        status = "cancelled"
+        raise
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _current.reset(token)
+        run.finish(status)
+        _emit(run.record())
+
+
+def instrumented(name: str):
+    # Decorator form of pipeline_run for the public pipeline entry points.
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with pipeline_run(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def format_summary(record: Optional[Dict]) -> str:
+    if not record:
+        return ""
+    lines = [f"{record['rows']:,} rows in {record['seconds']:.2f}s"]
+    if record["rows_per_sec"]:
+        lines[0] += f" ({record['rows_per_sec']:,.0f} rows/s)"
+    if record["bytes_written"]:
+        lines[0] += f", {record['bytes_written'] / 1024:,.1f} KB written"
+    lines.extend(f"{stage}: {seconds:.3f}s" for stage, seconds in record["stages"].items())
+    return "\n".join(lines)
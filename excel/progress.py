@@ -0,0 +1,73 @@
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+
+class ConversionCancelled(Exception):
+    pass
+
+
+class ProgressTracker:
+    # Counts processed rows, reports them every `every` rows and raises
+    # ConversionCancelled at the same points once cancel() was requested.
+    def __init__(self,
+                 callback: Optional[Callable[[int, int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 every: int = 250):
+        self.callback = callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.every = every
+        self.rows = 0
+        self.total = 0
+        self._next_report = every
+
+    def set_total(self, total: int) -> None:
+        self.total = total
+        self._report()
+
+    def restart(self, total: int) -> None:
+        # Starts counting a new pass over the same rows (e.g. parse, then convert).
+        self.rows = 0
+        self._next_report = self.every
+        self.check_cancelled()
+        self.set_total(total)
+
+    def tick(self, count: int = 1) -> None:
+        self.rows += count
+        if self.rows >= self._next_report:
+            self._next_report = self.rows + self.every
+            self.check_cancelled()
+            self._report()
+
+    def finish(self) -> None:
+        # A total of 0 means the row count was unknown while reading.
+        if self.total < self.rows:
+            self.total = self.rows
+        self._report()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        if self.cancel_event.is_set():
+            raise ConversionCancelled()
+
+    def _report(self) -> None:
+        if self.callback is not None:
+            self.callback(self.rows, self.total)
+
+
+def track(rows: Iterable, progress: Optional[ProgressTracker]) -> Iterable:
+    if progress is None:
+        return rows
+    return _tracked(rows, progress)
+
+
+def _tracked(rows: Iterable, progress: ProgressTracker) -> Iterator:
+    for row in rows:
+        yield row
+        progress.tick()
+    progress.finish()
@@ -0,0 +1,80 @@
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Sequence, Union
+
+
+class RecordHeader:
+    # Field names shared by every record read from the same sheet.
+    __slots__ = ("fields", "positions")
+
+    def __init__(self, fields: Iterable):
+        self.fields = tuple(fields)
+        self.positions = {field: i for i, field in enumerate(self.fields)}
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RecordHeader) and self.fields == other.fields
+
+    def __hash__(self) -> int:
+        return hash(self.fields)
+
+    def __repr__(self) -> str:
+        return f"RecordHeader({list(self.fields)!r})"
+
+
+class Record(Mapping):
+    # A read-only row: a values tuple plus a reference to the shared header,
+    # instead of a dict per row. Behaves like a Mapping for lookups.
+    __slots__ = ("header", "values")
+
+    def __init__(self, header: RecordHeader, values: Sequence):
+        self.header = header
+        self.values = tuple(values)
+
+    def __getitem__(self, key):
+        return self.values[self.header.positions[key]]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.header.positions)
+
+    def __len__(self) -> int:
+        return len(self.header.positions)
+
+    def __contains__(self, key) -> bool:
+        return key in self.header.positions
+
+    def get(self, key, default=None):
+        position = self.header.positions.get(key)
+        return default if position is None else self.values[position]
+
+    def replace(self, changes: Dict) -> "Record":
+        values = list(self.values)
+        for key, value in changes.items():
+            values[self.header.positions[key]] = value
+        return Record(self.header, values)
+
+    def to_dict(self) -> Dict:
+        return dict(zip(self.header.fields, self.values))
+
+    def __repr__(self) -> str:
+        return f"Record({self.to_dict()!r})"
+
+
+def records_from_rows(headers: Iterable, rows: Iterable[Sequence]) -> Iterator[Record]:
+    header = headers if isinstance(headers, RecordHeader) else RecordHeader(headers)
+    for row in rows:
+        yield Record(header, row)
+
+
+def to_dict(item: Union[Record, Mapping]) -> Dict:
+    if isinstance(item, Record):
+        return item.to_dict()
+    return item if isinstance(item, dict) else dict(item)
+
+
+def to_dicts(items: Iterable[Union[Record, Mapping]]) -> List[Dict]:
+    return [to_dict(item) for item in items]
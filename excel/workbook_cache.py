@@ -0,0 +1,141 @@
+import os
+import threading
+import logging as lg
+from collections import OrderedDict, namedtuple
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from openpyxl import load_workbook
+
+from excel.progress import ProgressTracker, track
+
+logger = lg.getLogger("OrderExport")
+
+ParsedSheet = namedtuple("ParsedSheet", ["headers", "rows"])
+
+DEFAULT_MAX_CELLS = 3_000_000
+
+
+def iter_sheet_rows(ws) -> Iterator[tuple]:
+    # Read-only sheets trust the stored <dimension> record, which many exports
+    # get wrong; a stale one silently cuts rows off. Dropping it makes openpyxl
+    # read every row present, so rows may be shorter than the header and the
+    # row count is unknown until the end.
+    ws.reset_dimensions()
+    return _without_trailing_blank_rows(ws.iter_rows(values_only=True))
+
+
+def _without_trailing_blank_rows(rows: Iterable[tuple]) -> Iterator[tuple]:
+    # Without the dimension record openpyxl also yields the cell-less <row>
+    # elements Excel writes for empty rows that only carry a height or format.
+    # Blank rows are held back until a row with values follows, so blank rows
+    # in the middle are kept, as a full load would return them, and trailing
+    # ones are dropped.
+    blank = []
+    for row in rows:
+        if all(value is None for value in row):
+            blank.append(row)
+            continue
+        if blank:
+            yield from blank
+            blank = []
+        yield row
+
+
+def parse_sheet(file_path: str, progress: Optional[ProgressTracker] = None) -> ParsedSheet:
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        ws = wb.active
+        rows = iter_sheet_rows(ws)
+        headers = tuple(next(rows, ()))
+        width = len(headers)
+        if progress is not None:
+            progress.set_total(0)
+
+        data = []
+        for row in track(rows, progress):
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            data.append(row[:width])
+    finally:
+        wb.close()
+
+    return ParsedSheet(headers, data)
+
+
+class WorkbookCache:
+    # Parsed active sheets keyed by (path, mtime, size). A file that changes on
+    # disk gets a new key; least recently used sheets are dropped once the
+    # total number of cached cells passes max_cells.
+    def __init__(self, max_cells: int = DEFAULT_MAX_CELLS):
+        self.max_cells = max_cells
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._cells = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(file_path: str) -> Tuple[str, int, int]:
+        stat = os.stat(file_path)
+        return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def cell_count(sheet: ParsedSheet) -> int:
+        return max(len(sheet.headers), 1) * (len(sheet.rows) + 1)
+
+    def get(self, file_path: str, progress: Optional[ProgressTracker] = None) -> ParsedSheet:
+        key = self.key_for(file_path)
+        with self._lock:
+            sheet = self._entries.get(key)
+            if sheet is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        if sheet is not None:
+            if progress is not None:
+                progress.set_total(len(sheet.rows))
+            logger.info(f"Using cached workbook: {file_path}")
+            return sheet
+
+        sheet = parse_sheet(file_path, progress)
+        with self._lock:
+            self.misses += 1
+            self._discard_path(key[0])
+            cells = self.cell_count(sheet)
+            if cells <= self.max_cells:
+                self._entries[key] = sheet
+                self._cells += cells
+                while self._cells > self.max_cells:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._cells -= self.cell_count(evicted)
+        return sheet
+
+    def _discard_path(self, abs_path: str) -> None:
+        for key in [k for k in self._entries if k[0] == abs_path]:
+            self._cells -= self.cell_count(self._entries.pop(key))
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._cells = 0
+            else:
+                self._discard_path(os.path.abspath(file_path))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "cells": self._cells,
+                "max_cells": self.max_cells,
+            }
+
+
+default_workbook_cache = WorkbookCache()
+
+
+def read_sheet(file_path: str,
+               progress: Optional[ProgressTracker] = None,
+               cache: Optional[WorkbookCache] = None) -> ParsedSheet:
+    return (cache or default_workbook_cache).get(file_path, progress)
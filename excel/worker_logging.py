@@ -0,0 +1,31 @@
+import logging as lg
+import logging.handlers
+import multiprocessing
+from contextlib import contextmanager
+
+
+class _ForwardToLogger(lg.Handler):
+    def emit(self, record: lg.LogRecord) -> None:
+        lg.getLogger(record.name).handle(record)
+
+
+def init_worker_logging(log_queue) -> None:
+    # Workers never touch the log file directly; records travel back to the
+    # parent through the queue and are written by its handlers.
+    worker_logger = lg.getLogger("OrderExport")
+    for handler in list(worker_logger.handlers):
+        worker_logger.removeHandler(handler)
+    worker_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    worker_logger.propagate = False
+
+
+@contextmanager
+def worker_log_queue(ctx=None):
+    ctx = ctx or multiprocessing.get_context()
+    log_queue = ctx.Queue()
+    listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger())
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
@@ -1,5 +1,12 @@
-import app
+import sys
 
-app.setStyleSheet("""
-@import url("https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css");
-""")
\ No newline at end of file
+
+if __name__ == '__main__':
+    # With arguments this runs the headless CLI (see `python main.py --help`);
+    # without any it starts the desktop app.
+    if len(sys.argv) > 1:
+        from excel.cli import main
+        sys.exit(main())
+
+    from Desktop.main_app import run
+    sys.exit(run())